@@ -0,0 +1,135 @@
+import csv
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Union
+
+from algo.coloring.greedy import greedy_coloring
+from algo.registry import ORDERINGS
+from algo.serialization.csr import read_csr_graph, write_csr_graph
+from algo.serialization.files import graph_format, read_graph
+from algo.structures.graph import degeneracy
+
+BATCH_RESULT_FIELDS = ["graph_file", "ordering", "vertices", "edges", "degeneracy", "colors_used", "ordering_time",
+                       "coloring_time", "terminal_clique_size"]
+
+# The graphs a worker process has memory-mapped, by CSR path, so every graph is opened once per worker
+_worker_graphs = {}
+
+
+def expand_graph_files(patterns: Iterable[str]) -> List[str]:
+    """
+    Expands glob patterns into graph file paths, keeping the order of the patterns and dropping duplicates. Patterns
+    without wildcards are taken as plain paths.
+
+    Raises:
+        FileNotFoundError: If a pattern matches no file.
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches or not all(os.path.isfile(match) for match in matches):
+            raise FileNotFoundError(f"File not found: {pattern}")
+        files.extend(match for match in matches if match not in files)
+    return files
+
+
+def run_batch(graph_files: List[str], orderings: List[str],
+              workers: int = 1) -> List[Dict[str, Union[str, int, float, None]]]:
+    """
+    Colors every graph file with every ordering.
+
+    Every graph is parsed once, in this process, and written to a temporary CSR file unless it already is one. The
+    (graph, ordering) jobs are then fanned out over a pool of `workers` processes, which memory-map the CSR files
+    instead of parsing them again, so they share the graphs through the page cache.
+
+    Args:
+        graph_files (List[str]): The paths of the graph files, in any format `read_graph` accepts.
+        orderings (List[str]): The names of the orderings to run, keys of ORDERINGS.
+        workers (int): The number of worker processes.
+
+    Returns:
+        List[Dict[str, Union[str, int, float, None]]]: One result per job, graph by graph in the given order, holding
+        the fields of BATCH_RESULT_FIELDS.
+
+    Raises:
+        ValueError: If an ordering is unknown.
+    """
+    assert workers >= 1, "At least one worker is required"
+    for ordering in orderings:
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Invalid ordering method: {ordering}")
+
+    with tempfile.TemporaryDirectory() as csr_dir:
+        jobs = []
+        for idx, graph_file in enumerate(graph_files):
+            csr_path, stats = _prepare_graph(graph_file, os.path.join(csr_dir, f"{idx}.csr"))
+            jobs.extend((graph_file, csr_path, stats, ordering) for ordering in orderings)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_job, jobs))
+
+
+def _prepare_graph(graph_file: str, csr_path: str) -> Tuple[str, Dict[str, int]]:
+    """
+    Parses a graph file once, writes it to `csr_path` unless it is a CSR file already, and computes the statistics
+    shared by all of its jobs.
+    """
+    if graph_format(graph_file) == ".csr":
+        csr_path = graph_file
+        graph = read_csr_graph(graph_file)
+    else:
+        graph = read_graph(graph_file)
+        write_csr_graph(graph, csr_path)
+
+    stats = {"vertices": graph.V, "edges": len(graph.edges()), "degeneracy": degeneracy(graph)}
+    if hasattr(graph, "close"):
+        graph.close()
+    return csr_path, stats
+
+
+def _run_job(job: Tuple[str, str, Dict[str, int], str]) -> Dict[str, Union[str, int, float, None]]:
+    graph_file, csr_path, stats, ordering = job
+    graph = _worker_graphs.get(csr_path)
+    if graph is None:
+        graph = _worker_graphs[csr_path] = read_csr_graph(csr_path)
+
+    start_time = time.perf_counter()
+    order, meta = ORDERINGS[ordering](graph)
+    ordering_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    coloring = greedy_coloring(graph, order)
+    coloring_time = time.perf_counter() - start_time
+
+    return {
+        "graph_file": graph_file,
+        "ordering": ordering,
+        **stats,
+        "colors_used": len(set(coloring.values())),
+        "ordering_time": meta.get("ordering_time", ordering_time),
+        "coloring_time": coloring_time,
+        "terminal_clique_size": meta.get("terminal_clique_size"),
+    }
+
+
+def write_batch_results(results: List[Dict[str, Union[str, int, float, None]]], filename: str) -> None:
+    """
+    Writes batch results to a JSON file if the filename ends in `.json`, and to a CSV file otherwise.
+
+    Args:
+        results (List[Dict[str, Union[str, int, float, None]]]): The results of `run_batch`.
+        filename (str): The path to the file to which the results will be written.
+    """
+    if os.path.splitext(filename)[1].lower() == ".json":
+        with open(filename, "w") as file:
+            json.dump(results, file, indent=2)
+        return
+
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=BATCH_RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
@@ -0,0 +1,420 @@
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from algo.registry import GENERATORS, ORDERINGS
+
+# The graph sizes, in vertices, every case runs at unless told otherwise
+DEFAULT_SIZES = [50, 100, 200, 400]
+
+# The fraction of all possible edges the benchmark graphs have, a quarter as in the first analysis scripts
+DEFAULT_DENSITY = 0.25
+
+DEFAULT_REPEATS = 5
+DEFAULT_WARMUP = 1
+
+# The shortest a timed sample may be. Faster cases are called several times per sample to reach it
+DEFAULT_MIN_SAMPLE_TIME = 0.02
+DEFAULT_SEED = 42
+
+# How far a scaling exponent may rise, and by what fraction a relative time may grow, before it counts as a regression
+DEFAULT_EXPONENT_TOLERANCE = 0.25
+DEFAULT_TIME_TOLERANCE = 0.5
+
+# A time must also grow by this many seconds to count as a regression, so timer noise on tiny cases never does
+DEFAULT_TIME_NOISE_FLOOR = 0.001
+
+# The settings a baseline must share with the results for their times to be comparable
+BASELINE_SETTINGS = ["sizes", "density", "seed"]
+
+# The graph representations greedy coloring runs on
+COLORING_ENGINES = ["graph", "csr", "varint"]
+
+# Maps the name of every benchmarked file format to the extension that selects it
+LOADER_FORMATS = {
+    "adjacency": ".txt",
+    "csr": ".csr",
+    "dimacs": ".col",
+    "edge_list": ".edges",
+    "metis": ".graph",
+    "varint": ".vgr",
+}
+
+SUITES = ["ordering", "generator", "coloring", "loader"]
+
+# A prepared case: the size of its input and the call that is timed
+Run = Tuple[int, int, Callable[[], object]]
+
+
+def edge_count(num_vertices: int, density: float = DEFAULT_DENSITY) -> int:
+    """
+    Returns the number of edges a benchmark graph with `num_vertices` vertices has at the given density.
+    """
+    return int(num_vertices * (num_vertices - 1) / 2 * density)
+
+
+def benchmark_cases(suites: Sequence[str] = SUITES) -> List[Tuple[str, str]]:
+    """
+    Returns the (suite, name) pair of every case in the given suites: every ordering, generator, coloring engine and
+    file format.
+
+    Raises:
+        ValueError: If a suite is unknown.
+    """
+    names = {
+        "ordering": list(ORDERINGS),
+        "generator": list(GENERATORS),
+        "coloring": COLORING_ENGINES,
+        "loader": list(LOADER_FORMATS),
+    }
+    cases = []
+    for suite in suites:
+        if suite not in names:
+            raise ValueError(f"Invalid benchmark suite: {suite}")
+        cases.extend((suite, name) for name in names[suite])
+    return cases
+
+
+def random_graph(num_vertices: int, num_conflicts: int, seed: int):
+    """
+    Returns the uniform random graph the ordering, coloring and loader cases run on, the same one for a given seed.
+    """
+    random.seed(seed)
+    return GENERATORS["uniform_random"](num_vertices, num_conflicts)
+
+
+def prepare_run(suite: str, name: str, num_vertices: int, num_conflicts: int, seed: int, directory: str) -> Run:
+    """
+    Builds the input of a case outside of the timed call, so only the work the case names is measured.
+
+    Args:
+        suite (str): The suite of the case.
+        name (str): The name of the case within its suite.
+        num_vertices (int): The number of vertices of the input graph.
+        num_conflicts (int): The number of edges of the input graph.
+        seed (int): The seed of the random graphs.
+        directory (str): A directory the loader cases may write their graph files to.
+
+    Returns:
+        Run: The vertices and edges of the input and a function running the case once.
+    """
+    if suite == "generator":
+        return _prepare_generator(name, num_vertices, num_conflicts, seed)
+
+    graph = random_graph(num_vertices, num_conflicts, seed)
+    num_edges = len(graph.edges())
+
+    if suite == "ordering":
+        ordering = ORDERINGS[name]
+        return num_vertices, num_edges, lambda: ordering(graph)
+
+    if suite == "coloring":
+        from algo.coloring.greedy import greedy_coloring
+        from algo.structures.csr import CSRGraph
+        from algo.structures.varint import VarintGraph
+
+        order, _ = ORDERINGS["smallest_last"](graph)
+        if name == "csr":
+            graph = CSRGraph.from_graph(graph)
+        elif name == "varint":
+            graph = VarintGraph.from_graph(graph)
+        return num_vertices, num_edges, lambda: greedy_coloring(graph, order)
+
+    from algo.serialization.files import read_graph, write_graph
+
+    filename = os.path.join(directory, f"{name}_{num_vertices}{LOADER_FORMATS[name]}")
+    write_graph(graph, filename)
+
+    # CSR and varint files are memory-mapped and only read when touched, so every format is timed reading the file
+    # and walking every adjacency list
+    def load():
+        loaded = read_graph(filename)
+        for vertex in range(loaded.V):
+            for _ in loaded.neighbors(vertex):
+                pass
+
+    return num_vertices, num_edges, load
+
+
+def _prepare_generator(name: str, num_vertices: int, num_conflicts: int, seed: int) -> Run:
+    method = GENERATORS[name]
+    if name in ["complete", "cyclic"]:
+        def generate():
+            return method(num_vertices)
+    elif name == "random_geometric":
+        from algo.generation.random_geometric import radius_for_expected_edges
+
+        radius = radius_for_expected_edges(num_vertices, num_conflicts)
+
+        def generate():
+            random.seed(seed)
+            return method(num_vertices, radius)
+    else:
+        def generate():
+            random.seed(seed)
+            return method(num_vertices, num_conflicts)
+
+    # Complete and cyclic graphs have their own edge counts, so the size is taken from a generated graph
+    return num_vertices, len(generate().edges()), generate
+
+
+def measure(function: Callable[[], object], repeats: int = DEFAULT_REPEATS, warmup: int = DEFAULT_WARMUP,
+            min_sample_time: float = DEFAULT_MIN_SAMPLE_TIME) -> List[float]:
+    """
+    Calls a function `warmup` times untimed and then takes `repeats` timed samples of it.
+
+    A sample times a batch of calls, doubling the batch until a sample lasts `min_sample_time` seconds, so the times
+    of fast functions rise above the timer and scheduling noise. The sample that reaches it is kept as the first one.
+
+    Returns:
+        List[float]: The time of a single call in every sample, in seconds.
+    """
+    for _ in range(warmup):
+        function()
+    number, elapsed = _calibrate(function, min_sample_time)
+    times = [elapsed / number]
+    while len(times) < repeats:
+        times.append(_time_calls(function, number) / number)
+    return times
+
+
+def measure_relative(function: Callable[[], object], reference: Callable[[], object], repeats: int = DEFAULT_REPEATS,
+                     warmup: int = DEFAULT_WARMUP,
+                     min_sample_time: float = DEFAULT_MIN_SAMPLE_TIME) -> Tuple[List[float], List[float]]:
+    """
+    Measures a function like `measure`, taking a sample of a fixed reference workload right before every sample of
+    the function. The speed of a shared machine drifts from second to second, and both samples of a pair see about
+    the same speed, so the ratio of the two is steadier than either time.
+
+    Returns:
+        Tuple[List[float], List[float]]: The time of a single call of the function and of the reference in every
+        sample, in seconds.
+    """
+    for _ in range(warmup):
+        function()
+    reference_number, elapsed = _calibrate(reference, min_sample_time)
+    reference_times = [elapsed / reference_number]
+    number, elapsed = _calibrate(function, min_sample_time)
+    times = [elapsed / number]
+    while len(times) < repeats:
+        reference_times.append(_time_calls(reference, reference_number) / reference_number)
+        times.append(_time_calls(function, number) / number)
+    return times, reference_times
+
+
+def reference_workload() -> int:
+    """
+    A fixed pure-Python workload of dictionary, sorting and arithmetic operations, the kind the graph code is made
+    of, that times the speed of the machine independently of this package.
+    """
+    table = {}
+    for i in range(2000):
+        table[i] = (i * 7919) % 2003
+    return sum(sorted(table.values())[::3])
+
+
+def _calibrate(function: Callable[[], object], min_sample_time: float) -> Tuple[int, float]:
+    number = 1
+    elapsed = _time_calls(function, number)
+    while elapsed < min_sample_time:
+        number *= 2
+        elapsed = _time_calls(function, number)
+    return number, elapsed
+
+
+def _time_calls(function: Callable[[], object], number: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start_time
+
+
+def fit_scaling_exponent(sizes: Sequence[float], times: Sequence[float]) -> Tuple[float, float]:
+    """
+    Fits `time = coefficient * size ** exponent` to measurements by least squares on their logarithms. An exponent of
+    1 means the time grows linearly with the size, 2 quadratically.
+
+    Args:
+        sizes (Sequence[float]): The input sizes.
+        times (Sequence[float]): The time measured at each size, in seconds.
+
+    Returns:
+        Tuple[float, float]: The exponent and the coefficient.
+
+    Raises:
+        ValueError: If there are fewer than two distinct sizes.
+    """
+    if len(set(sizes)) < 2:
+        raise ValueError("At least two distinct sizes are needed to fit a scaling exponent.")
+    # Times below the clock resolution would have no logarithm
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in times]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+
+def run_benchmarks(cases: Sequence[Tuple[str, str]], sizes: Sequence[int] = DEFAULT_SIZES,
+                   density: float = DEFAULT_DENSITY, repeats: int = DEFAULT_REPEATS, warmup: int = DEFAULT_WARMUP,
+                   seed: int = DEFAULT_SEED, min_sample_time: float = DEFAULT_MIN_SAMPLE_TIME,
+                   progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, Union[str, int, float, Dict]]:
+    """
+    Runs every case at every size, each sample paired with one of the `reference_workload`, and fits the scaling
+    exponent of every case to its relative times: the median over the pairs of the time of the case over the time of
+    the reference. Dividing by the reference cancels the drift of the speed of the machine during and between runs,
+    and the median leaves out the odd pair disturbed by other work.
+
+    The exponent is fitted against the number of vertices plus edges of the input, the size graph algorithms scale
+    with, so it is comparable across densities and across generators that ignore the requested edge count.
+
+    Args:
+        cases (Sequence[Tuple[str, str]]): The (suite, name) pairs to run, as returned by `benchmark_cases`.
+        sizes (Sequence[int]): The numbers of vertices to run every case at.
+        density (float): The fraction of all possible edges the input graphs have.
+        repeats (int): The number of timed runs at every size, whose median and minimum are kept.
+        warmup (int): The number of untimed runs before the timed ones.
+        seed (int): The seed of the random graphs.
+        min_sample_time (float): The shortest a timed sample may be, see `measure`.
+        progress (Optional[Callable[[str, int], None]]): Called with the case and the size before each measurement.
+
+    Returns:
+        Dict[str, Union[str, int, float, Dict]]: The settings of the run and, under "cases", the vertices, edges,
+        median and minimum times, minimum reference times, relative times and fitted exponent of every case, keyed by
+        "suite.name".
+
+    Raises:
+        ValueError: If the settings are invalid.
+    """
+    if len(set(sizes)) < 2 or min(sizes) < 2:
+        raise ValueError("At least two distinct sizes of two or more vertices are needed.")
+    if not 0 < density <= 1:
+        raise ValueError("Density must be in (0, 1].")
+    if repeats <= 0 or warmup < 0:
+        raise ValueError("Repeat count must be positive and warmup count non-negative.")
+
+    sizes = sorted(set(sizes))
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for suite, name in cases:
+            key = f"{suite}.{name}"
+            record = {"vertices": [], "edges": [], "median_times": [], "min_times": [], "reference_times": [],
+                      "relative_times": []}
+            for num_vertices in sizes:
+                if progress is not None:
+                    progress(key, num_vertices)
+                vertices, edges, function = prepare_run(suite, name, num_vertices, edge_count(num_vertices, density),
+                                                        seed, directory)
+                times, reference_times = measure_relative(function, reference_workload, repeats, warmup,
+                                                          min_sample_time)
+                record["vertices"].append(vertices)
+                record["edges"].append(edges)
+                record["median_times"].append(statistics.median(times))
+                record["min_times"].append(min(times))
+                record["reference_times"].append(min(reference_times))
+                record["relative_times"].append(statistics.median(
+                    elapsed / reference_time for elapsed, reference_time in zip(times, reference_times)))
+            record["exponent"], _ = fit_scaling_exponent(
+                [v + e for v, e in zip(record["vertices"], record["edges"])], record["relative_times"])
+            results[key] = record
+
+    return {
+        "python": platform.python_version(),
+        "sizes": sizes,
+        "density": density,
+        "repeats": repeats,
+        "warmup": warmup,
+        "min_sample_time": min_sample_time,
+        "seed": seed,
+        "cases": results,
+    }
+
+
+def check_baseline_settings(settings: Dict, baseline: Dict) -> None:
+    """
+    Checks that a baseline was run with the sizes, density and seed of `settings`, the arguments or the results of a
+    run, so that the same case is timed on the same graphs.
+
+    Raises:
+        ValueError: If a setting differs.
+    """
+    for setting in BASELINE_SETTINGS:
+        if settings[setting] != baseline.get(setting):
+            raise ValueError(f"The baseline was run with {setting} {baseline.get(setting)}, not {settings[setting]}.")
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+                        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+                        noise_floor: float = DEFAULT_TIME_NOISE_FLOOR) -> Dict[str, List[str]]:
+    """
+    Compares benchmark results with a stored baseline run with the same sizes, density and seed. Only the cases
+    present in both are compared, so a baseline keeps gating the cases it has while new ones are added.
+
+    Times are compared relative to the reference workload timed next to them, see `run_benchmarks`, so a machine
+    that runs slower or faster than when the baseline was taken does not shift them.
+
+    Args:
+        results (Dict): The results of `run_benchmarks`.
+        baseline (Dict): Earlier results of `run_benchmarks`.
+        exponent_tolerance (float): How far a scaling exponent may rise above the baseline.
+        time_tolerance (float): The fraction by which a relative time may exceed the baseline, 0.5 allowing 50% more.
+        noise_floor (float): How many seconds, at the current speed of the machine, a time must also grow by to count
+            as a regression.
+
+    Returns:
+        Dict[str, List[str]]: A description of every regression of every case that regressed, empty when none did.
+
+    Raises:
+        ValueError: If the baseline was run with other sizes, density or seed.
+    """
+    check_baseline_settings(results, baseline)
+    regressions = {}
+    for key, record in results["cases"].items():
+        expected = baseline.get("cases", {}).get(key)
+        if expected is None:
+            continue
+        found = []
+        if record["exponent"] > expected["exponent"] + exponent_tolerance:
+            found.append(f"scaling exponent {record['exponent']:.2f} exceeds the baseline "
+                         f"{expected['exponent']:.2f} by more than {exponent_tolerance}")
+        for num_vertices, relative_time, reference_time, baseline_time in zip(
+                record["vertices"], record["relative_times"], record["reference_times"], expected["relative_times"]):
+            if relative_time > baseline_time * (1 + time_tolerance) and \
+                    (relative_time - baseline_time) * reference_time > noise_floor:
+                found.append(f"relative time {relative_time:.3f} at {num_vertices} vertices exceeds the baseline "
+                             f"{baseline_time:.3f} by more than {time_tolerance:.0%}")
+        if found:
+            regressions[key] = found
+    return regressions
+
+
+def write_benchmark_results(results: Dict, filename: str) -> None:
+    """
+    Writes benchmark results to a JSON file, which later runs can use as their baseline.
+
+    Args:
+        results (Dict): The results of `run_benchmarks`.
+        filename (str): The path to the file to which the results will be written.
+    """
+    with open(filename, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def read_benchmark_results(filename: str) -> Dict:
+    """
+    Reads benchmark results written by `write_benchmark_results`.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"File not found: {filename}")
+    with open(filename) as file:
+        return json.load(file)
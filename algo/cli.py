@@ -1,27 +1,17 @@
 from argparse import ArgumentParser
 import datetime
 import time
+from typing import TYPE_CHECKING, Union
 
-from algo.structures.graph import Graph, terminal_clique_size
-from algo.generation.complete import generate_complete_graph
-from algo.generation.cyclic import generate_cyclic_graph
-from algo.generation.power_law import generate_power_law_graph
-from algo.generation.skewed_random import generate_skewed_graph
-from algo.generation.uniform_random import generate_uniform_random_graph
-
-from algo.ordering.incidence import incidence_ordering
-from algo.ordering.connected_sequential_ordering import connected_sequential_ordering
-from algo.ordering.largest_last import largest_last_vertex_ordering
-from algo.ordering.largest_original_degree_last import largest_original_degree_last_vertex_ordering
-from algo.ordering.smallest_last import smallest_last_vertex_ordering
-from algo.ordering.smallest_original_degree_last import smallest_original_degree_last_vertex_ordering
-
-from algo.coloring.greedy import greedy_coloring
-
-from algo.serialization.graph import write_graph_to_file, read_graph_from_file
+from algo.registry import GENERATORS, ORDERINGS, STREAMING_GENERATORS
 
 import os
 
+# Everything else is imported by the command that uses it, so a short invocation only pays for the modules it needs
+if TYPE_CHECKING:
+    from algo.structures.csr import CSRGraph
+    from algo.structures.graph import Graph
+
 SEPERATOR_LENGTH = 43
 
 def is_valid_filename(filename):
@@ -56,19 +46,13 @@ def is_valid_filename(filename):
 def complete_edge_count(V: int):
     return int(V * (V - 1) / 2)
 
-def cli_p1():
+
+def add_generation_arguments(parser: ArgumentParser) -> None:
     """
-    Part 1 of the CLI, generates a graph and outputs it to a file.
-    Using the selected output file, number of edges, number of vertices,
-    and graph generation method, a graph is generated and output to the
-    selected file.
+    Adds the arguments that select and parametrize a graph generator, shared by cli_p1 and the pipeline.
     """
-    parser = ArgumentParser()
-    parser.add_argument("-o",
-                        "--output_file",
-                        help="Output File name",
-                        type=str,
-                        required=True)
+    from algo.generation.streaming import DEFAULT_CHUNK_SIZE
+
     parser.add_argument("-v",
                         "--vertices",
                         help="How many vertices to add to the graph.",
@@ -83,60 +67,274 @@ def cli_p1():
                         "--generator",
                         help="Graph generation method.",
                         type=str,
-                        choices=['complete', 'power_law', 'uniform_random', 'skewed_random', 'cyclic'],
+                        choices=list(GENERATORS),
                         required=True)
+    parser.add_argument("-r",
+                        "--radius",
+                        help="Connection radius for the random_geometric generator. Defaults to the radius expected "
+                             "to give the requested number of edges.",
+                        type=float,
+                        default=None)
+    parser.add_argument("--chunk-size",
+                        help="Approximate number of half-edges held in memory per partition of partitioned "
+                             "generation.",
+                        type=int,
+                        default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed",
+                        help="Master seed for partitioned generation. The same seed gives the same graph for any "
+                             "number of workers.",
+                        type=int,
+                        default=None)
+    parser.add_argument("--workers",
+                        help="Number of processes used to sample partitions of random graphs.",
+                        type=int,
+                        default=1)
 
-    args = parser.parse_args()
-
-    methods = {
-        "complete": generate_complete_graph,
-        "power_law": generate_power_law_graph,
-        "uniform_random": generate_uniform_random_graph,
-        "skewed_random" : generate_skewed_graph,
-        "cyclic": generate_cyclic_graph
-    }
 
+def validate_generation_arguments(args, stream: bool = False) -> None:
+    """
+    Checks the generation arguments, raising a ValueError for the first invalid one.
+    """
     V: int = args.vertices
     E: int = args.edges
 
-    if args.generator not in methods:
+    if args.generator not in GENERATORS:
         raise ValueError("Invalid graph generation method.")
 
-    output_fname = args.output_file
-    if not is_valid_filename(output_fname):
-        raise ValueError("Invalid output filename.")
-
-    method = methods[args.generator]
-
-    if V > 10_000:
+    # The in-memory limits do not apply when streaming since memory is bounded by the chunk size instead.
+    if V > 10_000 and not stream:
         raise ValueError("Input vertex amount exceeds maximum of 10,000.")
-    if E > 2_000_000:
+    if E > 2_000_000 and not stream:
         raise ValueError("Input edge amount exceeds maximum of 2,000,000.")
+    if args.chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    if args.workers <= 0:
+        raise ValueError("Worker count must be positive.")
+    if args.generator == "random_geometric" and stream:
+        raise ValueError("The random_geometric generator does not support streaming.")
+    if args.radius is not None and args.radius <= 0:
+        raise ValueError("Radius must be positive.")
     if args.generator == "complete" and E != complete_edge_count(V):
         raise ValueError(f'For a complete graph with {V} edges {complete_edge_count(V)} edges must exist.')
 
+
+def is_partitioned(args, stream: bool = False) -> bool:
+    """
+    Seeded or multi-process runs go through the partitioned generators, which give every partition its own random
+    stream so the result does not depend on the number of workers.
+    """
+    return args.generator != "random_geometric" and (stream or args.seed is not None or args.workers > 1)
+
+
+def generate_chunks(args):
+    """
+    Starts the partitioned generator selected by the arguments.
+
+    Returns:
+        The stream of vertex-partitioned edge chunks and the partition size.
+    """
+    from algo.generation.streaming import streaming_partition_size
+
+    V: int = args.vertices
+    E: int = args.edges
+    edge_count = V if args.generator == "cyclic" else E
+    partition_size = streaming_partition_size(V, edge_count, args.chunk_size)
+    stream_method = STREAMING_GENERATORS[args.generator]
+    chunks = stream_method(V, E, partition_size, seed=args.seed, workers=args.workers) \
+        if args.generator not in ["complete", "cyclic"] else stream_method(V, partition_size)
+    return chunks, partition_size
+
+
+def generate_graph(args, as_csr: bool = False) -> Union["Graph", "CSRGraph"]:
+    """
+    Generates the graph selected by the arguments in memory.
+
+    Args:
+        args: The parsed generation arguments.
+        as_csr (bool): Return a CSRGraph. Partitioned generation builds it straight from the edge chunks.
+
+    Returns:
+        The generated graph.
+    """
+    from algo.structures.csr import CSRGraph
+
+    V: int = args.vertices
+    E: int = args.edges
+    method = GENERATORS[args.generator]
+
+    if is_partitioned(args):
+        from algo.generation.streaming import build_graph_from_chunks
+
+        chunks, _ = generate_chunks(args)
+        if as_csr:
+            return CSRGraph.from_edges(V, (edge for _, _, edges in chunks for edge in edges))
+        return build_graph_from_chunks(V, chunks)
+
+    if args.generator == "random_geometric":
+        import random
+        from algo.generation.random_geometric import radius_for_expected_edges
+
+        if args.seed is not None:
+            random.seed(args.seed)
+        radius = args.radius if args.radius is not None else radius_for_expected_edges(V, E)
+        print(f'{"Connection radius:":<30} {radius} 📏')
+        graph = method(V, radius)
+    else:
+        graph = method(V, E) if args.generator not in ["complete", "cyclic"] else method(V)
+    return CSRGraph.from_graph(graph) if as_csr else graph
+
+
+def cli_p1():
+    """
+    Part 1 of the CLI, generates a graph and outputs it to a file.
+    Using the selected output file, number of edges, number of vertices,
+    and graph generation method, a graph is generated and output to the
+    selected file.
+    """
+    from algo.serialization.files import graph_format, write_graph
+
+    parser = ArgumentParser()
+    parser.add_argument("-o",
+                        "--output_file",
+                        help="Output File name",
+                        type=str,
+                        required=True)
+    add_generation_arguments(parser)
+    parser.add_argument("--stream",
+                        help="Generate the graph in vertex partitions and append it to the output file as it is "
+                             "generated, without building the whole graph in memory.",
+                        action="store_true")
+
+    args = parser.parse_args()
+
+    V: int = args.vertices
+    E: int = args.edges
+
+    output_fname = args.output_file
+    if not is_valid_filename(output_fname):
+        raise ValueError("Invalid output filename.")
+
+    validate_generation_arguments(args, args.stream)
+    if args.stream and graph_format(output_fname) not in ("", ".csr"):
+        raise ValueError("Streaming only supports the adjacency text and CSR formats.")
+
     print('-' * SEPERATOR_LENGTH)
     print("Using the following arguments:")
     print(f'{"Output file:":<30} {output_fname} 📄')
     print(f'{"Vertices:":<30} {V} 📏')
     print(f'{"Edges:":<30} {E} 📏')
     print(f'{"Graph generation method:":<30} {args.generator} 📈')
+    if args.stream:
+        print(f'{"Streaming chunk size:":<30} {args.chunk_size} 📏')
+    if args.seed is not None:
+        print(f'{"Seed:":<30} {args.seed} 🎲')
+    if args.workers > 1:
+        print(f'{"Workers:":<30} {args.workers} 🧵')
     print('-' * SEPERATOR_LENGTH)
 
-    print(f'{"Generating graph..."} 📊')
+    if args.stream:
+        chunks, partition_size = generate_chunks(args)
+        print(f'{"Streaming graph to file..."} 📊')
+        if graph_format(output_fname) == ".csr":
+            from algo.serialization.csr import write_csr_graph_from_edges
 
-    graph: Graph = method(V, E) if args.generator != "complete" else method(V)
+            # The CSR file is built with an external sort, so its adjacency never has to fit in memory either
+            write_csr_graph_from_edges((edge for _, _, edges in chunks for edge in edges), output_fname, V)
+        else:
+            from algo.serialization.graph import write_edge_stream_to_file
+
+            write_edge_stream_to_file(chunks, V, partition_size, output_fname)
+        print(f'Graph streamed to {output_fname} 🚀')
+        return
+
+    print(f'{"Generating graph..."} 📊')
+    graph = generate_graph(args)
     print('Graph generated 🎉')
 
-    write_graph_to_file(graph, output_fname)
+    write_graph(graph, output_fname)
     print(f'Graph written to {output_fname} 🚀')
 
 
+def print_ordering_report(order, meta, dump_degrees=None) -> None:
+    """
+    Prints the ordering time and the statistics an ordering left in its metadata, and writes the deleted-degree
+    profile to `dump_degrees` when given.
+    """
+    if 'ordering_time' in meta:
+        order_time = meta['ordering_time']
+        ordering_time_str = str(datetime.timedelta(seconds=order_time))
+        print(f'{"Ordering time:":<30} {ordering_time_str} ⏱️')
+    else:
+        print(f'{"Ordering time:":<30} {"N/A"} ⏱️')
+
+    # Smallest last finds its terminal clique and the degeneracy while peeling, without a separate clique search
+    if 'terminal_clique_size' in meta:
+        print(f'{"Terminal clique size:":<30} {meta["terminal_clique_size"]} 📏')
+        print(f'{"Degeneracy:":<30} {meta["degeneracy"]} 📏')
+
+    if 'deleted_degrees' in meta:
+        from algo.ordering.smallest_last import deleted_degree_summary
+
+        summary = deleted_degree_summary(order, meta['deleted_degrees'])
+        print(f'{"Max degree when deleted:":<30} {summary["max_deleted_degree"]} 📏')
+        print(f'{"Vertices deleted at degree:":<30}')
+        for degree, count in enumerate(summary['deleted_degree_histogram']):
+            if count:
+                print(f'{degree:>6}: {count}')
+        print(f'{"Vertices with core number:":<30}')
+        for core, count in enumerate(summary['core_number_histogram']):
+            if count:
+                print(f'{core:>6}: {count}')
+
+        if dump_degrees is not None:
+            from algo.serialization.degrees import write_degree_profile_to_file
+
+            write_degree_profile_to_file(order, meta['deleted_degrees'], dump_degrees)
+            print(f'{"Degree profile written to:":<30} {dump_degrees} 📄')
+
+
+def print_phase_report(phases) -> None:
+    """
+    Prints the calls, total time and, when memory was traced, the peak memory of every phase of the run.
+    """
+    print(f'{"Phases:":<30}')
+    for name, record in phases.items():
+        line = f'{name:>38}: {record["calls"]}x {str(datetime.timedelta(seconds=record["time"]))}'
+        if record["peak_memory"] is not None:
+            line += f' peak {record["peak_memory"] / (1 << 20):.1f} MiB'
+        print(line)
+
+
+def color_graph(graph, order, operation_counts=None):
+    """
+    Greedily colors the graph in the given order and prints the coloring time and the number of colors used. When
+    given `operation_counts`, the work of the coloring is added to them.
+
+    Returns:
+        The coloring and the time it took in seconds.
+    """
+    from algo.coloring.greedy import greedy_coloring
+
+    print(f'{"Coloring graph..."} 🎨')
+    coloring_start_time = time.perf_counter()
+    coloring = greedy_coloring(graph, order, operation_counts)
+    coloring_time = time.perf_counter() - coloring_start_time
+
+    print(f'{"Coloring time:":<30} {str(datetime.timedelta(seconds=coloring_time))} ⏱️')
+    colors_used = len(set(coloring.values()))
+    print(f'{"Colors used:":<30} {colors_used} 📏')
+    return coloring, coloring_time
+
+
 def cli_p2():
     """
     Part 2 of the CLI, reads a graph from a file, and using a selected ordering
     method will color the graph and output the the coloring to a file.
     """
+    from algo.serialization.coloring import write_coloring_to_file
+    from algo.serialization.files import read_graph
+    from algo.serialization.index import index_path, load_graph_index
+
     parser = ArgumentParser()
     parser.add_argument("-i",
                         "--input_file",
@@ -145,7 +343,7 @@ def cli_p2():
                         required=True)
     parser.add_argument("-f",
                         "--output_file",
-                        help="Output File name",
+                        help="Output File name. Files ending in .bin get the binary coloring format.",
                         type=str,
                         default="coloring.txt",
                         required=False)
@@ -153,26 +351,55 @@ def cli_p2():
                         "--ordering",
                         help="Ordering method to use for graph coloring.",
                         type=str,
-                        choices=['smallest_last',
-                                 'smallest_original_degree_last',
-                                 'largest_last',
-                                 'largest_original_degree_last',
-                                 'incidence',
-                                 'connected_sequential'],
+                        choices=list(ORDERINGS),
                         required=True)
+    parser.add_argument("--clique",
+                        help="Terminal clique statistics: off, cheap lower and upper bounds, or an exact search that "
+                             "reports the largest clique found when the timeout hits.",
+                        type=str,
+                        choices=['off', 'bound', 'exact'],
+                        default='off')
+    parser.add_argument("--dump-degrees",
+                        help="Write the degree of every vertex when it was deleted and its core number to this file.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--clique-timeout",
+                        help="Seconds the exact terminal clique search may run for.",
+                        type=float,
+                        default=10.0)
+    parser.add_argument("--metrics-json",
+                        help="Write the graph size, phase timings, colors used, degeneracy and peak memory of the run "
+                             "to this JSON file.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--profile",
+                        help="Profile every phase of the run with cProfile and write its stats to "
+                             "PREFIX.PHASE.pstats.",
+                        metavar="PREFIX",
+                        type=str,
+                        default=None)
+    parser.add_argument("--trace-memory",
+                        help="Report the peak memory of every phase of the run, traced with tracemalloc. Slows the "
+                             "run down.",
+                        action="store_true")
+    parser.add_argument("--trace",
+                        help="Write a Chrome trace of the run, viewable in Perfetto or chrome://tracing, to this file.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--trace-interval",
+                        help="Sample the ordering, coloring and clique search loops every this many iterations in "
+                             "the trace.",
+                        type=int,
+                        default=1024)
+    parser.add_argument("--count-operations",
+                        help="Count the vertex scans, degree lookups, neighbor visits, degree updates and color probes "
+                             "of the ordering and the coloring. Counting slows the run down, but the counts do not "
+                             "depend on the machine.",
+                        action="store_true")
 
     args = parser.parse_args()
 
-    orderings = {
-        'smallest_last': smallest_last_vertex_ordering,
-        'smallest_original_degree_last': smallest_original_degree_last_vertex_ordering,
-        'largest_last': largest_last_vertex_ordering,
-        'largest_original_degree_last': largest_original_degree_last_vertex_ordering,
-        'incidence': incidence_ordering,
-        'connected_sequential': connected_sequential_ordering
-    }
-
-    ordering = orderings[args.ordering]
+    ordering = ORDERINGS[args.ordering]
 
     input_fname = args.input_file
     if not is_valid_filename(input_fname):
@@ -182,60 +409,464 @@ def cli_p2():
     if not is_valid_filename(output_fname):
         raise ValueError("Invalid output filename.")
 
+    if args.dump_degrees is not None and not is_valid_filename(args.dump_degrees):
+        raise ValueError("Invalid degree profile filename.")
+
+    if args.metrics_json is not None and not is_valid_filename(args.metrics_json):
+        raise ValueError("Invalid metrics filename.")
+
+    if args.profile is not None and not is_valid_filename(args.profile):
+        raise ValueError("Invalid profile filename prefix.")
+
+    if args.trace is not None and not is_valid_filename(args.trace):
+        raise ValueError("Invalid trace filename.")
+
+    if args.trace_interval <= 0:
+        raise ValueError("Trace interval must be positive.")
+
+    if args.clique_timeout <= 0:
+        raise ValueError("Clique timeout must be positive.")
+
     print('-' * SEPERATOR_LENGTH)
     print("Using the following arguments:")
     print(f'{"Input file:":<30} {input_fname} 📄')
     print(f'{"Output file:":<30} {output_fname} 📄')
     print(f'{"Ordering method:":<30} {args.ordering} 📈')
+    print(f'{"Terminal clique:":<30} {args.clique} 📈')
     print('-' * SEPERATOR_LENGTH)
 
+    profiling = args.profile is not None or args.trace_memory
+    if args.count_operations:
+        from algo.instrumentation import OPERATION_COUNTERS, operation_counts
+    if profiling:
+        from algo.instrumentation import PHASES
+
+        PHASES.enable(profile=args.profile is not None, trace_memory=args.trace_memory)
+    if args.trace is not None:
+        from algo.instrumentation import TRACER
+
+        TRACER.enable(args.trace_interval)
+
+    # The sidecar index answers the graph statistics without going over the parsed graph
+    index = load_graph_index(input_fname)
+    if index is not None:
+        print(f'{"Using graph index:":<30} {index_path(input_fname)} 📄')
+        vertex_count, edge_count, average_original_degree = index.V, index.E, index.average_degree()
+        index.close()
+
     print(f'{"Reading graph from file..."} 📊')
-    graph = read_graph_from_file(input_fname)
+    load_start_time = time.perf_counter()
+    graph = read_graph(input_fname)
+    load_time = time.perf_counter() - load_start_time
     print('Graph read from file🎉')
-    print(f'{"Vertex count:":<30} {len(graph.vertices())} 📏')
-    print(f'{"Edge count:":<30} {len(graph.edges())} 📏')
-    print(f'{"Terminal clique size:":<30}{terminal_clique_size(graph)} 📏')
-    average_original_degree = sum([graph.degree(v) for v in graph.vertices()]) / len(graph.vertices())
+    if index is None:
+        vertex_count = graph.V
+        edge_count = len(graph.edges())
+        average_original_degree = sum([graph.degree(v) for v in graph.vertices()]) / graph.V
+    print(f'{"Vertex count:":<30} {vertex_count} 📏')
+    print(f'{"Edge count:":<30} {edge_count} 📏')
+    if args.clique == 'bound':
+        from algo.structures.graph import clique_bounds
+
+        lower, upper = clique_bounds(graph)
+        print(f'{"Terminal clique size bounds:":<30}{lower} - {upper} 📏')
+    elif args.clique == 'exact':
+        from algo.structures.graph import maximum_clique
+
+        clique, complete = maximum_clique(graph, args.clique_timeout)
+        timed_out = '' if complete else f' (best found in {args.clique_timeout}s)'
+        print(f'{"Terminal clique size:":<30}{len(clique)}{timed_out} 📏')
     print(f'{"Average original degree:":<30}{average_original_degree} 📏')
     print('-' * SEPERATOR_LENGTH)
 
     print(f'{"Ordering graph using:":<30} {args.ordering}... 🔢')
-    order, meta = ordering(graph)
-
-    if 'ordering_time' in meta:
-        order_time = meta['ordering_time']
-        ordering_time_str = str(datetime.timedelta(seconds=order_time))
-        print(f'{"Ordering time:":<30} {ordering_time_str} ⏱️')
-    else:
-        print(f'{"Ordering time:":<30} {"N/A"} ⏱️')
-
-    if 'deleted_degrees' in meta:
-        deleted_degrees = meta['deleted_degrees']
-        print(f'{"Vertex degree when deleted:":<30}')
-        for vertex, degree in deleted_degrees.items():
-            print(f'{vertex}: {degree} 📏')
+    ordering_start_time = time.perf_counter()
+    order, meta = ordering(graph, count_operations=True) if args.count_operations else ordering(graph)
+    ordering_time = time.perf_counter() - ordering_start_time
 
+    print_ordering_report(order, meta, args.dump_degrees)
     print('-' * SEPERATOR_LENGTH)
 
-    print(f'{"Coloring graph..."} 🎨')
-    coloring_start_time = time.time()
-    coloring = greedy_coloring(graph, order)
-    coloring_time = time.time() - coloring_start_time
-
-    print(f'{"Coloring time:":<30} {str(datetime.timedelta(seconds=coloring_time))} ⏱️')
-    colors_used = len(set(coloring.values()))
-    print(f'{"Colors used:":<30} {colors_used} 📏')
+    coloring_counts = operation_counts() if args.count_operations else None
+    coloring, coloring_time = color_graph(graph, order, coloring_counts)
     print('-' * SEPERATOR_LENGTH)
 
+    if args.count_operations:
+        print(f'{"Operation counts:":<30} {"ordering":>14} {"coloring":>14}')
+        for counter in OPERATION_COUNTERS:
+            print(f'{counter:>30} {meta["operation_counts"][counter]:>14} {coloring_counts[counter]:>14}')
+        print('-' * SEPERATOR_LENGTH)
+
+    if args.trace is not None:
+        TRACER.disable()
+        TRACER.write_chrome_trace(args.trace)
+        print(f'{"Trace written to:":<30} {args.trace} 📄')
+        print('-' * SEPERATOR_LENGTH)
+
+    phases = None
+    if profiling:
+        phases = PHASES.report()
+        PHASES.disable()
+        print_phase_report(phases)
+        if args.profile is not None:
+            for path in PHASES.write_profiles(args.profile):
+                print(f'{"Profile written to:":<30} {path} 📄')
+        print('-' * SEPERATOR_LENGTH)
+
+    if args.metrics_json is not None:
+        from algo.instrumentation import peak_memory_bytes, write_metrics_json
+        from algo.structures.graph import degeneracy
+
+        # Taken before the degeneracy pass so the peak covers the run itself
+        peak_memory = peak_memory_bytes()
+        write_metrics_json({
+            "input_file": input_fname,
+            "ordering": args.ordering,
+            "vertices": vertex_count,
+            "edges": edge_count,
+            "load_time": load_time,
+            "ordering_time": meta.get("ordering_time", ordering_time),
+            "coloring_time": coloring_time,
+            "colors_used": len(set(coloring.values())),
+            # Smallest last finds the degeneracy while peeling, the other orderings need a separate pass
+            "degeneracy": meta["degeneracy"] if "degeneracy" in meta else degeneracy(graph),
+            "peak_memory_bytes": peak_memory,
+            **({"phases": phases} if phases is not None else {}),
+            **({"operation_counts": {"ordering": meta["operation_counts"], "coloring": coloring_counts}}
+               if args.count_operations else {}),
+        }, args.metrics_json)
+        print(f'{"Metrics written to:":<30} {args.metrics_json} 📄')
+
     # Now we need to write the coloring to a file
     # The format for this is such that each line follows the format:
     # VERTEX_NUMBER, COLOR_NUMBER
+    # unless the output file ends in .bin, in which case the binary coloring format is used
 
     print(f'{"Writing coloring to file..."} 📄')
-    with open(output_fname, 'w') as f:
-        for vertex, color in coloring.items():
-            f.write(f'{vertex},{color}\n')
+    write_coloring_to_file(coloring, output_fname)
     print(f'{"Coloring written to file."} 🚀')
 
+
+def pipeline():
+    """
+    Generates a graph, orders it and colors it in a single process. The generated graph is handed between the stages
+    as an in-memory CSR graph instead of being written by cli_p1 and parsed back by cli_p2. Writing the graph to a
+    file is optional and runs on a background thread, overlapping with ordering and coloring.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from algo.serialization.coloring import write_coloring_to_file
+    from algo.serialization.files import write_graph
+
+    parser = ArgumentParser()
+    add_generation_arguments(parser)
+    parser.add_argument("-o",
+                        "--ordering",
+                        help="Ordering method to use for graph coloring.",
+                        type=str,
+                        choices=list(ORDERINGS),
+                        required=True)
+    parser.add_argument("-w",
+                        "--graph_file",
+                        help="Also write the generated graph to this file, in the background.",
+                        type=str,
+                        default=None)
+    parser.add_argument("-f",
+                        "--output_file",
+                        help="Write the coloring to this file. Files ending in .bin get the binary coloring format.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--dump-degrees",
+                        help="Write the degree of every vertex when it was deleted and its core number to this file.",
+                        type=str,
+                        default=None)
+
+    args = parser.parse_args()
+
+    validate_generation_arguments(args)
+    for fname in [args.graph_file, args.output_file, args.dump_degrees]:
+        if fname is not None and not is_valid_filename(fname):
+            raise ValueError(f"Invalid output filename: {fname}")
+
+    print('-' * SEPERATOR_LENGTH)
+    print("Using the following arguments:")
+    print(f'{"Vertices:":<30} {args.vertices} 📏')
+    print(f'{"Edges:":<30} {args.edges} 📏')
+    print(f'{"Graph generation method:":<30} {args.generator} 📈')
+    print(f'{"Ordering method:":<30} {args.ordering} 📈')
+    if args.graph_file is not None:
+        print(f'{"Graph file:":<30} {args.graph_file} 📄')
+    if args.output_file is not None:
+        print(f'{"Output file:":<30} {args.output_file} 📄')
+    print('-' * SEPERATOR_LENGTH)
+
+    print(f'{"Generating graph..."} 📊')
+    generation_start_time = time.perf_counter()
+    graph = generate_graph(args, as_csr=True)
+    generation_time = time.perf_counter() - generation_start_time
+    print(f'{"Generation time:":<30} {str(datetime.timedelta(seconds=generation_time))} ⏱️')
+    print('-' * SEPERATOR_LENGTH)
+
+    # The CSR graph is never modified, so the writer thread can read it while it is being ordered and colored
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        graph_written = writer.submit(write_graph, graph, args.graph_file) if args.graph_file is not None else None
+
+        print(f'{"Ordering graph using:":<30} {args.ordering}... 🔢')
+        order, meta = ORDERINGS[args.ordering](graph)
+        print_ordering_report(order, meta, args.dump_degrees)
+        print('-' * SEPERATOR_LENGTH)
+
+        coloring, _ = color_graph(graph, order)
+        print('-' * SEPERATOR_LENGTH)
+
+        if graph_written is not None:
+            graph_written.result()
+            print(f'Graph written to {args.graph_file} 🚀')
+
+    if args.output_file is not None:
+        write_coloring_to_file(coloring, args.output_file)
+        print(f'{"Coloring written to file."} 🚀')
+
+
+def batch():
+    """
+    Colors many graph files with many orderings in one run. Every graph is parsed once and the (graph, ordering) jobs
+    run on a pool of worker processes. The colors used, times and degeneracy of every job are written to one CSV or
+    JSON file.
+    """
+    from algo.batch import expand_graph_files, run_batch, write_batch_results
+
+    parser = ArgumentParser()
+    parser.add_argument("-i",
+                        "--input_files",
+                        help="Graph files or glob patterns such as 'graphs/*.txt'.",
+                        type=str,
+                        nargs="+",
+                        required=True)
+    parser.add_argument("-o",
+                        "--orderings",
+                        help="Ordering methods to run on every graph. Defaults to all of them.",
+                        type=str,
+                        nargs="+",
+                        choices=list(ORDERINGS),
+                        default=list(ORDERINGS))
+    parser.add_argument("-f",
+                        "--output_file",
+                        help="Results file name. Files ending in .json get JSON, anything else gets CSV.",
+                        type=str,
+                        default="batch_results.csv")
+    parser.add_argument("--workers",
+                        help="Number of worker processes.",
+                        type=int,
+                        default=os.cpu_count() or 1)
+
+    args = parser.parse_args()
+
+    if not is_valid_filename(args.output_file):
+        raise ValueError("Invalid output filename.")
+    if args.workers <= 0:
+        raise ValueError("Worker count must be positive.")
+
+    graph_files = expand_graph_files(args.input_files)
+
+    print('-' * SEPERATOR_LENGTH)
+    print("Using the following arguments:")
+    print(f'{"Graph files:":<30} {len(graph_files)} 📄')
+    print(f'{"Ordering methods:":<30} {", ".join(args.orderings)} 📈')
+    print(f'{"Output file:":<30} {args.output_file} 📄')
+    print(f'{"Workers:":<30} {args.workers} 🧵')
+    print('-' * SEPERATOR_LENGTH)
+
+    print(f'{"Running jobs..."} 🎨')
+    batch_start_time = time.perf_counter()
+    results = run_batch(graph_files, args.orderings, args.workers)
+    batch_time = time.perf_counter() - batch_start_time
+    print(f'{"Batch time:":<30} {str(datetime.timedelta(seconds=batch_time))} ⏱️')
+
+    for result in results:
+        print(f'{result["graph_file"]:<30} {result["ordering"]:<30} {result["colors_used"]} colors')
+    print('-' * SEPERATOR_LENGTH)
+
+    write_batch_results(results, args.output_file)
+    print(f'Results written to {args.output_file} 🚀')
+
+
+def serve():
+    """
+    Runs the coloring service: an HTTP server on localhost or a Unix socket that keeps named graphs in memory,
+    applies edge deltas to them and orders and colors them on request on a pool of worker processes.
+    """
+    from algo.jobs import DEFAULT_MAX_PENDING
+    from algo.service import DEFAULT_HOST, DEFAULT_PORT, ColoringService, make_server
+
+    parser = ArgumentParser()
+    parser.add_argument("--host",
+                        help="Loopback interface to listen on, such as 127.0.0.1 or ::1.",
+                        type=str,
+                        default=DEFAULT_HOST)
+    parser.add_argument("--port",
+                        help="Port to listen on.",
+                        type=int,
+                        default=DEFAULT_PORT)
+    parser.add_argument("--socket",
+                        help="Listen on this Unix socket instead of a port.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--workers",
+                        help="Number of worker processes coloring graphs.",
+                        type=int,
+                        default=os.cpu_count() or 1)
+    parser.add_argument("--max-pending",
+                        help="Number of coloring jobs that may wait for a worker before requests are turned away.",
+                        type=int,
+                        default=DEFAULT_MAX_PENDING)
+
+    args = parser.parse_args()
+
+    if args.workers <= 0:
+        raise ValueError("Worker count must be positive.")
+    if args.max_pending <= 0:
+        raise ValueError("Maximum pending job count must be positive.")
+
+    service = ColoringService(args.workers, max_pending=args.max_pending)
+    server = make_server(service, args.host, args.port, args.socket)
+    address = args.socket if args.socket is not None else f'http://{args.host}:{server.server_address[1]}'
+    print(f'{"Coloring service listening on:":<30} {address} 🚀')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def bench():
+    """
+    Benchmarks every ordering, generator, coloring engine and file format across a grid of graph sizes, fits how the
+    time of each scales with the size and optionally fails when a case regresses against a stored baseline.
+    """
+    from algo.benchmark import (DEFAULT_DENSITY, DEFAULT_EXPONENT_TOLERANCE, DEFAULT_MIN_SAMPLE_TIME, DEFAULT_REPEATS,
+                                DEFAULT_SEED, DEFAULT_SIZES, DEFAULT_TIME_NOISE_FLOOR, DEFAULT_TIME_TOLERANCE,
+                                DEFAULT_WARMUP, SUITES, benchmark_cases, check_baseline_settings, compare_to_baseline,
+                                read_benchmark_results, run_benchmarks, write_benchmark_results)
+
+    parser = ArgumentParser()
+    parser.add_argument("-s",
+                        "--suites",
+                        help="Benchmark suites to run. Defaults to all of them.",
+                        type=str,
+                        nargs="+",
+                        choices=SUITES,
+                        default=SUITES)
+    parser.add_argument("--sizes",
+                        help="Numbers of vertices to run every case at.",
+                        type=int,
+                        nargs="+",
+                        default=DEFAULT_SIZES)
+    parser.add_argument("--density",
+                        help="Fraction of all possible edges the benchmark graphs have.",
+                        type=float,
+                        default=DEFAULT_DENSITY)
+    parser.add_argument("--repeats",
+                        help="Timed runs per case and size. The median is kept.",
+                        type=int,
+                        default=DEFAULT_REPEATS)
+    parser.add_argument("--warmup",
+                        help="Untimed runs per case and size before the timed ones.",
+                        type=int,
+                        default=DEFAULT_WARMUP)
+    parser.add_argument("--min-sample-time",
+                        help="Seconds a timed sample must last. Faster cases are called several times per sample.",
+                        type=float,
+                        default=DEFAULT_MIN_SAMPLE_TIME)
+    parser.add_argument("--seed",
+                        help="Seed of the random benchmark graphs.",
+                        type=int,
+                        default=DEFAULT_SEED)
+    parser.add_argument("-f",
+                        "--output_file",
+                        help="Write the results to this JSON file, which later runs can use as their baseline.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--baseline",
+                        help="Compare the results with this results file and fail on a regression.",
+                        type=str,
+                        default=None)
+    parser.add_argument("--exponent-tolerance",
+                        help="How far a scaling exponent may rise above the baseline.",
+                        type=float,
+                        default=DEFAULT_EXPONENT_TOLERANCE)
+    parser.add_argument("--time-tolerance",
+                        help="Fraction by which a time relative to the reference workload may exceed the baseline.",
+                        type=float,
+                        default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument("--noise-floor",
+                        help="Seconds by which a time must also exceed the baseline to count as a regression.",
+                        type=float,
+                        default=DEFAULT_TIME_NOISE_FLOOR)
+    parser.add_argument("--confirm",
+                        help="Times to re-run a case that regressed. Only a regression every re-run shows fails.",
+                        type=int,
+                        default=1)
+
+    args = parser.parse_args()
+
+    if args.output_file is not None and not is_valid_filename(args.output_file):
+        raise ValueError("Invalid output filename.")
+    if args.confirm < 0:
+        raise ValueError("Confirmation run count must be non-negative.")
+    # Read and checked before running, so a missing or incomparable baseline fails fast
+    baseline = read_benchmark_results(args.baseline) if args.baseline is not None else None
+    if baseline is not None:
+        check_baseline_settings({"sizes": sorted(set(args.sizes)), "density": args.density, "seed": args.seed},
+                                baseline)
+
+    print('-' * SEPERATOR_LENGTH)
+    print("Using the following arguments:")
+    print(f'{"Benchmark suites:":<30} {", ".join(args.suites)} 📈')
+    print(f'{"Sizes:":<30} {", ".join(str(size) for size in args.sizes)} 📏')
+    print(f'{"Density:":<30} {args.density} 📏')
+    print(f'{"Repeats:":<30} {args.repeats} (+{args.warmup} warmup) 🔁')
+    print('-' * SEPERATOR_LENGTH)
+
+    def run(cases):
+        return run_benchmarks(cases, args.sizes, args.density, args.repeats, args.warmup, args.seed,
+                              args.min_sample_time, progress=lambda case, size: print(f'{case:<40} {size} vertices...'))
+
+    results = run(benchmark_cases(args.suites))
+
+    regressions = {}
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.exponent_tolerance, args.time_tolerance,
+                                          args.noise_floor)
+        # A shared machine can slow down any single run, while a real regression shows again when re-run
+        for _ in range(args.confirm):
+            if not regressions:
+                break
+            print(f'{"Re-running regressed cases:":<30} {", ".join(regressions)} 🔁')
+            rerun = run([tuple(case.split(".", 1)) for case in regressions])
+            results["cases"].update(rerun["cases"])
+            regressions = compare_to_baseline(rerun, baseline, args.exponent_tolerance, args.time_tolerance,
+                                              args.noise_floor)
+
+    print('-' * SEPERATOR_LENGTH)
+    for case, record in results["cases"].items():
+        print(f'{case:<40} exponent {record["exponent"]:.2f}, {record["min_times"][-1]:.6f}s at '
+              f'{record["vertices"][-1]} vertices')
+    print('-' * SEPERATOR_LENGTH)
+
+    if args.output_file is not None:
+        write_benchmark_results(results, args.output_file)
+        print(f'Results written to {args.output_file} 🚀')
+
+    if baseline is not None:
+        for case, found in regressions.items():
+            for regression in found:
+                print(f'Regression: {case}: {regression}')
+        if regressions:
+            raise SystemExit(f'{len(regressions)} benchmark case(s) regressed against {args.baseline}.')
+        print(f'{"No regressions against:":<30} {args.baseline} ✅')
+
+
 if __name__ == "__main__":
     cli_p1()
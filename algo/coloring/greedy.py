@@ -1,6 +1,11 @@
+from typing import Dict, Optional
+
+from algo.instrumentation import TRACER, CountingGraph, timed
 from algo.structures.graph import Graph
 
-def greedy_coloring(graph: Graph, ordering: list[int]) -> dict[int, int]:
+@timed("coloring")
+def greedy_coloring(graph: Graph, ordering: list[int], operation_counts: Optional[Dict[str, int]] = None) -> \
+    dict[int, int]:
     """
     Given a graph and an ordering of its vertices, performs a greedy graph coloring using the specified vertex ordering.
 
@@ -10,20 +15,25 @@ def greedy_coloring(graph: Graph, ordering: list[int]) -> dict[int, int]:
     Args:
         graph (Graph): The input graph to be colored.
         ordering (list[int]): A list of vertex indices specifying the order in which the vertices should be colored.
+        operation_counts (Optional[Dict[str, int]]): Add the neighbor visits and color probes of the coloring to
+            these counters, such as the ones an ordering returned in its metadata.
 
     Returns:
         dict[int, int]: A dictionary mapping vertex indices to their assigned colors.
     """
     # Initialize color assignment dictionary
     colors = {}
+    counting = operation_counts is not None
+    if counting:
+        graph = CountingGraph(graph, operation_counts)
+    tracing = TRACER.enabled
+    interval = TRACER.sample_interval
+    highest_color = -1
 
     # Iterate through the ordering
     for vertex in ordering:
         # Get adjacent vertices for the current vertex
-        if graph.adj_list[vertex] is None:
-            adjacent = []
-        else:
-            adjacent = [node.vertex for node in graph.adj_list[vertex]]
+        adjacent = graph.neighbors(vertex)
 
         # Get colors of the adjacent vertices
         adjacent_colors = [colors[v] for v in adjacent if v in colors]
@@ -36,4 +46,13 @@ def greedy_coloring(graph: Graph, ordering: list[int]) -> dict[int, int]:
         # Assign the color to the current vertex
         colors[vertex] = color
 
+        if counting:
+            # Every color below the chosen one was probed and found taken
+            operation_counts["color_probes"] += color + 1
+
+        if tracing:
+            highest_color = max(highest_color, color)
+            if len(colors) % interval == 0:
+                TRACER.counter("coloring", colored=len(colors), colors_used=highest_color + 1)
+
     return colors
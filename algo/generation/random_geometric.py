@@ -0,0 +1,87 @@
+import math
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from algo.structures.graph import Graph
+
+
+def generate_random_geometric_graph(num_vertices: int, radius: float) -> Graph:
+    """
+    This function generates a random geometric graph, where vertices are points placed uniformly at random
+    in the unit square and two vertices conflict when their points lie within `radius` of each other.
+
+    Points are bucketed into a uniform grid of cells with side `radius`, so only points in the same or adjacent
+    cells are compared and the graph is built in O(V + E) expected time.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        radius (float): The connection radius.
+
+    Returns:
+        A random geometric graph object.
+    """
+
+    assert radius > 0, "Radius must be positive"
+
+    points = [(random.random(), random.random()) for _ in range(num_vertices)]
+
+    graph = Graph(num_vertices)
+    for u, v in geometric_edges(points, radius):
+        graph.add_edge(u, v)
+
+    return graph
+
+
+def geometric_edges(points: Sequence[Tuple[float, float]], radius: float) -> List[Tuple[int, int]]:
+    """
+    Finds every pair of points in the unit square that lie within `radius` of each other using a cell list.
+
+    Args:
+        points (Sequence[Tuple[float, float]]): The point of each vertex.
+        radius (float): The connection radius.
+
+    Returns:
+        List[Tuple[int, int]]: The edges (u, v), u < v, between points at distance at most `radius`.
+    """
+    cells_per_side = max(1, int(1 / radius))
+    cell_size = 1 / cells_per_side
+
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for vertex, (x, y) in enumerate(points):
+        cell = (min(int(x / cell_size), cells_per_side - 1), min(int(y / cell_size), cells_per_side - 1))
+        cells.setdefault(cell, []).append(vertex)
+
+    radius_squared = radius * radius
+    edges = []
+    for (cx, cy), members in cells.items():
+        # Only look at half of the neighbouring cells so every pair of cells is compared once
+        for dx, dy in [(0, 0), (1, -1), (1, 0), (1, 1), (0, 1)]:
+            others = cells.get((cx + dx, cy + dy))
+            if others is None:
+                continue
+            for i, u in enumerate(members):
+                ux, uy = points[u]
+                for v in (members[i + 1:] if dx == 0 and dy == 0 else others):
+                    vx, vy = points[v]
+                    if (ux - vx) ** 2 + (uy - vy) ** 2 <= radius_squared:
+                        edges.append((u, v) if u < v else (v, u))
+
+    return edges
+
+
+def radius_for_expected_edges(num_vertices: int, num_conflicts: int) -> float:
+    """
+    Picks the radius at which a random geometric graph on `num_vertices` points is expected to have roughly
+    `num_conflicts` edges, ignoring boundary effects.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        num_conflicts (int): The desired number of edges.
+
+    Returns:
+        float: The connection radius.
+    """
+    pairs = num_vertices * (num_vertices - 1) / 2
+    if pairs == 0 or num_conflicts <= 0:
+        return 1 / max(1, num_vertices) ** 2
+    return min(math.sqrt(2), math.sqrt(num_conflicts / (pairs * math.pi)))
@@ -0,0 +1,297 @@
+import hashlib
+import random
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from algo.structures.graph import Graph
+
+# A chunk covers the vertex partition [lo, hi) and holds every edge (u, v), u < v, whose lower endpoint u lies in it.
+EdgeChunk = Tuple[int, int, List[Tuple[int, int]]]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def streaming_partition_size(num_vertices: int, num_conflicts: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Picks how many vertices go into each partition so that a partition holds roughly `chunk_size` half-edges.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        num_conflicts (int): The number of edges in the graph.
+        chunk_size (int): The target number of half-edges per partition.
+
+    Returns:
+        int: The number of vertices per partition.
+    """
+    if num_vertices <= 0:
+        return 1
+    if num_conflicts <= 0:
+        return max(1, min(num_vertices, chunk_size))
+    return max(1, min(num_vertices, chunk_size * num_vertices // (2 * num_conflicts)))
+
+
+def derive_seed(master_seed: int, stream: int) -> int:
+    """
+    Derives the seed of an independent random stream from a master seed, so every partition draws from its own
+    `random.Random` regardless of which worker samples it or in which order.
+
+    Args:
+        master_seed (int): The seed of the whole generation run.
+        stream (int): The index of the stream, typically the partition index.
+
+    Returns:
+        int: A 64-bit seed for the stream.
+    """
+    digest = hashlib.blake2b(f"{master_seed}:{stream}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def vertex_partitions(num_vertices: int, partition_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits the vertex range [0, num_vertices) into consecutive [lo, hi) partitions of `partition_size` vertices.
+    """
+    return [(lo, min(lo + partition_size, num_vertices)) for lo in range(0, num_vertices, partition_size)]
+
+
+def stream_complete_graph(num_vertices: int, partition_size: int) -> Iterator[EdgeChunk]:
+    """
+    Streams the edges of a complete graph one vertex partition at a time.
+
+    Args:
+        num_vertices (int): The number of vertices in the complete graph.
+        partition_size (int): The number of vertices per partition.
+
+    Yields:
+        EdgeChunk: The partition bounds and the edges whose lower endpoint lies in the partition.
+    """
+    for lo, hi in vertex_partitions(num_vertices, partition_size):
+        yield lo, hi, [(u, v) for u in range(lo, hi) for v in range(u + 1, num_vertices)]
+
+
+def stream_cyclic_graph(num_vertices: int, partition_size: int) -> Iterator[EdgeChunk]:
+    """
+    Streams the edges of a cycle through every vertex one vertex partition at a time.
+
+    Args:
+        num_vertices (int): The number of vertices in the cyclic graph.
+        partition_size (int): The number of vertices per partition.
+
+    Yields:
+        EdgeChunk: The partition bounds and the edges whose lower endpoint lies in the partition.
+    """
+    for lo, hi in vertex_partitions(num_vertices, partition_size):
+        edges = [(u, u + 1) for u in range(lo, min(hi, num_vertices - 1))]
+        if lo == 0 and num_vertices > 2:
+            edges.append((0, num_vertices - 1))
+        yield lo, hi, edges
+
+
+def stream_uniform_random_graph(num_vertices: int, num_conflicts: int, partition_size: int,
+                                seed: Optional[int] = None, workers: int = 1) -> Iterator[EdgeChunk]:
+    """
+    Streams a random graph where every vertex pair is equally likely, one vertex partition at a time.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        num_conflicts (int): The number of distinct edges to add to the graph.
+        partition_size (int): The number of vertices per partition.
+        seed (Optional[int]): The master seed. Defaults to a seed drawn from the global `random` module.
+        workers (int): The number of processes sampling partitions in parallel.
+
+    Yields:
+        EdgeChunk: The partition bounds and the edges whose lower endpoint lies in the partition.
+    """
+    yield from _stream_weighted_random_graph([1.0] * num_vertices, num_conflicts, partition_size, seed, workers)
+
+
+def stream_skewed_random_graph(num_vertices: int, num_conflicts: int, partition_size: int,
+                               seed: Optional[int] = None, workers: int = 1) -> Iterator[EdgeChunk]:
+    """
+    Streams a random graph using the same linearly skewed vertex weights as `generate_skewed_random_graph`,
+    one vertex partition at a time.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        num_conflicts (int): The number of distinct edges to add to the graph.
+        partition_size (int): The number of vertices per partition.
+        seed (Optional[int]): The master seed. Defaults to a seed drawn from the global `random` module.
+        workers (int): The number of processes sampling partitions in parallel.
+
+    Yields:
+        EdgeChunk: The partition bounds and the edges whose lower endpoint lies in the partition.
+    """
+    weights = [float(num_vertices - i) for i in range(num_vertices)]
+    yield from _stream_weighted_random_graph(weights, num_conflicts, partition_size, seed, workers)
+
+
+def stream_power_law_random_graph(num_vertices: int, num_conflicts: int, partition_size: int,
+                                  power: float = 2.5, seed: Optional[int] = None,
+                                  workers: int = 1) -> Iterator[EdgeChunk]:
+    """
+    Streams a random graph using the same power-law vertex weights as `generate_power_law_random_graph`,
+    one vertex partition at a time.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        num_conflicts (int): The number of distinct edges to add to the graph.
+        partition_size (int): The number of vertices per partition.
+        power (float): The power parameter for the power-law distribution.
+        seed (Optional[int]): The master seed. Defaults to a seed drawn from the global `random` module.
+        workers (int): The number of processes sampling partitions in parallel.
+
+    Yields:
+        EdgeChunk: The partition bounds and the edges whose lower endpoint lies in the partition.
+    """
+    weights = [float(i ** power) for i in range(1, num_vertices + 1)]
+    yield from _stream_weighted_random_graph(weights, num_conflicts, partition_size, seed, workers)
+
+
+def _stream_weighted_random_graph(weights: Sequence[float], num_conflicts: int, partition_size: int,
+                                  seed: Optional[int], workers: int) -> Iterator[EdgeChunk]:
+    """
+    Streams a random graph in which a pair (u, v) is picked with probability proportional to weights[u] * weights[v].
+
+    The edge budget is first split across the partitions in proportion to the pair mass whose lower endpoint lies in
+    each partition, then every partition samples its share from its own random stream derived from `seed`.
+    Duplicate detection is local to a partition, so memory is bounded by the partition size rather than by the
+    whole edge set. Since an edge only ever belongs to the partition of its lower endpoint, partitions sampled by
+    different workers can never produce the same edge, and the same seed gives the same graph for any worker count.
+    """
+    num_vertices = len(weights)
+    assert num_conflicts <= (num_vertices*(num_vertices-1))/2, \
+        "Number of edges cannot be greater than the maximum possible number of edges"
+    assert workers >= 1, "At least one worker is required"
+
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    partitions = vertex_partitions(num_vertices, partition_size)
+    cumulative = [0.0] + list(accumulate(weights))
+    counts = _partition_edge_counts(weights, cumulative, partitions, num_conflicts)
+    tasks = [(lo, hi, count, derive_seed(seed, index))
+             for index, ((lo, hi), count) in enumerate(zip(partitions, counts))]
+
+    if workers == 1:
+        for lo, hi, count, partition_seed in tasks:
+            yield lo, hi, _sample_partition(lo, hi, count, weights, cumulative, random.Random(partition_seed))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_sampling_worker,
+                             initargs=(weights, cumulative)) as executor:
+        # Keep a bounded window of partitions in flight so finished chunks are yielded in partition order
+        # without holding every partition in memory at once.
+        in_flight = deque()
+        for task in tasks:
+            in_flight.append((task[0], task[1], executor.submit(_sample_partition_task, task)))
+            if len(in_flight) >= 2 * workers:
+                lo, hi, future = in_flight.popleft()
+                yield lo, hi, future.result()
+        while in_flight:
+            lo, hi, future = in_flight.popleft()
+            yield lo, hi, future.result()
+
+
+_worker_weights: Sequence[float] = ()
+_worker_cumulative: Sequence[float] = ()
+
+
+def _init_sampling_worker(weights: Sequence[float], cumulative: Sequence[float]) -> None:
+    global _worker_weights, _worker_cumulative
+    _worker_weights = weights
+    _worker_cumulative = cumulative
+
+
+def _sample_partition_task(task: Tuple[int, int, int, int]) -> List[Tuple[int, int]]:
+    lo, hi, count, partition_seed = task
+    return _sample_partition(lo, hi, count, _worker_weights, _worker_cumulative, random.Random(partition_seed))
+
+
+def _partition_edge_counts(weights: Sequence[float], cumulative: Sequence[float],
+                           partitions: Sequence[Tuple[int, int]], num_conflicts: int) -> List[int]:
+    """
+    Splits `num_conflicts` across the partitions in proportion to their pair mass using largest remainders,
+    never giving a partition more edges than it has vertex pairs.
+    """
+    num_vertices = len(weights)
+    total = cumulative[num_vertices]
+    masses = []
+    capacities = []
+    for lo, hi in partitions:
+        masses.append(sum(weights[u] * (total - cumulative[u + 1]) for u in range(lo, hi)))
+        capacities.append(sum(num_vertices - 1 - u for u in range(lo, hi)))
+
+    counts = [0] * len(partitions)
+    remaining = num_conflicts
+    open_partitions = [p for p in range(len(partitions)) if capacities[p] > 0]
+
+    while remaining > 0 and open_partitions:
+        open_mass = sum(masses[p] for p in open_partitions)
+        shares = {p: remaining * masses[p] / open_mass for p in open_partitions}
+
+        given = 0
+        for p in open_partitions:
+            grant = min(int(shares[p]), capacities[p] - counts[p])
+            counts[p] += grant
+            given += grant
+
+        by_remainder = sorted(open_partitions, key=lambda p: (shares[p] - int(shares[p]), -p), reverse=True)
+        for p in by_remainder:
+            if given == remaining:
+                break
+            if counts[p] < capacities[p]:
+                counts[p] += 1
+                given += 1
+
+        remaining -= given
+        open_partitions = [p for p in open_partitions if counts[p] < capacities[p]]
+
+    return counts
+
+
+def _sample_partition(lo: int, hi: int, count: int, weights: Sequence[float], cumulative: Sequence[float],
+                      rng: random.Random) -> List[Tuple[int, int]]:
+    """
+    Samples `count` distinct edges (u, v), lo <= u < hi and u < v, with probability proportional to
+    weights[u] * weights[v], using the random stream `rng`.
+    """
+    num_vertices = len(weights)
+    total = cumulative[num_vertices]
+    lower_weights = list(accumulate(weights[u] * (total - cumulative[u + 1]) for u in range(lo, hi)))
+
+    edges: List[Tuple[int, int]] = []
+    existing_edges = set()
+    while len(edges) < count:
+        u = lo + min(bisect_right(lower_weights, rng.random() * lower_weights[-1]), hi - lo - 1)
+        if u >= num_vertices - 1:
+            continue
+
+        start = cumulative[u + 1]
+        target = start + rng.random() * (total - start)
+        v = min(max(bisect_right(cumulative, target) - 1, u + 1), num_vertices - 1)
+
+        if (u, v) not in existing_edges:
+            existing_edges.add((u, v))
+            edges.append((u, v))
+
+    return edges
+
+
+def build_graph_from_chunks(num_vertices: int, chunks: Iterator[EdgeChunk]) -> Graph:
+    """
+    Builds an in-memory graph from a stream of vertex-partitioned edge chunks.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        chunks (Iterator[EdgeChunk]): The edge chunks, for example from one of the `stream_*` generators.
+
+    Returns:
+        A graph object holding every streamed edge.
+    """
+    graph = Graph(num_vertices)
+    for _, _, edges in chunks:
+        for u, v in edges:
+            graph.add_edge(u, v)
+    return graph
@@ -31,7 +31,6 @@ def generate_uniform_random_graph(num_vertices, num_conflicts) -> Graph:
         if v1 != v2:
             if (v1, v2) not in existing_edges and (v2, v1) not in existing_edges:
                 graph.add_edge(v1, v2)
-                graph.add_edge(v2, v1)
                 existing_edges.add((v1, v2))
                 existing_edges.add((v2, v1))
                 existing_edge_count += 1
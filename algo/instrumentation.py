@@ -0,0 +1,346 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+
+class PhaseTimers:
+    """
+    A registry of named run phases. Parsing, graph construction, every ordering, the coloring and the clique search
+    each run inside a phase, and when the registry is enabled every phase records how often it ran and for how long,
+    and optionally the peak of the memory traced by tracemalloc and a cProfile profile.
+
+    Disabled, entering a phase costs one attribute check, so the phases stay in the code for every run. Phases may
+    nest: the time and memory of a phase include its nested phases, while its profile leaves them out, as cProfile
+    runs one profiler at a time. While the TRACER is enabled every phase is also traced as a span, whether or not
+    the registry is enabled.
+
+    The registry is process-wide and meant for single-threaded runs such as the CLI commands.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.profile = False
+        self.trace_memory = False
+        self.records: Dict[str, Dict[str, Union[int, float, None]]] = {}
+        self.profiles = {}
+        self._stack: List["_Phase"] = []
+
+    def enable(self, profile: bool = False, trace_memory: bool = False) -> None:
+        """
+        Starts recording phases, optionally with a cProfile profile and the tracemalloc peak of every phase.
+        """
+        self.enabled = True
+        self.profile = profile
+        self.trace_memory = trace_memory
+        if trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def disable(self) -> None:
+        """
+        Stops recording phases. What was recorded is kept until `reset`.
+        """
+        if self.trace_memory:
+            import tracemalloc
+
+            tracemalloc.stop()
+        self.enabled = False
+        self.profile = False
+        self.trace_memory = False
+
+    def reset(self) -> None:
+        self.records = {}
+        self.profiles = {}
+
+    def phase(self, name: str):
+        """
+        Returns a context manager running its block as the phase `name`.
+        """
+        return _Phase(self, name) if self.enabled or TRACER.enabled else _NO_PHASE
+
+    def timed(self, name: str) -> Callable[[Callable], Callable]:
+        """
+        Decorates a function to run as the phase `name`.
+        """
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled and not TRACER.enabled:
+                    return function(*args, **kwargs)
+                with _Phase(self, name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def report(self) -> Dict[str, Dict[str, Union[int, float, None]]]:
+        """
+        Returns, for every phase that ran, the number of calls, the total time in seconds and, when tracing memory,
+        the highest traced memory in bytes, in the order the phases first ran.
+        """
+        return {name: dict(record) for name, record in self.records.items()}
+
+    def write_profiles(self, prefix: str) -> List[str]:
+        """
+        Writes the profile of every phase to a pstats file named `PREFIX.PHASE.pstats`, readable by `pstats.Stats`
+        and tools such as snakeviz.
+
+        Returns:
+            List[str]: The paths of the written files.
+        """
+        paths = []
+        for name, profiler in self.profiles.items():
+            path = f"{prefix}.{name}.pstats"
+            profiler.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+class _Phase:
+    __slots__ = ("timers", "name", "start_time", "peak_memory", "profiler")
+
+    def __init__(self, timers: PhaseTimers, name: str) -> None:
+        self.timers = timers
+        self.name = name
+        self.peak_memory = 0
+        self.profiler = None
+
+    def __enter__(self) -> "_Phase":
+        timers = self.timers
+        parent = timers._stack[-1] if timers._stack else None
+        if timers.trace_memory:
+            import tracemalloc
+
+            # The peak is reset for this phase, so the parent keeps the peak it reached so far
+            if parent is not None:
+                parent.peak_memory = max(parent.peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if timers.profile:
+            import cProfile
+
+            if parent is not None and parent.profiler is not None:
+                parent.profiler.disable()
+            self.profiler = timers.profiles.get(self.name)
+            if self.profiler is None:
+                self.profiler = timers.profiles[self.name] = cProfile.Profile()
+            self.profiler.enable()
+        timers._stack.append(self)
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        end_time = time.perf_counter()
+        elapsed = end_time - self.start_time
+        if TRACER.enabled:
+            TRACER.complete(self.name, self.start_time, end_time)
+        timers = self.timers
+        timers._stack.pop()
+        if not timers.enabled:
+            return
+        parent = timers._stack[-1] if timers._stack else None
+        if self.profiler is not None:
+            self.profiler.disable()
+            if parent is not None and parent.profiler is not None:
+                parent.profiler.enable()
+
+        record = timers.records.get(self.name)
+        if record is None:
+            record = timers.records[self.name] = {"calls": 0, "time": 0.0, "peak_memory": None}
+        record["calls"] += 1
+        record["time"] += elapsed
+        if timers.trace_memory:
+            import tracemalloc
+
+            peak = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+            record["peak_memory"] = max(record["peak_memory"] or 0, peak)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+DEFAULT_SAMPLE_INTERVAL = 1024
+
+
+class Tracer:
+    """
+    Collects spans, counters and instant events of a run and exports them as Chrome trace-event JSON, which Perfetto
+    and chrome://tracing display on a timeline.
+
+    The phases of the PhaseTimers show up as spans. Inside the hot loops, the orderings, the coloring and the clique
+    search read `enabled` and `sample_interval` into locals once and emit a counter every `sample_interval`
+    iterations, so a disabled tracer costs them one test of a local per iteration.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.sample_interval = DEFAULT_SAMPLE_INTERVAL
+        self.events: List[Dict] = []
+        self._origin = time.perf_counter()
+
+    def enable(self, sample_interval: int = DEFAULT_SAMPLE_INTERVAL) -> None:
+        """
+        Starts collecting events, sampling the hot loops every `sample_interval` iterations. Event timestamps count
+        from this call.
+        """
+        assert sample_interval >= 1, "The sample interval must be positive"
+        self.enabled = True
+        self.sample_interval = sample_interval
+        self._origin = time.perf_counter()
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.events = []
+
+    def span(self, name: str, **args):
+        """
+        Returns a context manager tracing its block as a span named `name`, with `args` shown on the span.
+        """
+        return _Span(self, name, args) if self.enabled else _NO_PHASE
+
+    def complete(self, name: str, start_time: float, end_time: float, args: Optional[Dict] = None) -> None:
+        """
+        Records a span between two `time.perf_counter` values.
+        """
+        self._append({"name": name, "ph": "X", "ts": self._microseconds(start_time),
+                      "dur": (end_time - start_time) * 1e6}, args)
+
+    def counter(self, name: str, **values: float) -> None:
+        """
+        Records the current values of a counter track, one line per value.
+        """
+        self._append({"name": name, "ph": "C", "ts": self._microseconds(time.perf_counter())}, values)
+
+    def instant(self, name: str, **args) -> None:
+        """
+        Records a point in time, such as the moment the terminal clique is found.
+        """
+        self._append({"name": name, "ph": "i", "s": "t", "ts": self._microseconds(time.perf_counter())}, args)
+
+    def _microseconds(self, timestamp: float) -> float:
+        return (timestamp - self._origin) * 1e6
+
+    def _append(self, event: Dict, args: Optional[Dict]) -> None:
+        event["pid"] = os.getpid()
+        event["tid"] = threading.get_ident()
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def write_chrome_trace(self, filename: str) -> None:
+        """
+        Writes the collected events to a Chrome trace-event JSON file.
+
+        Args:
+            filename (str): The path to the file to which the trace will be written.
+        """
+        with open(filename, "w") as file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, file)
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start_time")
+
+    def __init__(self, tracer: Tracer, name: str, args: Dict) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.tracer.complete(self.name, self.start_time, time.perf_counter(), self.args)
+
+
+# The tracer the library code emits its spans and samples into
+TRACER = Tracer()
+
+# The registry the library code records its phases in
+PHASES = PhaseTimers()
+phase = PHASES.phase
+timed = PHASES.timed
+
+
+OPERATION_COUNTERS = ["vertex_scans", "degree_lookups", "neighbor_visits", "degree_updates", "color_probes"]
+
+
+def operation_counts() -> Dict[str, int]:
+    """
+    Returns a zeroed set of the work counters the orderings and the coloring keep when asked to count operations.
+    """
+    return dict.fromkeys(OPERATION_COUNTERS, 0)
+
+
+class CountingGraph:
+    """
+    Wraps a graph and counts the degree lookups and neighbor visits made through it into `counts`. The orderings and
+    the coloring swap it in for their graph when counting operations, so the plain runs pay nothing for the counters.
+    A neighbor counts as visited when the caller takes it, so a search that stops early counts only what it saw.
+    """
+
+    def __init__(self, graph, counts: Dict[str, int]) -> None:
+        self.graph = graph
+        self.counts = counts
+        self.V = graph.V
+
+    def vertices(self) -> List[int]:
+        return self.graph.vertices()
+
+    def edges(self):
+        return self.graph.edges()
+
+    def edge_exists(self, u, v):
+        return self.graph.edge_exists(u, v)
+
+    def degree(self, vertex):
+        self.counts["degree_lookups"] += 1
+        return self.graph.degree(vertex)
+
+    def neighbors(self, vertex):
+        counts = self.counts
+        for neighbor in self.graph.neighbors(vertex):
+            counts["neighbor_visits"] += 1
+            yield neighbor
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """
+    Returns the peak resident set size of this process in bytes, or None where the platform does not report it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_metrics_json(metrics: Dict[str, Union[str, int, float, None]], filename: str) -> None:
+    """
+    Writes the metrics of a run to a JSON file, one object with a key per metric. Times are in seconds.
+
+    Args:
+        metrics (Dict[str, Union[str, int, float, None]]): The metrics of the run.
+        filename (str): The path to the file to which the metrics will be written.
+    """
+    with open(filename, "w") as file:
+        json.dump(metrics, file, indent=2)
+        file.write("\n")
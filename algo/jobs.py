@@ -0,0 +1,430 @@
+import hashlib
+import heapq
+import itertools
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from algo.coloring.greedy import greedy_coloring
+from algo.registry import ORDERINGS
+
+# Priority classes, lowest rank first. Jobs of the same class run in the order they were submitted.
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+DEFAULT_MAX_PENDING = 1024
+
+# How many recent jobs the latency metrics are computed over
+LATENCY_WINDOW = 1024
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class JobDeadlineExceeded(TimeoutError):
+    pass
+
+
+def graph_fingerprint(graph) -> str:
+    """
+    Returns a digest of the vertex count and the distinct neighbors of every vertex, so the same graph gets the same
+    fingerprint whatever type holds it and in whatever order its adjacency lists are.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array("q", [graph.V]).tobytes())
+    for v in range(graph.V):
+        neighbors = sorted(set(graph.neighbors(v)))
+        digest.update(array("q", [len(neighbors)] + neighbors).tobytes())
+    return digest.hexdigest()
+
+
+def order_and_color(graph, ordering: str) -> Dict[str, Union[int, float, List[int], None]]:
+    """
+    Orders and colors a graph. This is the function the job queue runs in its worker processes.
+    """
+    start_time = time.perf_counter()
+    order, meta = ORDERINGS[ordering](graph)
+    ordering_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    coloring = greedy_coloring(graph, order)
+    coloring_time = time.perf_counter() - start_time
+
+    colors = [coloring[v] for v in range(graph.V)]
+    return {
+        "colors_used": len(set(colors)),
+        "coloring": colors,
+        "terminal_clique_size": meta.get("terminal_clique_size"),
+        "degeneracy": meta.get("degeneracy"),
+        "ordering_time": ordering_time,
+        "coloring_time": coloring_time,
+    }
+
+
+class _SharedJob:
+    """
+    The work queued for one graph and ordering, shared by every `Job` submitted for it while it waits.
+    """
+
+    def __init__(self, graph, ordering: str, fingerprint: str, priority: str) -> None:
+        self.graph = graph
+        self.ordering = ordering
+        self.fingerprint = fingerprint
+        self.priority = priority
+        # The submitters that still want the result
+        self.submitters: List["Job"] = []
+        self.future: Future = Future()
+        self.submit_time = time.monotonic()
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.fingerprint, self.ordering
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        The latest deadline of the submitters, after which none of them wants the result, or None if one of them has
+        no deadline.
+        """
+        deadlines = [job.deadline for job in self.submitters]
+        return None if not deadlines or None in deadlines else max(deadlines)
+
+
+class Job:
+    """
+    One submitter's handle on a queued ordering and coloring of a graph. Submitting the same graph and ordering again
+    while the work is still waiting shares that work, but every submitter keeps its own deadline and can cancel only
+    its own interest in the result.
+    """
+
+    def __init__(self, queue: "JobQueue", shared: _SharedJob, deadline: Optional[float]) -> None:
+        self._queue = queue
+        self._shared = shared
+        # Absolute time.monotonic() value, or None for no deadline
+        self.deadline = deadline
+        self._cancelled = False
+        shared.submitters.append(self)
+
+    @property
+    def ordering(self) -> str:
+        return self._shared.ordering
+
+    @property
+    def fingerprint(self) -> str:
+        return self._shared.fingerprint
+
+    @property
+    def priority(self) -> str:
+        return self._shared.priority
+
+    def result(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Waits for the job, at most `timeout` seconds and never past the deadline, and returns the result of
+        `order_and_color`.
+
+        Raises:
+            concurrent.futures.CancelledError: If the job was cancelled.
+            JobDeadlineExceeded: If the job did not finish before its deadline.
+            TimeoutError: If the job did not finish within `timeout` seconds.
+        """
+        if self._cancelled:
+            raise CancelledError()
+        remaining = self.deadline - time.monotonic() if self.deadline is not None else None
+        if remaining is not None and (timeout is None or remaining <= timeout):
+            try:
+                result = self._shared.future.result(max(remaining, 0))
+            except JobDeadlineExceeded:
+                raise
+            except FutureTimeoutError:
+                raise JobDeadlineExceeded("The job did not finish before its deadline") from None
+        else:
+            result = self._shared.future.result(timeout)
+        if self.deadline is not None and self._shared.end_time > self.deadline:
+            raise JobDeadlineExceeded("The job did not finish before its deadline")
+        return result
+
+    def cancel(self) -> bool:
+        """
+        Withdraws this submitter from the job if the job has not started yet, and cancels the job once no submitter is
+        left. Returns whether this submitter was withdrawn.
+        """
+        with self._queue._condition:
+            if self._cancelled:
+                return True
+            if not self._queue._is_waiting(self._shared):
+                return False
+            self._cancelled = True
+            self._shared.submitters.remove(self)
+            if not self._shared.submitters:
+                return self._shared.future.cancel()
+            # The job's deadline may have come forward
+            self._queue._condition.notify_all()
+            return True
+
+    def done(self) -> bool:
+        return self._cancelled or self._shared.future.done()
+
+
+class JobQueue:
+    """
+    Schedules ordering and coloring jobs on a pool of worker processes.
+
+    At most `max_pending` jobs wait in the queue; submitting to a full queue blocks or fails, which pushes back on the
+    producers instead of piling work up in memory. Waiting jobs are started by priority class, then in submission
+    order, and no more jobs are handed to the pool than it has workers, so a high priority job never waits behind a
+    backlog already sitting in the pool.
+
+    A job that has not finished by its deadline fails with JobDeadlineExceeded for that submitter, whose `result`
+    stops waiting then. Work still waiting is dropped without running once every submitter's deadline has passed; a
+    running job cannot be interrupted, so it runs to completion and its result is discarded.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = DEFAULT_MAX_PENDING,
+                 executor: Optional[Executor] = None, function: Callable = order_and_color) -> None:
+        assert max_pending >= 1, "The queue must hold at least one job"
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=self.workers)
+        self.function = function
+
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[int, int, _SharedJob]] = []
+        self._sequence = itertools.count()
+        # The waiting jobs by (fingerprint, ordering); a job is in the heap but not here once it has started
+        self._queued: Dict[Tuple[str, str], _SharedJob] = {}
+        self._running = 0
+        self._closed = False
+
+        self._counts = dict.fromkeys(["submitted", "coalesced", "completed", "failed", "cancelled", "expired"], 0)
+        self._max_depth = 0
+        self._wait_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._total_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+        self._dispatcher = threading.Thread(target=self._dispatch, name="job-queue-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, graph, ordering: str, priority: str = "normal", deadline: Optional[float] = None,
+               fingerprint: Optional[str] = None, block: bool = True, timeout: Optional[float] = None) -> Job:
+        """
+        Queues an ordering and coloring of a graph.
+
+        If a job for the same graph and ordering is still waiting, no new job is queued: the waiting job is shared,
+        raised to the higher of the two priorities, and kept until the latest of its submitters' deadlines.
+
+        Args:
+            graph: The graph to color. It is pickled to the worker process, so a CSRGraph is the cheapest to send.
+            ordering (str): The name of the ordering, a key of ORDERINGS.
+            priority (str): The priority class, a key of PRIORITIES.
+            deadline (Optional[float]): Seconds from now by which the job must finish, or None for no deadline.
+            fingerprint (Optional[str]): The `graph_fingerprint` of the graph, if the caller has it cached.
+            block (bool): Wait for room when the queue is full instead of failing at once.
+            timeout (Optional[float]): The longest to wait for room, or None to wait as long as it takes.
+
+        Returns:
+            Job: This submitter's handle on the queued job.
+
+        Raises:
+            ValueError: If the ordering or the priority is unknown.
+            QueueFullError: If the queue is full and stays full for `timeout` seconds, or at once if not `block`.
+            RuntimeError: If the queue is closed.
+        """
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Invalid ordering method: {ordering}")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Invalid priority: {priority}")
+        if fingerprint is None:
+            fingerprint = graph_fingerprint(graph)
+        key = (fingerprint, ordering)
+        deadline_time = time.monotonic() + deadline if deadline is not None else None
+        wait_until = time.monotonic() + timeout if timeout is not None else None
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The job queue is closed")
+
+                shared = self._queued.get(key)
+                if shared is not None:
+                    return self._coalesce(shared, priority, deadline_time)
+
+                if len(self._queued) < self.max_pending:
+                    break
+                remaining = wait_until - time.monotonic() if wait_until is not None else None
+                if not block or (remaining is not None and remaining <= 0):
+                    raise QueueFullError(f"The job queue is full ({self.max_pending} jobs waiting)")
+                self._condition.wait(remaining)
+
+            shared = _SharedJob(graph, ordering, fingerprint, priority)
+            shared.future.add_done_callback(lambda future: self._on_cancel(shared) if future.cancelled() else None)
+            job = Job(self, shared, deadline_time)
+            self._queued[key] = shared
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._sequence), shared))
+            self._counts["submitted"] += 1
+            self._max_depth = max(self._max_depth, len(self._queued))
+            self._condition.notify_all()
+            return job
+
+    def _coalesce(self, shared: _SharedJob, priority: str, deadline: Optional[float]) -> Job:
+        job = Job(self, shared, deadline)
+        self._counts["coalesced"] += 1
+        if PRIORITIES[priority] < PRIORITIES[shared.priority]:
+            # The old heap entry goes stale and is skipped when it comes up
+            shared.priority = priority
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._sequence), shared))
+        self._condition.notify_all()
+        return job
+
+    def _is_waiting(self, shared: _SharedJob) -> bool:
+        return self._queued.get(shared.key) is shared
+
+    def _on_cancel(self, job: _SharedJob) -> None:
+        with self._condition:
+            if self._is_waiting(job):
+                del self._queued[job.key]
+            self._counts["cancelled"] += 1
+            self._condition.notify_all()
+
+    def _next_job(self) -> Optional[_SharedJob]:
+        """
+        Waits for a free worker and a waiting job and takes the job off the queue, expiring the waiting jobs whose
+        deadline passes in the meantime. Returns None once the queue is closed and drained.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                expired = [job for job in self._queued.values() if job.deadline is not None and job.deadline <= now]
+                if expired:
+                    for job in expired:
+                        del self._queued[job.key]
+                    self._condition.notify_all()
+                    # Failing the futures runs their callbacks, which must not find the queue locked
+                    self._condition.release()
+                    try:
+                        expired = [job for job in expired if job.future.set_running_or_notify_cancel()]
+                        for job in expired:
+                            job.future.set_exception(JobDeadlineExceeded("The job did not start before its deadline"))
+                    finally:
+                        self._condition.acquire()
+                    self._counts["expired"] += len(expired)
+                    continue
+
+                if self._running < self.workers:
+                    while self._heap:
+                        rank, _, job = heapq.heappop(self._heap)
+                        if self._is_waiting(job) and PRIORITIES[job.priority] == rank:
+                            del self._queued[job.key]
+                            self._running += 1
+                            self._condition.notify_all()
+                            return job
+                if self._closed and not self._queued:
+                    return None
+
+                deadlines = [job.deadline for job in self._queued.values() if job.deadline is not None]
+                self._condition.wait(max(min(deadlines) - now, 0) if deadlines else None)
+
+    def _dispatch(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                self._release_worker()
+                continue
+
+            job.start_time = time.monotonic()
+            with self._condition:
+                self._wait_times.append(job.start_time - job.submit_time)
+            try:
+                worker = self.executor.submit(self.function, job.graph, job.ordering)
+            except Exception as error:
+                self._finish(job, error=error)
+                continue
+            worker.add_done_callback(lambda worker, job=job: self._finish(job, worker=worker))
+
+    def _release_worker(self) -> None:
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def _finish(self, job: _SharedJob, worker: Optional[Future] = None, error: Optional[BaseException] = None) -> None:
+        job.end_time = time.monotonic()
+        if worker is not None:
+            error = worker.exception()
+        if error is None and job.deadline is not None and job.end_time > job.deadline:
+            error = JobDeadlineExceeded("The job did not finish before its deadline")
+
+        with self._condition:
+            self._running -= 1
+            if isinstance(error, JobDeadlineExceeded):
+                self._counts["expired"] += 1
+            else:
+                self._counts["failed" if error is not None else "completed"] += 1
+            self._run_times.append(job.end_time - job.start_time)
+            self._total_times.append(job.end_time - job.submit_time)
+            self._condition.notify_all()
+
+        # The graph is no longer needed, and the job may be kept around by its submitters' handles
+        job.graph = None
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(worker.result())
+
+    def metrics(self) -> Dict[str, Union[int, Dict[str, float]]]:
+        """
+        Returns the current queue depth and running jobs, the deepest the queue has been, how many jobs were
+        submitted, coalesced, completed, failed, cancelled and expired, and summaries of the time recent jobs spent
+        waiting, running and in total, in seconds.
+        """
+        with self._condition:
+            return {
+                "queue_depth": len(self._queued),
+                "max_queue_depth": self._max_depth,
+                "running": self._running,
+                "workers": self.workers,
+                **self._counts,
+                "wait_time": _latency_summary(self._wait_times),
+                "run_time": _latency_summary(self._run_times),
+                "total_time": _latency_summary(self._total_times),
+            }
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stops taking jobs. With `wait`, runs the jobs already queued and waits for them, otherwise cancels them.
+        """
+        with self._condition:
+            self._closed = True
+            queued = list(self._queued.values())
+            self._condition.notify_all()
+        if not wait:
+            for job in queued:
+                job.future.cancel()
+        self._dispatcher.join()
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _latency_summary(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        "max": ordered[-1],
+    }
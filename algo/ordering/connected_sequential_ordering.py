@@ -1,9 +1,12 @@
 from typing import List, Tuple, Dict, Union
+from algo.instrumentation import CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
-from time import time
+from time import perf_counter
 
 
-def connected_sequential_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
+@timed("ordering.connected_sequential")
+def connected_sequential_ordering(graph: Graph, count_operations: bool = False) -> \
+    Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
     """
     Orders the vertices of a graph in a connected sequential ordering.
 
@@ -14,12 +17,17 @@ def connected_sequential_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Un
 
     Args:
     graph (Graph): An instance of the Graph class representing the input graph.
+    count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
  Returns:
         Tuple[List[int], Dict[str, Union[str, int, float]]]: A tuple containing a list of vertex indices representing
         the connected sequential ordering of the vertices, and a dictionary of metadata.
     """
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     visited = set()
     ordering = []
@@ -44,13 +52,18 @@ def connected_sequential_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Un
                         highest_degree_vertex = v
                         highest_degree = graph.degree(v)
 
+        if counts is not None:
+            counts["vertex_scans"] += graph.V
+
         visited.add(highest_degree_vertex)
         ordering.append(highest_degree_vertex)
 
-    end_time = time()
+    end_time = perf_counter()
 
     meta = {}
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
 
 
     return ordering, meta
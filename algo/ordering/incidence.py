@@ -1,9 +1,12 @@
+from algo.instrumentation import CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
 from typing import List, Tuple, Dict, Union
-from time import time
+from time import perf_counter
 
 
-def incidence_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
+@timed("ordering.incidence")
+def incidence_ordering(graph: Graph, count_operations: bool = False) -> \
+    Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
     """
     This function computes the incidence degree ordering of the given graph.
 
@@ -13,12 +16,17 @@ def incidence_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Di
 
     Args:
         graph (Graph): The input graph for which the incidence degree ordering will be computed.
+        count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
     Returns:
         Tuple[List[int], Dict[str, Union[str, int, float]]]: A tuple containing a list of vertex indices representing
         the ordering of the vertices, and a dictionary of metadata.
     """
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     ordering = []
     remaining_vertices = set(graph.vertices())
@@ -35,13 +43,18 @@ def incidence_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Di
                 min_incidence_degree = vertex_degree
                 selected_vertex = vertex
 
+        if counts is not None:
+            counts["vertex_scans"] += len(remaining_vertices)
+
         remaining_vertices.remove(selected_vertex)
         ordering.append(selected_vertex)
 
-    end_time = time()
+    end_time = perf_counter()
 
     meta = {}
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
 
 
     return ordering, meta
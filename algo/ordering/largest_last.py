@@ -1,9 +1,12 @@
+from algo.instrumentation import CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
 from typing import List, Tuple, Dict, Union
-from time import time
+from time import perf_counter
 
 
-def largest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
+@timed("ordering.largest_last")
+def largest_last_vertex_ordering(graph: Graph, count_operations: bool = False) -> \
+    Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
     """
     This function computes the largest vertex last ordering of the given graph. In this ordering, vertices are sorted
     in ascending order based on their degree, but starting with the vertex of the largest degree. The purpose of this
@@ -11,13 +14,18 @@ def largest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Uni
 
     Args:
         graph (Graph): The input graph for which the largest vertex last ordering will be computed.
+        count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
     Returns:
         Tuple[List[int], Dict[str, Union[str, int, float]]]: A tuple containing a list of vertex indices representing
         the ordering of the vertices, and a dictionary of metadata.
     """
 
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     ordering = []
 
@@ -34,12 +42,17 @@ def largest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Uni
                 max_degree = degree
                 max_vertex = idx
 
+        if counts is not None:
+            counts["vertex_scans"] += graph.V
+
         ordering.append(max_vertex)
 
-    end_time = time()
+    end_time = perf_counter()
 
     meta = {}
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
 
 
     return ordering, meta
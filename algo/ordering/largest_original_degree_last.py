@@ -1,10 +1,12 @@
+from algo.instrumentation import CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
 from typing import List, Tuple, Dict, Union
-from time import time
+from time import perf_counter
 
 
 
-def largest_original_degree_last_vertex_ordering(graph: Graph) -> \
+@timed("ordering.largest_original_degree_last")
+def largest_original_degree_last_vertex_ordering(graph: Graph, count_operations: bool = False) -> \
     Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
     """
     This function computes the largest original degree last ordering of the given graph.
@@ -17,13 +19,18 @@ def largest_original_degree_last_vertex_ordering(graph: Graph) -> \
 
     Args:
         graph (Graph): The input graph for which the largest original degree last ordering will be computed.
+        count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
     Returns:
         Tuple[List[int], Dict[str, Union[str, int, float]]]: A tuple containing a list of vertex indices representing
         the ordering of the vertices, and a dictionary of metadata.
     """
 
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     # Initialize an empty list for the final ordering
     ordering = []
@@ -41,13 +48,19 @@ def largest_original_degree_last_vertex_ordering(graph: Graph) -> \
         # Find the vertex with the largest label among the max_degree_vertices
         max_vertex = max(max_degree_vertices)
 
+        if counts is not None:
+            # One scan for the maximum degree and one for the vertices having it
+            counts["vertex_scans"] += 2 * graph.V
+
         # Add the selected vertex to the beginning of the ordering
         ordering.insert(0, max_vertex)
 
-    end_time = time()
+    end_time = perf_counter()
 
     meta = {}
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
 
 
     return ordering, meta
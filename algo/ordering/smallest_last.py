@@ -1,8 +1,12 @@
+from algo.instrumentation import TRACER, CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
-from typing import Dict, List, Tuple, Union
-from time import time
+from array import array
+from typing import Dict, List, Sequence, Tuple, Union
+from time import perf_counter
 
-def smallest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
+@timed("ordering.smallest_last")
+def smallest_last_vertex_ordering(graph: Graph, count_operations: bool = False) -> \
+    Tuple[List[int], Dict[str, Union[int, List[int], array]]]:
     """
     This function computes the smallest last vertex ordering of the given graph.
 
@@ -11,8 +15,17 @@ def smallest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Un
     and the process is repeated until all vertices have been ordered.
     The purpose of this ordering is to prioritize vertices with lower degrees at the end of the ordering.
 
+    The terminal clique is detected while peeling: once the smallest degree equals the number of remaining vertices
+    minus one, every remaining vertex is adjacent to all the others, so the remaining vertices form a clique and make
+    up the tail of the ordering. Its members, its size and the degeneracy (the largest deleted degree) are returned in
+    the metadata. The graph is assumed to have no parallel edges.
+
+    The degree of every vertex at the time it was deleted is returned as `deleted_degrees`, a compact int array
+    indexed by vertex. `deleted_degree_summary` condenses it into histograms.
+
     Args:
         graph (Graph): The input graph for which the smallest last vertex ordering will be computed.
+        count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
 
     Returns:
@@ -20,12 +33,20 @@ def smallest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Un
         the ordering of the vertices, and a dictionary of metadata.
     """
 
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     remaining_vertices = set(graph.vertices())
     degrees = [graph.degree(vertex) for vertex in graph.vertices()]
     ordering = []
-    deleted_degrees = {}
+    deleted_degrees = array("i", [0]) * graph.V
+    degeneracy = 0
+    clique_start = None
+    tracing = TRACER.enabled
+    interval = TRACER.sample_interval
 
     while remaining_vertices:
         # Find the vertex with the smallest degree
@@ -36,18 +57,87 @@ def smallest_last_vertex_ordering(graph: Graph) -> Tuple[List[int], Dict[str, Un
                 min_degree = degrees[v]
                 min_vertex = v
 
+        if clique_start is None and min_degree == len(remaining_vertices) - 1:
+            clique_start = len(ordering)
+            if tracing:
+                TRACER.instant("terminal_clique", size=len(remaining_vertices))
+        if min_degree > degeneracy:
+            degeneracy = min_degree
+
+        if counts is not None:
+            counts["vertex_scans"] += len(remaining_vertices)
+            # The current degree of the deleted vertex is the number of its neighbors left to update
+            counts["degree_updates"] += min_degree
+
         # Remove the vertex from the graph and add it to the ordering
         remaining_vertices.remove(min_vertex)
         ordering.append(min_vertex)
         deleted_degrees[min_vertex] = min_degree
-        if graph.adj_list[min_vertex] is not None:
-            for node in graph.adj_list[min_vertex]:
-                neighbor = node.vertex
-                if neighbor in remaining_vertices:
-                    degrees[neighbor] -= 1
+        for neighbor in graph.neighbors(min_vertex):
+            if neighbor in remaining_vertices:
+                degrees[neighbor] -= 1
+
+        if tracing and len(ordering) % interval == 0:
+            TRACER.counter("smallest_last", remaining=len(remaining_vertices), deleted_degree=min_degree,
+                           degeneracy=degeneracy)
 
-    end_time = time()
+    end_time = perf_counter()
+
+    terminal_clique = ordering[clique_start:] if clique_start is not None else []
 
     meta = {'deleted_degrees': deleted_degrees}
+    meta['terminal_clique'] = terminal_clique
+    meta['terminal_clique_size'] = len(terminal_clique)
+    meta['degeneracy'] = degeneracy
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
     return ordering, meta
+
+
+def core_numbers(ordering: Sequence[int], deleted_degrees: Sequence[int]) -> array:
+    """
+    Returns the core number of every vertex, indexed by vertex. In a smallest last ordering it is the largest degree
+    deleted up to and including the vertex itself.
+
+    Args:
+        ordering (Sequence[int]): The smallest last ordering of the vertices.
+        deleted_degrees (Sequence[int]): The degree of every vertex when it was deleted, indexed by vertex.
+    """
+    cores = array("i", [0]) * len(deleted_degrees)
+    core = 0
+    for vertex in ordering:
+        if deleted_degrees[vertex] > core:
+            core = deleted_degrees[vertex]
+        cores[vertex] = core
+    return cores
+
+
+def deleted_degree_summary(ordering: Sequence[int], deleted_degrees: Sequence[int]) -> Dict[str, Union[int, List[int]]]:
+    """
+    Summarizes the deleted degrees of a smallest last ordering.
+
+    Args:
+        ordering (Sequence[int]): The smallest last ordering of the vertices.
+        deleted_degrees (Sequence[int]): The degree of every vertex when it was deleted, indexed by vertex.
+
+    Returns:
+        Dict[str, Union[int, List[int]]]: The largest deleted degree under `max_deleted_degree`, the number of vertices
+        deleted at each degree under `deleted_degree_histogram`, and the number of vertices of each core number under
+        `core_number_histogram`. Both histograms are lists indexed by degree.
+    """
+    max_deleted_degree = max(deleted_degrees, default=0)
+
+    degree_histogram = [0] * (max_deleted_degree + 1)
+    for degree in deleted_degrees:
+        degree_histogram[degree] += 1
+
+    core_histogram = [0] * (max_deleted_degree + 1)
+    for core in core_numbers(ordering, deleted_degrees):
+        core_histogram[core] += 1
+
+    return {
+        'max_deleted_degree': max_deleted_degree,
+        'deleted_degree_histogram': degree_histogram,
+        'core_number_histogram': core_histogram,
+    }
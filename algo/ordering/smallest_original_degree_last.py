@@ -1,9 +1,11 @@
+from algo.instrumentation import CountingGraph, operation_counts, timed
 from algo.structures.graph import Graph
 from typing import Dict, List, Tuple, Union
-from time import time
+from time import perf_counter
 
 
-def smallest_original_degree_last_vertex_ordering(graph: Graph) -> \
+@timed("ordering.smallest_original_degree_last")
+def smallest_original_degree_last_vertex_ordering(graph: Graph, count_operations: bool = False) -> \
     Tuple[List[int], Dict[str, Union[int, Dict[int, int]]]]:
     """
     This function computes the smallest original degree last ordering of the given graph.
@@ -16,13 +18,18 @@ def smallest_original_degree_last_vertex_ordering(graph: Graph) -> \
 
     Args:
         graph (Graph): The input graph for which the smallest original degree last ordering will be computed.
+        count_operations (bool): Count the work done into `meta['operation_counts']`, see `operation_counts`.
 
     Returns:
         Tuple[List[int], Dict[str, Union[str, int, float]]]: A tuple containing a list of vertex indices representing
         the ordering of the vertices, and a dictionary of metadata.
     """
 
-    start_time = time()
+    start_time = perf_counter()
+
+    counts = operation_counts() if count_operations else None
+    if counts is not None:
+        graph = CountingGraph(graph, counts)
 
     # Initialize an empty list for the final ordering
     ordering = []
@@ -44,15 +51,21 @@ def smallest_original_degree_last_vertex_ordering(graph: Graph) -> \
         # Find the vertex with the smallest label among the max_degree_vertices
         min_vertex = min(max_degree_vertices)
 
+        if counts is not None:
+            # One scan for the maximum degree and one for the vertices having it
+            counts["vertex_scans"] += 2 * len(remaining_vertices)
+
         # Add the selected vertex to the end of the ordering
         ordering.append(min_vertex)
 
         # Remove the selected vertex from the remaining_vertices set
         remaining_vertices.remove(min_vertex)
 
-    end_time = time()
+    end_time = perf_counter()
 
     meta = {}
     meta['ordering_time'] = end_time - start_time
+    if counts is not None:
+        meta['operation_counts'] = counts
 
     return ordering, meta
@@ -0,0 +1,67 @@
+from importlib import import_module
+from typing import Callable, Dict, Iterator, Mapping
+
+
+class LazyRegistry(Mapping[str, Callable]):
+    """
+    Maps method names to callables given as `"module:attribute"` paths and imports each module on the first lookup
+    of a name that lives in it. Listing the names or checking membership imports nothing, so the command line can
+    offer every method as a choice while only importing the ones a run uses.
+    """
+
+    def __init__(self, targets: Dict[str, str]) -> None:
+        self._targets = dict(targets)
+        self._loaded: Dict[str, Callable] = {}
+
+    def __getitem__(self, name: str) -> Callable:
+        if name not in self._loaded:
+            module, _, attribute = self._targets[name].partition(":")
+            self._loaded[name] = getattr(import_module(module), attribute)
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._targets
+
+    def target(self, name: str) -> str:
+        """
+        Returns the `"module:attribute"` path a name maps to, without importing it.
+        """
+        return self._targets[name]
+
+
+# Maps the name of every ordering accepted on the command line to its function.
+ORDERINGS = LazyRegistry({
+    'smallest_last': 'algo.ordering.smallest_last:smallest_last_vertex_ordering',
+    'smallest_original_degree_last':
+        'algo.ordering.smallest_original_degree_last:smallest_original_degree_last_vertex_ordering',
+    'largest_last': 'algo.ordering.largest_last:largest_last_vertex_ordering',
+    'largest_original_degree_last':
+        'algo.ordering.largest_original_degree_last:largest_original_degree_last_vertex_ordering',
+    'incidence': 'algo.ordering.incidence:incidence_ordering',
+    'connected_sequential': 'algo.ordering.connected_sequential_ordering:connected_sequential_ordering'
+})
+
+# Maps the name of every graph generator to the function building the whole graph in memory.
+GENERATORS = LazyRegistry({
+    'complete': 'algo.generation.complete:generate_complete_graph',
+    'power_law': 'algo.generation.power_law:generate_power_law_random_graph',
+    'uniform_random': 'algo.generation.uniform_random:generate_uniform_random_graph',
+    'skewed_random': 'algo.generation.skewed_random:generate_skewed_random_graph',
+    'cyclic': 'algo.generation.cyclic:generate_cyclic_graph',
+    'random_geometric': 'algo.generation.random_geometric:generate_random_geometric_graph'
+})
+
+# Maps the name of every generator that supports partitioned generation to its streaming function.
+STREAMING_GENERATORS = LazyRegistry({
+    'complete': 'algo.generation.streaming:stream_complete_graph',
+    'power_law': 'algo.generation.streaming:stream_power_law_random_graph',
+    'uniform_random': 'algo.generation.streaming:stream_uniform_random_graph',
+    'skewed_random': 'algo.generation.streaming:stream_skewed_random_graph',
+    'cyclic': 'algo.generation.streaming:stream_cyclic_graph'
+})
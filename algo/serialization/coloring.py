@@ -0,0 +1,96 @@
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Optional
+
+from algo.serialization.compression import open_graph_file
+from algo.serialization.graph import DEFAULT_WRITE_BUFFER_SIZE, write_blocks
+
+COLORING_MAGIC = b"COLR"
+COLORING_VERSION = 1
+
+# magic, version, padding, vertex count
+COLORING_HEADER = struct.Struct("<4sB3xq")
+
+# Colorings written to files with this extension use the binary format.
+BINARY_COLORING_EXTENSION = ".bin"
+
+UNCOLORED = -1
+
+
+def write_coloring_to_file(coloring: Dict[int, int], filename: str, buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+                           binary: Optional[bool] = None) -> None:
+    """
+    Writes a coloring to a file.
+
+    The text format has one `VERTEX_NUMBER,COLOR_NUMBER` line per vertex in the order of the coloring, handed to the
+    file in pre-joined blocks of about `buffer_size` characters. The binary format is a header with the magic bytes,
+    the format version and the vertex count V, followed by V little-endian int32 colors indexed by vertex, with -1 for
+    vertices missing from the coloring.
+
+    Args:
+        coloring (Dict[int, int]): The color of every vertex.
+        filename (str): The path to the file to which the coloring will be written.
+        buffer_size (int): How many characters to join into a single write of the text format.
+        binary (Optional[bool]): Write the binary format. Defaults to whether the filename ends in `.bin`.
+    """
+    if binary is None:
+        binary = os.path.splitext(filename)[1].lower() == BINARY_COLORING_EXTENSION
+
+    if binary:
+        num_vertices = max(coloring, default=-1) + 1
+        colors = array("i", [UNCOLORED]) * num_vertices
+        for vertex, color in coloring.items():
+            colors[vertex] = color
+        if sys.byteorder != "little":
+            colors.byteswap()
+        with open(filename, "wb") as file:
+            file.write(COLORING_HEADER.pack(COLORING_MAGIC, COLORING_VERSION, num_vertices))
+            colors.tofile(file)
+        return
+
+    with open_graph_file(filename, "w") as file:
+        write_blocks(file, (f"{vertex},{color}\n" for vertex, color in coloring.items()), buffer_size)
+
+
+def read_coloring_from_file(filename: str) -> Dict[int, int]:
+    """
+    Reads a coloring written by `write_coloring_to_file` in either format, detecting the binary format from its
+    magic bytes.
+
+    Args:
+        filename (str): The path to the file containing the coloring.
+
+    Returns:
+        Dict[int, int]: The color of every vertex.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file contains invalid data.
+    """
+    try:
+        with open(filename, "rb") as file:
+            head = file.read(COLORING_HEADER.size)
+            if head[:4] == COLORING_MAGIC:
+                _, version, num_vertices = COLORING_HEADER.unpack(head)
+                if version != COLORING_VERSION:
+                    raise ValueError(f"Unsupported coloring file version: {version}")
+                colors = array("i")
+                data = file.read()
+                if len(data) != colors.itemsize * num_vertices:
+                    raise ValueError("Input file is truncated or has trailing data")
+                colors.frombytes(data)
+                if sys.byteorder != "little":
+                    colors.byteswap()
+                return {vertex: color for vertex, color in enumerate(colors) if color != UNCOLORED}
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    coloring = {}
+    with open_graph_file(filename, "rb") as file:
+        for line in file.read().decode().splitlines():
+            if line.strip():
+                vertex, color = line.split(",")
+                coloring[int(vertex)] = int(color)
+    return coloring
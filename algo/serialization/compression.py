@@ -0,0 +1,151 @@
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import threading
+from typing import BinaryIO, Optional
+
+DEFAULT_DECOMPRESS_CHUNK_SIZE = 1 << 20
+DEFAULT_READ_AHEAD_DEPTH = 4
+
+# Maps a compression extension to the stdlib module that handles it.
+COMPRESSION_EXTENSIONS = {
+    ".gz": gzip,
+    ".bz2": bz2,
+    ".xz": lzma,
+}
+
+COMPRESSION_MAGIC = [
+    (b"\x1f\x8b", gzip),
+    (b"BZh", bz2),
+    (b"\xfd7zXZ\x00", lzma),
+]
+
+
+def compression_from_extension(filename: str):
+    """
+    Returns the stdlib compression module matching the extension of the given file, or None if it is uncompressed.
+    """
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def detect_compression(filename: str):
+    """
+    Returns the stdlib compression module the given file was compressed with, judging by its magic bytes, or None
+    if it is uncompressed.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+    """
+    with open(filename, "rb") as file:
+        head = file.read(6)
+    for magic, module in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return module
+    return None
+
+
+def strip_compression_extension(filename: str) -> str:
+    """
+    Removes a trailing compression extension, so `graph.col.gz` is treated as a `.col` file.
+    """
+    root, extension = os.path.splitext(filename)
+    return root if extension.lower() in COMPRESSION_EXTENSIONS else filename
+
+
+def open_graph_file(filename: str, mode: str, chunk_size: int = DEFAULT_DECOMPRESS_CHUNK_SIZE):
+    """
+    Opens a graph file, transparently compressing or decompressing it with gzip, bz2 or lzma.
+
+    When reading, the compression is detected from the magic bytes of the file, and compressed files are decompressed
+    on a background thread in chunks of `chunk_size` bytes. The stdlib decompressors release the GIL, so
+    decompression overlaps with parsing instead of needing a temporary file. When writing, the compression is
+    picked from the file extension.
+
+    Args:
+        filename (str): The path to the file.
+        mode (str): "rb" to read, or "w"/"wb" to write.
+        chunk_size (int): How many decompressed bytes to read ahead at a time.
+
+    Returns:
+        A file object for the graph file.
+
+    Raises:
+        FileNotFoundError: If the file is not found when reading.
+    """
+    if mode == "rb":
+        module = detect_compression(filename)
+        if module is None:
+            return open(filename, "rb")
+        return ReadAheadReader(module.open(filename, "rb"), chunk_size)
+
+    module = compression_from_extension(filename)
+    if module is None:
+        return open(filename, mode)
+    return module.open(filename, mode + "t" if mode == "w" else mode)
+
+
+class ReadAheadReader:
+    """
+    Wraps a binary file object and reads it ahead on a background thread, handing chunks to `read` through a
+    bounded queue so at most `depth` chunks are buffered.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = DEFAULT_DECOMPRESS_CHUNK_SIZE,
+                 depth: int = DEFAULT_READ_AHEAD_DEPTH) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._queue = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._done = False
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _fill(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self._file.read(self._chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except BaseException as error:
+            self._put(error)
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+                break
+            self._buffer = self._buffer + item if self._buffer else item
+
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._file.close()
+
+    def __enter__(self) -> "ReadAheadReader":
+        return self
+
+    def __exit__(self, *args) -> Optional[bool]:
+        self.close()
+        return None
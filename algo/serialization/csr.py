@@ -0,0 +1,244 @@
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from algo.serialization.edge_list import edge_list_vertex_count, iter_edge_list
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+CSR_MAGIC = b"CSRG"
+CSR_VERSION = 1
+
+# magic, version, neighbor typecode, padding, vertex count, edge count
+CSR_HEADER = struct.Struct("<4sBc2xqq")
+
+# How many half-edges are sorted in memory at a time by the external sort, 32 MiB of int64 keys
+DEFAULT_RUN_SIZE = 1 << 22
+# How many keys are read from a run, or neighbors written to the output, at a time
+MERGE_BLOCK_SIZE = 1 << 16
+# A half-edge (u, v) is packed into the int64 key u << 32 | v, so the external sort handles vertex ids below 2^31
+MAX_EXTERNAL_VERTICES = 1 << 31
+
+
+def write_csr_graph(graph: Union[Graph, CSRGraph], filename: str) -> None:
+    """
+    Writes the given graph to a file in the binary CSR format.
+
+    The file starts with a header holding the magic bytes, the format version, the typecode of the neighbor array,
+    the vertex count V and the edge count E. It is followed by V + 1 little-endian int64 offsets and the
+    concatenated neighbor lists.
+
+    Args:
+        graph (Union[Graph, CSRGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+
+    Raises:
+        ValueError: If the input graph is empty.
+    """
+
+    if graph.V == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    offsets = array("q", csr.offsets)
+    typecode = "i" if graph.V < 2 ** 31 else "q"
+    adjacency = array(typecode, csr.adjacency)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        adjacency.byteswap()
+
+    with open(filename, "wb") as file:
+        file.write(CSR_HEADER.pack(CSR_MAGIC, CSR_VERSION, typecode.encode(), graph.V, len(adjacency) // 2))
+        offsets.tofile(file)
+        adjacency.tofile(file)
+
+
+def read_csr_graph(filename: str) -> CSRGraph:
+    """
+    Reads a graph in the binary CSR format by memory-mapping the file.
+
+    The offsets and neighbor arrays are views straight into the mapped file, so loading does not copy or parse
+    anything and only the pages of the neighborhoods that are actually touched get read from disk.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+
+    Returns:
+        A CSRGraph backed by the memory-mapped file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file is not a valid CSR graph file.
+    """
+    try:
+        with open(filename, "rb") as file:
+            if file.seek(0, 2) < CSR_HEADER.size:
+                raise ValueError("Input file is not a CSR graph file")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    magic, version, typecode, num_vertices, num_edges = CSR_HEADER.unpack_from(buffer)
+    typecode = typecode.decode()
+    if magic != CSR_MAGIC or version != CSR_VERSION or typecode not in ("i", "q"):
+        buffer.close()
+        raise ValueError("Input file is not a CSR graph file")
+
+    offsets_start = CSR_HEADER.size
+    adjacency_start = offsets_start + 8 * (num_vertices + 1)
+    adjacency_end = adjacency_start + array(typecode).itemsize * 2 * num_edges
+    if len(buffer) != adjacency_end:
+        buffer.close()
+        raise ValueError("Input file is truncated or has trailing data")
+
+    if sys.byteorder != "little":
+        offsets = array("q", buffer[offsets_start:adjacency_start])
+        adjacency = array(typecode, buffer[adjacency_start:adjacency_end])
+        offsets.byteswap()
+        adjacency.byteswap()
+        buffer.close()
+        return CSRGraph(offsets, adjacency)
+
+    view = memoryview(buffer)
+    offsets = view[offsets_start:adjacency_start].cast("q")
+    adjacency = view[adjacency_start:adjacency_end].cast(typecode)
+    view.release()
+    return CSRGraph(offsets, adjacency, buffer=buffer)
+
+
+def write_csr_graph_from_edges(edges: Iterable[Tuple[int, int]], filename: str, num_vertices: Optional[int] = None,
+                               run_size: int = DEFAULT_RUN_SIZE, temp_dir: Optional[str] = None) -> None:
+    """
+    Writes a CSR graph file straight from a stream of undirected edges with an external-memory sort, so graphs whose
+    adjacency does not fit in memory can be converted and then memory-mapped with `read_csr_graph`.
+
+    Both half-edges of every edge are packed into int64 keys u << 32 | v and collected in runs of `run_size` keys.
+    Each run is sorted in memory and spilled to a temporary file, then the runs are merged with `heapq.merge` while
+    the neighbor array is streamed into the output file. Duplicate edges are dropped during the merge. Apart from one
+    run, only the V + 1 offsets are held in memory; they are written over their reserved space at the end.
+
+    Args:
+        edges (Iterable[Tuple[int, int]]): The edges of the graph, in any order and either direction.
+        filename (str): The path to the file to which the graph will be written.
+        num_vertices (Optional[int]): The number of vertices in the graph. Defaults to one more than the largest
+            vertex id.
+        run_size (int): How many half-edges to sort in memory at a time.
+        temp_dir (Optional[str]): The directory for the sorted runs. Defaults to the system temporary directory.
+
+    Raises:
+        ValueError: If the graph is empty or an edge is a self-loop or has an invalid vertex number.
+    """
+    assert run_size >= 2, "A run must hold at least one edge"
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        runs: List[Iterator[int]] = []
+        run = array("q")
+        max_vertex = -1
+        for u, v in edges:
+            if u == v:
+                raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+            if u > v:
+                u, v = v, u
+            if u < 0 or v >= MAX_EXTERNAL_VERTICES:
+                raise ValueError(f"Invalid vertex number: {u if u < 0 else v}")
+            if v > max_vertex:
+                max_vertex = v
+
+            run.append((u << 32) | v)
+            run.append((v << 32) | u)
+            if len(run) >= run_size:
+                runs.append(_spill_run(run, os.path.join(run_dir, f"{len(runs)}.run")))
+                run = array("q")
+
+        # The last run never needs to leave memory
+        runs.append(iter(sorted(run)))
+
+        if num_vertices is None:
+            num_vertices = max_vertex + 1
+        if num_vertices == 0:
+            raise ValueError("Cannot write an empty graph to a file")
+        if max_vertex >= num_vertices:
+            raise ValueError(f"Invalid vertex number: {max_vertex}")
+
+        typecode = "i" if num_vertices < 2 ** 31 else "q"
+        offsets = array("q", [0]) * (num_vertices + 1)
+        num_half_edges = 0
+
+        with open(filename, "wb") as file:
+            file.seek(CSR_HEADER.size + 8 * (num_vertices + 1))
+            block = array(typecode)
+            previous = -1
+            for key in heapq.merge(*runs):
+                if key == previous:
+                    continue
+                previous = key
+                offsets[(key >> 32) + 1] += 1
+                block.append(key & 0xFFFFFFFF)
+                if len(block) >= MERGE_BLOCK_SIZE:
+                    num_half_edges += _write_block(file, block)
+                    block = array(typecode)
+            num_half_edges += _write_block(file, block)
+
+            for v in range(num_vertices):
+                offsets[v + 1] += offsets[v]
+            if sys.byteorder != "little":
+                offsets.byteswap()
+
+            file.seek(0)
+            file.write(CSR_HEADER.pack(CSR_MAGIC, CSR_VERSION, typecode.encode(), num_vertices, num_half_edges // 2))
+            offsets.tofile(file)
+
+
+def edge_list_to_csr(edge_list_filename: str, filename: str, num_vertices: Optional[int] = None,
+                     run_size: int = DEFAULT_RUN_SIZE, temp_dir: Optional[str] = None) -> None:
+    """
+    Converts an edge list file into a CSR graph file with `write_csr_graph_from_edges`, without loading the graph.
+    The vertex count is taken from `num_vertices`, then from a `# Nodes: V` comment, and otherwise is one more than
+    the largest vertex id in the file.
+
+    Args:
+        edge_list_filename (str): The path to the edge list file.
+        filename (str): The path to the CSR file to write.
+        num_vertices (Optional[int]): The number of vertices in the graph, if known.
+        run_size (int): How many half-edges to sort in memory at a time.
+        temp_dir (Optional[str]): The directory for the sorted runs.
+
+    Raises:
+        FileNotFoundError: If the edge list file is not found.
+        ValueError: If the edge list is empty or contains invalid data.
+    """
+    if num_vertices is None:
+        num_vertices = edge_list_vertex_count(edge_list_filename)
+    write_csr_graph_from_edges(iter_edge_list(edge_list_filename), filename, num_vertices, run_size, temp_dir)
+
+
+def _spill_run(run: array, path: str) -> Iterator[int]:
+    """
+    Sorts a run of keys, writes it to a temporary file and returns an iterator that reads it back in blocks.
+    """
+    run = array("q", sorted(run))
+    with open(path, "wb") as file:
+        run.tofile(file)
+    return _read_run(path, len(run))
+
+
+def _read_run(path: str, length: int) -> Iterator[int]:
+    with open(path, "rb") as file:
+        while length > 0:
+            block = array("q")
+            block.fromfile(file, min(MERGE_BLOCK_SIZE, length))
+            length -= len(block)
+            yield from block
+
+
+def _write_block(file, block: array) -> int:
+    count = len(block)
+    if sys.byteorder != "little":
+        block.byteswap()
+    block.tofile(file)
+    return count
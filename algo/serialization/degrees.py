@@ -0,0 +1,23 @@
+from typing import Sequence
+
+from algo.ordering.smallest_last import core_numbers
+from algo.serialization.compression import open_graph_file
+from algo.serialization.graph import DEFAULT_WRITE_BUFFER_SIZE, write_blocks
+
+
+def write_degree_profile_to_file(ordering: Sequence[int], deleted_degrees: Sequence[int], filename: str,
+                                 buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE) -> None:
+    """
+    Writes the deleted-degree profile of a smallest last ordering to a file, one `VERTEX,DELETED_DEGREE,CORE_NUMBER`
+    line per vertex in the order the vertices were deleted.
+
+    Args:
+        ordering (Sequence[int]): The smallest last ordering of the vertices.
+        deleted_degrees (Sequence[int]): The degree of every vertex when it was deleted, indexed by vertex.
+        filename (str): The path to the file to which the profile will be written.
+        buffer_size (int): How many characters to join into a single write.
+    """
+    cores = core_numbers(ordering, deleted_degrees)
+    with open_graph_file(filename, "w") as file:
+        write_blocks(file, (f"{vertex},{deleted_degrees[vertex]},{cores[vertex]}\n" for vertex in ordering),
+                     buffer_size)
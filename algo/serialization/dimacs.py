@@ -0,0 +1,100 @@
+from array import array
+from typing import Union
+
+from algo.serialization.compression import open_graph_file
+from algo.serialization.graph import (DEFAULT_READ_CHUNK_SIZE, WRITE_BLOCK_SIZE, graph_from_edge_arrays,
+                                      iter_line_blocks, upper_neighbors)
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def write_dimacs_graph(graph: Union[Graph, CSRGraph], filename: str) -> None:
+    """
+    Writes the given graph to a file in the DIMACS `.col` format: a `p edge V E` problem line followed by one
+    `e u v` line per edge, with vertices numbered from 1.
+
+    Args:
+        graph (Union[Graph, CSRGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+
+    Raises:
+        ValueError: If the input graph is empty.
+    """
+
+    if graph.V == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    num_edges = sum(len(upper_neighbors(graph, u)) for u in range(graph.V))
+
+    with open_graph_file(filename, "w") as file:
+        file.write(f"p edge {graph.V} {num_edges}\n")
+        block = []
+        for u in range(graph.V):
+            block.extend(f"e {u + 1} {v + 1}\n" for v in upper_neighbors(graph, u))
+            if len(block) >= WRITE_BLOCK_SIZE:
+                file.writelines(block)
+                block = []
+        file.writelines(block)
+
+
+def read_dimacs_graph(filename: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+                      as_csr: bool = False) -> Union[Graph, CSRGraph]:
+    """
+    Reads a graph in the DIMACS `.col` format. Comment (`c`) and vertex (`n`) lines are skipped, edges listed in
+    both directions are only added once.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+        chunk_size (int): How many bytes to read from the file at a time.
+        as_csr (bool): Return a CSRGraph instead of a Graph.
+
+    Returns:
+        The graph read from the file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file has no problem line or contains invalid data.
+    """
+    num_vertices = None
+    sources = array("q")
+    targets = array("q")
+    seen = set()
+
+    try:
+        with open_graph_file(filename, "rb") as file:
+            for lines in iter_line_blocks(file, chunk_size):
+                for line in lines:
+                    tokens = line.split()
+                    if not tokens or tokens[0] in (b"c", b"n"):
+                        continue
+                    if tokens[0] == b"p":
+                        if num_vertices is not None or len(tokens) < 4:
+                            raise ValueError(f"Invalid problem line: {line.decode(errors='replace').strip()}")
+                        num_vertices = int(tokens[2])
+                        continue
+                    if tokens[0] != b"e" or len(tokens) < 3:
+                        raise ValueError(f"Invalid line: {line.decode(errors='replace').strip()}")
+                    if num_vertices is None:
+                        raise ValueError("Edge found before the problem line")
+
+                    u = int(tokens[1]) - 1
+                    v = int(tokens[2]) - 1
+                    if u == v:
+                        raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+                    if u > v:
+                        u, v = v, u
+                    if u < 0 or v >= num_vertices:
+                        raise ValueError(f"Invalid vertex number: {v + 1 if u >= 0 else u + 1}")
+
+                    key = (u << 32) | v
+                    if key not in seen:
+                        seen.add(key)
+                        sources.append(u)
+                        targets.append(v)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    if num_vertices is None:
+        raise ValueError("Input file has no problem line")
+
+    return graph_from_edge_arrays(num_vertices, sources, targets, as_csr)
@@ -0,0 +1,147 @@
+from array import array
+from typing import Iterator, Optional, Tuple, Union
+
+from algo.serialization.compression import open_graph_file
+from algo.serialization.graph import (DEFAULT_READ_CHUNK_SIZE, WRITE_BLOCK_SIZE, graph_from_edge_arrays,
+                                      iter_line_blocks, upper_neighbors)
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def write_edge_list_graph(graph: Union[Graph, CSRGraph], filename: str) -> None:
+    """
+    Writes the given graph to a file as a plain edge list: a `# Nodes: V Edges: E` comment followed by one `u v`
+    line per edge, with vertices numbered from 0.
+
+    Args:
+        graph (Union[Graph, CSRGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+
+    Raises:
+        ValueError: If the input graph is empty.
+    """
+
+    if graph.V == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    num_edges = sum(len(upper_neighbors(graph, u)) for u in range(graph.V))
+
+    with open_graph_file(filename, "w") as file:
+        file.write(f"# Nodes: {graph.V} Edges: {num_edges}\n")
+        block = []
+        for u in range(graph.V):
+            block.extend(f"{u} {v}\n" for v in upper_neighbors(graph, u))
+            if len(block) >= WRITE_BLOCK_SIZE:
+                file.writelines(block)
+                block = []
+        file.writelines(block)
+
+
+def read_edge_list_graph(filename: str, num_vertices: Optional[int] = None,
+                         chunk_size: int = DEFAULT_READ_CHUNK_SIZE, as_csr: bool = False) -> Union[Graph, CSRGraph]:
+    """
+    Reads a graph from a plain edge list with one `u v` pair per line, vertices numbered from 0. Lines starting with
+    `#` or `%` are comments, extra columns such as weights are ignored, and edges listed in both directions are only
+    added once.
+
+    The vertex count is taken from `num_vertices`, then from a `# Nodes: V` comment at the top of the file, and
+    otherwise is one more than the largest vertex id in the file.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+        num_vertices (Optional[int]): The number of vertices in the graph, if known.
+        chunk_size (int): How many bytes to read from the file at a time.
+        as_csr (bool): Return a CSRGraph instead of a Graph.
+
+    Returns:
+        The graph read from the file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file contains invalid data.
+    """
+    declared_vertices = num_vertices if num_vertices is not None else edge_list_vertex_count(filename)
+    max_vertex = -1
+    sources = array("q")
+    targets = array("q")
+    seen = set()
+
+    for u, v in iter_edge_list(filename, chunk_size):
+        key = (u << 32) | v
+        if key not in seen:
+            seen.add(key)
+            sources.append(u)
+            targets.append(v)
+            if v > max_vertex:
+                max_vertex = v
+
+    if declared_vertices is None:
+        declared_vertices = max_vertex + 1
+    if declared_vertices == 0:
+        raise ValueError("Input file is empty")
+    if max_vertex >= declared_vertices:
+        raise ValueError(f"Invalid vertex number: {max_vertex}")
+
+    return graph_from_edge_arrays(declared_vertices, sources, targets, as_csr)
+
+
+def iter_edge_list(filename: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE) -> Iterator[Tuple[int, int]]:
+    """
+    Streams the edges of an edge list file as pairs (u, v), u < v, in file order. Duplicates are not removed.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+        chunk_size (int): How many bytes to read from the file at a time.
+
+    Yields:
+        Tuple[int, int]: The endpoints of an edge, smallest first.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file contains invalid data.
+    """
+    try:
+        with open_graph_file(filename, "rb") as file:
+            for lines in iter_line_blocks(file, chunk_size):
+                for line in lines:
+                    tokens = line.split()
+                    if not tokens or tokens[0][:1] in (b"#", b"%"):
+                        continue
+                    if len(tokens) < 2:
+                        raise ValueError(f"Invalid line: {line.decode(errors='replace').strip()}")
+
+                    u = int(tokens[0])
+                    v = int(tokens[1])
+                    if u == v:
+                        raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+                    if u > v:
+                        u, v = v, u
+                    if u < 0:
+                        raise ValueError(f"Invalid vertex number: {u}")
+                    yield u, v
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+
+def edge_list_vertex_count(filename: str) -> Optional[int]:
+    """
+    Returns the vertex count declared by a `# Nodes: V` comment among the comment lines at the top of an edge list
+    file, or None if there is none.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+    """
+    try:
+        with open_graph_file(filename, "rb") as file:
+            for lines in iter_line_blocks(file, 1 << 12):
+                for line in lines:
+                    tokens = line.split()
+                    if not tokens:
+                        continue
+                    if tokens[0][:1] not in (b"#", b"%"):
+                        return None
+                    if b"Nodes:" in tokens:
+                        return int(tokens[tokens.index(b"Nodes:") + 1])
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    return None
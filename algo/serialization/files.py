@@ -0,0 +1,72 @@
+import os
+from typing import TYPE_CHECKING, Union
+
+from algo.registry import LazyRegistry
+from algo.serialization.compression import compression_from_extension, strip_compression_extension
+
+if TYPE_CHECKING:
+    from algo.structures.csr import CSRGraph
+    from algo.structures.graph import Graph
+    from algo.structures.varint import VarintGraph
+
+# Map a file extension to the reader and writer of its graph format, so only the format in use is imported. The
+# empty extension is the adjacency text format, which is used for any extension not listed.
+GRAPH_READERS = LazyRegistry({
+    "": "algo.serialization.graph:read_graph_from_file",
+    ".csr": "algo.serialization.csr:read_csr_graph",
+    ".col": "algo.serialization.dimacs:read_dimacs_graph",
+    ".edges": "algo.serialization.edge_list:read_edge_list_graph",
+    ".el": "algo.serialization.edge_list:read_edge_list_graph",
+    ".graph": "algo.serialization.metis:read_metis_graph",
+    ".metis": "algo.serialization.metis:read_metis_graph",
+    ".vgr": "algo.serialization.varint:read_varint_graph",
+})
+
+GRAPH_WRITERS = LazyRegistry({
+    "": "algo.serialization.graph:write_graph_to_file",
+    ".csr": "algo.serialization.csr:write_csr_graph",
+    ".col": "algo.serialization.dimacs:write_dimacs_graph",
+    ".edges": "algo.serialization.edge_list:write_edge_list_graph",
+    ".el": "algo.serialization.edge_list:write_edge_list_graph",
+    ".graph": "algo.serialization.metis:write_metis_graph",
+    ".metis": "algo.serialization.metis:write_metis_graph",
+    ".vgr": "algo.serialization.varint:write_varint_graph",
+})
+
+
+def graph_format(filename: str) -> str:
+    """
+    Returns the extension that selects the graph format of the given file, or an empty string for the adjacency
+    text format. A trailing compression extension is ignored, so `graph.col.gz` is a DIMACS file.
+
+    Raises:
+        ValueError: If a memory-mapped format is given a compression extension.
+    """
+    extension = os.path.splitext(strip_compression_extension(filename))[1].lower()
+    if extension in (".csr", ".vgr") and compression_from_extension(filename) is not None:
+        raise ValueError("CSR and varint graph files are memory-mapped and cannot be compressed")
+    return extension if extension in GRAPH_READERS else ""
+
+
+def read_graph(filename: str) -> Union["Graph", "CSRGraph", "VarintGraph"]:
+    """
+    Reads a graph from a file, picking the format from the file extension.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+
+    Returns:
+        The graph read from the file.
+    """
+    return GRAPH_READERS[graph_format(filename)](filename)
+
+
+def write_graph(graph: Union["Graph", "CSRGraph", "VarintGraph"], filename: str) -> None:
+    """
+    Writes a graph to a file, picking the format from the file extension.
+
+    Args:
+        graph (Union[Graph, CSRGraph, VarintGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+    """
+    GRAPH_WRITERS[graph_format(filename)](graph, filename)
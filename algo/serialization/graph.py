@@ -1,12 +1,35 @@
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from algo.instrumentation import phase, timed
+from algo.serialization.compression import compression_from_extension, detect_compression, open_graph_file
+from algo.serialization.index import GraphIndexBuilder, load_graph_index
+from algo.structures.csr import CSRGraph
 from algo.structures.graph import Graph
 
-def write_graph_to_file(graph: Graph, filename: str) -> None:
+DEFAULT_SPILL_BUFFER_SIZE = 1 << 20
+DEFAULT_READ_CHUNK_SIZE = 1 << 20
+WRITE_BLOCK_SIZE = 1 << 14
+DEFAULT_WRITE_BUFFER_SIZE = 1 << 20
+
+def write_graph_to_file(graph: Union[Graph, CSRGraph], filename: str,
+                        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE, index: bool = True) -> None:
     """
-    Writes the adjacency list of the given graph to a file in a simple adjacency list format.
+    Writes the adjacency list of the given graph to a file in a simple adjacency list format. The file is
+    compressed when its name ends in `.gz`, `.bz2` or `.xz`.
+
+    Lines are formatted straight from the linked lists of a Graph, without copying it to another representation
+    first, and are handed to the file in pre-joined blocks of about `buffer_size` characters. Uncompressed files
+    also get a sidecar index (see `algo.serialization.index`) recorded in the same pass.
 
     Args:
-        graph (Graph): The graph to be written to a file.
+        graph (Union[Graph, CSRGraph]): The graph to be written to a file.
         filename (str): The path to the file to which the graph will be written.
+        buffer_size (int): How many characters to join into a single write.
+        index (bool): Write the sidecar index next to uncompressed files.
 
     Raises:
         ValueError: If the input graph is empty.
@@ -15,48 +38,388 @@ def write_graph_to_file(graph: Graph, filename: str) -> None:
     if graph.V == 0:
         raise ValueError("Cannot write an empty graph to a file")
 
-    with open(filename, "w") as file:
-        for u in graph.vertices():
-            neighbors = graph.neighbors(u)
-            neighbors_str = " ".join(str(v) for v in neighbors)
-            file.write(f"{neighbors_str}\n")
+    lines = _adjacency_lines(graph)
+    # Line offsets into a compressed file are meaningless, so those are never indexed
+    builder = GraphIndexBuilder() if index and compression_from_extension(filename) is None else None
+    if builder is not None:
+        lines = builder.track(lines)
+
+    with open_graph_file(filename, "w") as file:
+        write_blocks(file, lines, buffer_size)
+
+    if builder is not None:
+        builder.write(filename)
+
+
+def _adjacency_lines(graph: Union[Graph, CSRGraph]) -> Iterator[str]:
+    if not isinstance(graph, Graph):
+        for u in range(graph.V):
+            yield " ".join(map(str, graph.neighbors(u))) + "\n"
+        return
 
-def read_graph_from_file(filename: str) -> Graph:
+    for node in graph.adj_list:
+        neighbors = []
+        while node:
+            neighbors.append(node.vertex)
+            node = node.next
+        yield " ".join(map(str, neighbors)) + "\n"
+
+
+def write_blocks(file: TextIO, lines: Iterable[str], buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE) -> None:
+    """
+    Writes lines to a text file in pre-joined blocks of about `buffer_size` characters, so the file sees one write
+    call per block instead of one per line.
+
+    Args:
+        file (TextIO): The file to write to.
+        lines (Iterable[str]): The lines to write, including their newlines.
+        buffer_size (int): How many characters to join into a single write.
+    """
+    block = []
+    pending = 0
+    for line in lines:
+        block.append(line)
+        pending += len(line)
+        if pending >= buffer_size:
+            file.write("".join(block))
+            block = []
+            pending = 0
+    if block:
+        file.write("".join(block))
+
+
+@timed("read_graph")
+def read_graph_from_file(filename: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE, workers: int = 1,
+                         as_csr: bool = False) -> Union[Graph, CSRGraph]:
     """
     Reads a graph from a file in a simple adjacency list format and returns a Graph object.
 
+    The file is streamed in binary chunks of `chunk_size` bytes and every complete line of a chunk is parsed in one
+    pass, so the file is never held in memory as a list of strings. Each line lists both directions of an edge, so
+    only the entries v > u of line u are kept and no deduplication set is needed.
+
+    Files compressed with gzip, bz2 or xz are detected from their magic bytes and decompressed on the fly.
+
+    With `workers` > 1 an uncompressed file is split at newline boundaries into one byte range per worker. The
+    workers first count the lines of their range, which fixes the vertex id of the first line of every range, and
+    then parse their ranges in separate processes. The partial edge arrays come back in range order and are
+    concatenated. When the file has a sidecar index, the ranges and their first vertices are taken from its line
+    offsets instead and the counting round is skipped.
+
     Args:
         filename (str): The path to the file containing the graph.
+        chunk_size (int): How many bytes to read from the file at a time.
+        workers (int): The number of processes parsing the file.
+        as_csr (bool): Return a CSRGraph built straight from the parsed arrays instead of a Graph.
 
     Returns:
-        A Graph object representing the graph read from the file.
+        A Graph (or CSRGraph) object representing the graph read from the file.
 
     Raises:
         FileNotFoundError: If the file is not found.
         ValueError: If the input file is empty or contains invalid data.
     """
+    assert workers >= 1, "At least one worker is required"
+
     try:
-        with open(filename, "r") as file:
-            lines = file.readlines()
+        with phase("parse_graph"):
+            # Compressed files cannot be split into byte ranges, so they are always parsed by a single process
+            if workers == 1 or detect_compression(filename) is not None:
+                sources = array("q")
+                targets = array("q")
+                with open_graph_file(filename, "rb") as file:
+                    num_vertices, max_vertex = _parse_adjacency_stream(file, chunk_size, sources, targets)
+            else:
+                num_vertices, max_vertex, sources, targets = _parse_adjacency_file_parallel(filename, chunk_size,
+                                                                                            workers)
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {filename}")
 
-    if not lines:
+    if num_vertices == 0:
         raise ValueError("Input file is empty")
+    if max_vertex >= num_vertices:
+        raise ValueError(f"Invalid vertex number: {max_vertex}")
 
-    num_vertices = len(lines)
-    graph = Graph(num_vertices)
-    added_edges = set()
-
-    for u, line in enumerate(lines):
-        if line.strip():
-            for v in map(int, line.strip().split()):
-                if v < 0 or v >= num_vertices:
-                    raise ValueError(f"Invalid vertex number: {v}")
-                if u != v and (u, v) not in added_edges and (v, u) not in added_edges:
-                    graph.add_edge(u, v)
-                    added_edges.add((u, v))
-                elif u == v:
-                    raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+    with phase("build_graph"):
+        return graph_from_edge_arrays(num_vertices, sources, targets, as_csr)
+
+
+def graph_from_edge_arrays(num_vertices: int, sources: Sequence[int], targets: Sequence[int],
+                           as_csr: bool = False) -> Union[Graph, CSRGraph]:
+    """
+    Builds a graph from undirected edges given as parallel arrays of endpoints through the bulk edge path.
+
+    Args:
+        num_vertices (int): The number of vertices in the graph.
+        sources (Sequence[int]): The first endpoint of every edge.
+        targets (Sequence[int]): The second endpoint of every edge.
+        as_csr (bool): Build a CSRGraph instead of a Graph.
 
+    Returns:
+        The graph holding the given edges.
+    """
+    if as_csr:
+        return CSRGraph.from_edge_arrays(num_vertices, sources, targets)
+
+    graph = Graph(num_vertices)
+    graph.add_edges(sources, targets)
     return graph
+
+
+def _parse_adjacency_file_parallel(filename: str, chunk_size: int, workers: int) -> Tuple[int, int, array, array]:
+    """
+    Parses an adjacency file with a process pool, one byte range per worker.
+
+    Returns:
+        Tuple[int, int, array, array]: The vertex count, the largest vertex id seen, and the sources and targets
+        of every edge (u, v), u < v, ordered by u.
+    """
+    index = load_graph_index(filename)
+    if index is not None:
+        first_vertices = sorted({index.V * part // workers for part in range(workers + 1)})
+        ranges = [(index.offsets[lo], index.offsets[hi]) for lo, hi in zip(first_vertices[:-1], first_vertices[1:])]
+        index.close()
+    else:
+        ranges = _line_aligned_ranges(filename, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if index is None:
+            line_counts = list(executor.map(_count_range_lines, [filename] * len(ranges), ranges))
+
+            first_vertices = [0]
+            for count in line_counts:
+                first_vertices.append(first_vertices[-1] + count)
+
+        tasks = [(filename, start, end, first_vertex, chunk_size)
+                 for (start, end), first_vertex in zip(ranges, first_vertices)]
+        partials = list(executor.map(_parse_adjacency_range, tasks))
+
+    sources = array("q")
+    targets = array("q")
+    max_vertex = -1
+    for partial_sources, partial_targets, partial_max_vertex in partials:
+        sources.extend(partial_sources)
+        targets.extend(partial_targets)
+        max_vertex = max(max_vertex, partial_max_vertex)
+
+    return first_vertices[-1], max_vertex, sources, targets
+
+
+def _line_aligned_ranges(filename: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into at most `parts` byte ranges of roughly equal size that each start at the beginning of a line.
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as file:
+        for part in range(1, parts):
+            target = max(size * part // parts, boundaries[-1])
+            if target >= size:
+                break
+            # Move the boundary past the end of the line it falls into, unless it already starts a line
+            if target > 0:
+                file.seek(target - 1)
+                file.readline()
+            boundary = file.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _count_range_lines(filename: str, byte_range: Tuple[int, int]) -> int:
+    start, end = byte_range
+    count = 0
+    last = b"\n"
+    with open(filename, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = file.read(min(DEFAULT_READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+            remaining -= len(chunk)
+    # A final line without a trailing newline still counts as a vertex
+    return count + (last != b"\n")
+
+
+def _parse_adjacency_range(task: Tuple[str, int, int, int, int]) -> Tuple[array, array, int]:
+    filename, start, end, first_vertex, chunk_size = task
+    sources = array("q")
+    targets = array("q")
+    with open(filename, "rb") as file:
+        file.seek(start)
+        _, max_vertex = _parse_adjacency_stream(file, chunk_size, sources, targets, first_vertex, end - start)
+    return sources, targets, max_vertex
+
+
+def _parse_adjacency_stream(file: BinaryIO, chunk_size: int, sources: array, targets: array,
+                            first_vertex: int = 0, limit: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Parses adjacency lines from a binary file object chunk by chunk, appending every edge (u, v), u < v,
+    to `sources` and `targets`. The first line read is vertex `first_vertex`, and at most `limit` bytes are read.
+
+    Returns:
+        Tuple[int, int]: One past the id of the last vertex read, which is the vertex count when reading a whole
+        file, and the largest vertex id seen.
+    """
+    vertex = first_vertex
+    max_vertex = -1
+    for lines in iter_line_blocks(file, chunk_size, limit):
+        max_vertex = max(max_vertex, _parse_adjacency_lines(lines, vertex, sources, targets))
+        vertex += len(lines)
+
+    return vertex, max_vertex
+
+
+def upper_neighbors(graph: Union[Graph, CSRGraph], u: int) -> list[int]:
+    """
+    Returns the distinct neighbors of u that are larger than u, in ascending order, so every edge is listed once.
+    """
+    return sorted({v for v in graph.neighbors(u) if v > u})
+
+
+def iter_line_blocks(file: BinaryIO, chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+                     limit: Optional[int] = None) -> Iterator[List[bytes]]:
+    """
+    Reads a binary file object in chunks of `chunk_size` bytes and yields the complete lines of each chunk as one
+    block, carrying a trailing partial line over to the next chunk. At most `limit` bytes are read. A final line
+    without a trailing newline is yielded as a block of its own.
+
+    Args:
+        file (BinaryIO): The file object to read from.
+        chunk_size (int): How many bytes to read at a time.
+        limit (Optional[int]): The maximum number of bytes to read, or None to read to the end of the file.
+
+    Yields:
+        List[bytes]: The lines of a chunk, without their newlines.
+    """
+    leftover = b""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        chunk = file.read(chunk_size if remaining is None else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        chunk = leftover + chunk
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            leftover = chunk
+            continue
+        leftover = chunk[end + 1:]
+        yield chunk[:end].split(b"\n")
+
+    if leftover:
+        yield [leftover]
+
+
+def _parse_adjacency_lines(lines: List[bytes], first_vertex: int, sources: array, targets: array) -> int:
+    """
+    Parses the adjacency lines of the vertices first_vertex, first_vertex + 1, ... and appends every edge (u, v),
+    u < v, to `sources` and `targets`.
+
+    Returns:
+        int: The largest vertex id seen, or -1 if the lines hold no neighbors.
+    """
+    max_vertex = -1
+    for u, line in enumerate(lines, first_vertex):
+        neighbors = set(map(int, line.split()))
+        if not neighbors:
+            continue
+        if u in neighbors:
+            raise ValueError(f"Self-loops are not allowed: ({u}, {u})")
+        smallest = min(neighbors)
+        if smallest < 0:
+            raise ValueError(f"Invalid vertex number: {smallest}")
+        max_vertex = max(max_vertex, max(neighbors))
+
+        upper = sorted(v for v in neighbors if v > u)
+        sources.extend([u] * len(upper))
+        targets.extend(upper)
+
+    return max_vertex
+
+
+def write_edge_stream_to_file(chunks: Iterable[Tuple[int, int, List[Tuple[int, int]]]], num_vertices: int,
+                              partition_size: int, filename: str,
+                              spill_buffer_size: int = DEFAULT_SPILL_BUFFER_SIZE, index: bool = True) -> None:
+    """
+    Writes a graph given as a stream of vertex-partitioned edge chunks to a file in the adjacency list format used by
+    `write_graph_to_file`, without ever building the whole graph in memory.
+
+    Each chunk is a tuple (lo, hi, edges) covering the vertex partition [lo, hi) and holding the edges (u, v), u < v,
+    whose lower endpoint u lies in the partition. Chunks must arrive in vertex order and use partitions of
+    `partition_size` vertices. Half-edges pointing into later partitions are spilled to temporary files and read
+    back once their partition is written, so memory stays bounded by one partition plus `spill_buffer_size`
+    buffered half-edges. Uncompressed files also get a sidecar index, as with `write_graph_to_file`.
+
+    Args:
+        chunks (Iterable[Tuple[int, int, List[Tuple[int, int]]]]): The vertex-partitioned edge chunks.
+        num_vertices (int): The number of vertices in the graph.
+        partition_size (int): The number of vertices per partition.
+        filename (str): The path to the file to which the graph will be written.
+        spill_buffer_size (int): How many spilled half-edges to buffer in memory before flushing them to disk.
+        index (bool): Write the sidecar index next to uncompressed files.
+
+    Raises:
+        ValueError: If the graph is empty or the chunks do not cover the vertices in order.
+    """
+
+    if num_vertices == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    builder = GraphIndexBuilder() if index and compression_from_extension(filename) is None else None
+
+    with tempfile.TemporaryDirectory() as spill_dir, open_graph_file(filename, "w") as file:
+        pending = {}
+        buffered = 0
+        next_vertex = 0
+
+        def spill_path(partition):
+            return os.path.join(spill_dir, f"{partition}.bin")
+
+        for lo, hi, edges in chunks:
+            if lo != next_vertex:
+                raise ValueError(f"Expected a chunk starting at vertex {next_vertex}, got {lo}")
+
+            adjacency = [[] for _ in range(hi - lo)]
+
+            partition = lo // partition_size
+            spilled = pending.pop(partition, array("q"))
+            buffered -= len(spilled)
+            if os.path.exists(spill_path(partition)):
+                with open(spill_path(partition), "rb") as spill_file:
+                    spilled.frombytes(spill_file.read())
+                os.remove(spill_path(partition))
+            for i in range(0, len(spilled), 2):
+                adjacency[spilled[i] - lo].append(spilled[i + 1])
+
+            for u, v in edges:
+                adjacency[u - lo].append(v)
+                if v < hi:
+                    adjacency[v - lo].append(u)
+                else:
+                    pending.setdefault(v // partition_size, array("q")).extend((v, u))
+                    buffered += 2
+
+            if buffered > spill_buffer_size:
+                for target, half_edges in pending.items():
+                    with open(spill_path(target), "ab") as spill_file:
+                        half_edges.tofile(spill_file)
+                pending.clear()
+                buffered = 0
+
+            lines = (" ".join(map(str, neighbors)) + "\n" for neighbors in adjacency)
+            file.writelines(builder.track(lines) if builder is not None else lines)
+            next_vertex = hi
+
+        if next_vertex != num_vertices:
+            raise ValueError(f"Edge stream ended at vertex {next_vertex}, expected {num_vertices}")
+
+    if builder is not None:
+        builder.write(filename)
@@ -0,0 +1,223 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Optional
+
+INDEX_MAGIC = b"GIDX"
+INDEX_VERSION = 1
+
+# Sidecar index files sit next to the graph file they describe, as `graph.txt.idx`.
+INDEX_EXTENSION = ".idx"
+
+# magic, version, padding, vertex count, edge count, graph file size, graph file mtime in nanoseconds
+INDEX_HEADER = struct.Struct("<4sB3xqqqq")
+
+
+def index_path(filename: str) -> str:
+    """
+    Returns the path of the sidecar index of the given graph file.
+    """
+    return filename + INDEX_EXTENSION
+
+
+class GraphIndexBuilder:
+    """
+    Records the degree and byte offset of every adjacency line as it passes by on its way to the file, so the index
+    is built in the same pass that writes the graph.
+    """
+
+    def __init__(self) -> None:
+        self.degrees = array("q")
+        self.offsets = array("q", [0])
+
+    def track(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yields the given adjacency lines unchanged while recording their degrees and offsets. The lines are ASCII, so
+        their length in characters is their length in bytes. A neighbor listed twice is counted once, matching what
+        the reader keeps.
+        """
+        degrees = self.degrees
+        offsets = self.offsets
+        end = offsets[-1]
+        for line in lines:
+            degrees.append(len(set(line.split())))
+            end += len(line)
+            offsets.append(end)
+            yield line
+
+    def write(self, filename: str) -> None:
+        """
+        Writes the index of the graph file `filename`, which must already be closed, to its sidecar path.
+        """
+        write_graph_index(filename, self.degrees, self.offsets)
+
+
+class GraphIndex:
+    """
+    The sidecar index of an adjacency list file: the vertex count V, the edge count E, the degree of every vertex and
+    the byte offset of every vertex line. It answers graph statistics and reads single adjacency lists without
+    parsing the graph file.
+    """
+
+    def __init__(self, filename: str, num_edges: int, degrees, offsets, buffer=None) -> None:
+        self.filename = filename
+        self.V = len(degrees)
+        self.E = num_edges
+        self.degrees = degrees
+        self.offsets = offsets
+        # Keeps the memory map backing the views alive for as long as the index is
+        self._buffer = buffer
+
+    def degree(self, vertex: int) -> int:
+        return self.degrees[vertex]
+
+    def average_degree(self) -> float:
+        return 2 * self.E / self.V
+
+    def max_degree(self) -> int:
+        return max(self.degrees, default=0)
+
+    def neighbors(self, vertex: int) -> List[int]:
+        """
+        Reads the adjacency list of a single vertex by seeking straight to its line in the graph file.
+        """
+        start = self.offsets[vertex]
+        with open(self.filename, "rb") as file:
+            file.seek(start)
+            return list(map(int, file.read(self.offsets[vertex + 1] - start).split()))
+
+    def close(self) -> None:
+        """
+        Releases the memory map backing the index, if any.
+        """
+        if self._buffer is not None:
+            self.degrees.release()
+            self.offsets.release()
+            self._buffer.close()
+            self._buffer = None
+
+    def __enter__(self) -> "GraphIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_graph_index(filename: str, degrees: array, offsets: array) -> None:
+    """
+    Writes the sidecar index of an adjacency list file.
+
+    The index starts with a header holding the magic bytes, the format version, V, E and the size and modification
+    time of the graph file, which tell a stale index apart from a current one. It is followed by V little-endian
+    int64 degrees and V + 1 int64 line offsets.
+
+    Args:
+        filename (str): The path to the graph file the index describes.
+        degrees (array): The degree of every vertex.
+        offsets (array): The byte offset of every vertex line, followed by the size of the adjacency data.
+    """
+    stat = os.stat(filename)
+    header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(degrees), sum(degrees) // 2, stat.st_size,
+                               stat.st_mtime_ns)
+    if sys.byteorder != "little":
+        degrees = array("q", degrees)
+        offsets = array("q", offsets)
+        degrees.byteswap()
+        offsets.byteswap()
+
+    with open(index_path(filename), "wb") as file:
+        file.write(header)
+        degrees.tofile(file)
+        offsets.tofile(file)
+
+
+def read_graph_index(filename: str) -> GraphIndex:
+    """
+    Reads the sidecar index of an adjacency list file by memory-mapping it.
+
+    Args:
+        filename (str): The path to the graph file, not to the index itself.
+
+    Returns:
+        The index of the graph file.
+
+    Raises:
+        FileNotFoundError: If the graph file has no index.
+        ValueError: If the index is invalid or older than the graph file.
+    """
+    path = index_path(filename)
+    try:
+        with open(path, "rb") as file:
+            if file.seek(0, 2) < INDEX_HEADER.size:
+                raise ValueError("Input file is not a graph index file")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+
+    magic, version, num_vertices, num_edges, size, mtime_ns = INDEX_HEADER.unpack_from(buffer)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        buffer.close()
+        raise ValueError("Input file is not a graph index file")
+    if len(buffer) != INDEX_HEADER.size + 8 * (2 * num_vertices + 1):
+        buffer.close()
+        raise ValueError("Input file is truncated or has trailing data")
+
+    stat = os.stat(filename)
+    if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+        buffer.close()
+        raise ValueError(f"Index is out of date with {filename}")
+
+    degrees_start = INDEX_HEADER.size
+    offsets_start = degrees_start + 8 * num_vertices
+    if sys.byteorder != "little":
+        degrees = array("q", buffer[degrees_start:offsets_start])
+        offsets = array("q", buffer[offsets_start:])
+        degrees.byteswap()
+        offsets.byteswap()
+        buffer.close()
+        return GraphIndex(filename, num_edges, degrees, offsets)
+
+    view = memoryview(buffer)
+    degrees = view[degrees_start:offsets_start].cast("q")
+    offsets = view[offsets_start:].cast("q")
+    view.release()
+    return GraphIndex(filename, num_edges, degrees, offsets, buffer=buffer)
+
+
+def load_graph_index(filename: str) -> Optional[GraphIndex]:
+    """
+    Returns the index of the given graph file, or None if it has no usable index.
+    """
+    try:
+        return read_graph_index(filename)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def build_graph_index(filename: str) -> GraphIndex:
+    """
+    Scans an uncompressed adjacency list file written without an index and writes its sidecar index.
+
+    Args:
+        filename (str): The path to the graph file.
+
+    Returns:
+        The index of the graph file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+    """
+    degrees = array("q")
+    offsets = array("q", [0])
+    try:
+        with open(filename, "rb") as file:
+            for line in file:
+                degrees.append(len(set(line.split())))
+                offsets.append(offsets[-1] + len(line))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    write_graph_index(filename, degrees, offsets)
+    return read_graph_index(filename)
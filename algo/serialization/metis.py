@@ -0,0 +1,111 @@
+from array import array
+from typing import Union
+
+from algo.serialization.compression import open_graph_file
+from algo.serialization.graph import (DEFAULT_READ_CHUNK_SIZE, WRITE_BLOCK_SIZE, graph_from_edge_arrays,
+                                      iter_line_blocks)
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def write_metis_graph(graph: Union[Graph, CSRGraph], filename: str) -> None:
+    """
+    Writes the given graph to a file in the unweighted METIS format: a `V E` header line followed by one line per
+    vertex listing its neighbors, with vertices numbered from 1.
+
+    Args:
+        graph (Union[Graph, CSRGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+
+    Raises:
+        ValueError: If the input graph is empty.
+    """
+
+    if graph.V == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    adjacency = [sorted(set(graph.neighbors(u))) for u in range(graph.V)]
+    num_edges = sum(len(neighbors) for neighbors in adjacency) // 2
+
+    with open_graph_file(filename, "w") as file:
+        file.write(f"{graph.V} {num_edges}\n")
+        for start in range(0, graph.V, WRITE_BLOCK_SIZE):
+            file.writelines(" ".join(str(v + 1) for v in neighbors) + "\n"
+                            for neighbors in adjacency[start:start + WRITE_BLOCK_SIZE])
+
+
+def read_metis_graph(filename: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+                     as_csr: bool = False) -> Union[Graph, CSRGraph]:
+    """
+    Reads a graph in the METIS format. Lines starting with `%` are comments, vertex sizes, vertex weights and edge
+    weights announced by the `fmt` field of the header are skipped. Every edge is listed in both directions, so
+    only the entries v > u of vertex u are kept.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+        chunk_size (int): How many bytes to read from the file at a time.
+        as_csr (bool): Return a CSRGraph instead of a Graph.
+
+    Returns:
+        The graph read from the file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file has no header or contains invalid data.
+    """
+    num_vertices = None
+    skip = 0
+    stride = 1
+    u = 0
+    sources = array("q")
+    targets = array("q")
+
+    try:
+        with open_graph_file(filename, "rb") as file:
+            for lines in iter_line_blocks(file, chunk_size):
+                for line in lines:
+                    if line[:1] == b"%":
+                        continue
+                    tokens = line.split()
+                    if num_vertices is None:
+                        if not tokens:
+                            continue
+                        num_vertices, skip, stride = _parse_header(tokens)
+                        continue
+                    if u >= num_vertices:
+                        if tokens:
+                            raise ValueError(f"More than {num_vertices} vertex lines")
+                        continue
+
+                    for v in map(int, tokens[skip::stride]):
+                        v -= 1
+                        if v == u:
+                            raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+                        if v < 0 or v >= num_vertices:
+                            raise ValueError(f"Invalid vertex number: {v + 1}")
+                        if v > u:
+                            sources.append(u)
+                            targets.append(v)
+                    u += 1
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    if num_vertices is None:
+        raise ValueError("Input file has no header line")
+    if u < num_vertices:
+        raise ValueError(f"Expected {num_vertices} vertex lines, found {u}")
+
+    return graph_from_edge_arrays(num_vertices, sources, targets, as_csr)
+
+
+def _parse_header(tokens: list[bytes]) -> tuple[int, int, int]:
+    """
+    Parses a METIS header `n m [fmt [ncon]]` into the vertex count, the number of leading values to skip on each
+    vertex line and the stride between neighbors.
+    """
+    num_vertices = int(tokens[0])
+    fmt = tokens[2].decode().zfill(3) if len(tokens) > 2 else "000"
+    has_sizes, has_vertex_weights, has_edge_weights = (flag == "1" for flag in fmt[-3:])
+    ncon = int(tokens[3]) if len(tokens) > 3 else 1
+    skip = has_sizes + (ncon if has_vertex_weights else 0)
+    return num_vertices, skip, 2 if has_edge_weights else 1
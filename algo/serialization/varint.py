@@ -0,0 +1,98 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Union
+
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+from algo.structures.varint import VarintGraph
+
+VARINT_MAGIC = b"VGRF"
+VARINT_VERSION = 1
+
+# magic, version, padding, vertex count, edge count
+VARINT_HEADER = struct.Struct("<4sB3xqq")
+
+
+def write_varint_graph(graph: Union[Graph, CSRGraph, VarintGraph], filename: str) -> None:
+    """
+    Writes the given graph to a file in the compact varint format.
+
+    The file starts with a header holding the magic bytes, the format version, the vertex count V and the edge count
+    E. It is followed by V + 1 little-endian int64 byte offsets into the payload and the payload of gap-encoded
+    varint records described in `VarintGraph`.
+
+    Args:
+        graph (Union[Graph, CSRGraph, VarintGraph]): The graph to be written to a file.
+        filename (str): The path to the file to which the graph will be written.
+
+    Raises:
+        ValueError: If the input graph is empty.
+    """
+
+    if graph.V == 0:
+        raise ValueError("Cannot write an empty graph to a file")
+
+    encoded = graph if isinstance(graph, VarintGraph) else VarintGraph.from_graph(graph)
+    offsets = array("q", encoded.offsets)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    with open(filename, "wb") as file:
+        file.write(VARINT_HEADER.pack(VARINT_MAGIC, VARINT_VERSION, encoded.V, encoded.E))
+        offsets.tofile(file)
+        file.write(encoded.payload)
+
+
+def read_varint_graph(filename: str) -> VarintGraph:
+    """
+    Reads a graph in the compact varint format by memory-mapping the file. Nothing is decoded up front; each
+    neighborhood is decoded lazily when it is iterated.
+
+    Args:
+        filename (str): The path to the file containing the graph.
+
+    Returns:
+        A VarintGraph backed by the memory-mapped file.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file is not a valid varint graph file.
+    """
+    try:
+        with open(filename, "rb") as file:
+            if file.seek(0, 2) < VARINT_HEADER.size:
+                raise ValueError("Input file is not a varint graph file")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    magic, version, num_vertices, num_edges = VARINT_HEADER.unpack_from(buffer)
+    if magic != VARINT_MAGIC or version != VARINT_VERSION:
+        buffer.close()
+        raise ValueError("Input file is not a varint graph file")
+
+    offsets_start = VARINT_HEADER.size
+    payload_start = offsets_start + 8 * (num_vertices + 1)
+    if len(buffer) < payload_start:
+        buffer.close()
+        raise ValueError("Input file is truncated")
+
+    if sys.byteorder != "little":
+        offsets = array("q", buffer[offsets_start:payload_start])
+        offsets.byteswap()
+        payload = bytes(buffer[payload_start:])
+        buffer.close()
+        return VarintGraph(offsets, payload, num_edges)
+
+    view = memoryview(buffer)
+    offsets = view[offsets_start:payload_start].cast("q")
+    payload = view[payload_start:]
+    view.release()
+    if offsets[num_vertices] != len(payload):
+        offsets.release()
+        payload.release()
+        buffer.close()
+        raise ValueError("Input file is truncated or has trailing data")
+    return VarintGraph(offsets, payload, num_edges, buffer=buffer)
@@ -0,0 +1,397 @@
+import ipaddress
+import json
+import os
+import re
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import Executor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from algo.jobs import DEFAULT_MAX_PENDING, JobDeadlineExceeded, JobQueue, QueueFullError, graph_fingerprint
+from algo.registry import ORDERINGS
+from algo.serialization.files import read_graph
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+GRAPH_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class GraphNotFoundError(KeyError):
+    pass
+
+
+class StoredGraph:
+    """
+    A named graph kept resident by the GraphStore. The mutable Graph takes the edge deltas, and an immutable CSR
+    snapshot of it and its fingerprint are built on the first coloring request after every change and shared by the
+    requests until the next change.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.version = 0
+        self.lock = threading.Lock()
+        self._snapshot: Optional[Tuple[CSRGraph, str]] = None
+
+    def snapshot(self) -> Tuple[CSRGraph, int, str]:
+        """
+        Returns the CSR snapshot of the graph, its version and its `graph_fingerprint`.
+        """
+        with self.lock:
+            if self._snapshot is None:
+                snapshot = CSRGraph.from_graph(self.graph)
+                self._snapshot = snapshot, graph_fingerprint(snapshot)
+            return self._snapshot[0], self.version, self._snapshot[1]
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"vertices": self.graph.V, "edges": len(self.graph.edges()), "version": self.version}
+
+
+class GraphStore:
+    """
+    Keeps named graphs in memory for the coloring service. All methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._graphs: Dict[str, StoredGraph] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._graphs)
+
+    def get(self, name: str) -> StoredGraph:
+        with self._lock:
+            if name not in self._graphs:
+                raise GraphNotFoundError(name)
+            return self._graphs[name]
+
+    def put(self, name: str, graph: Graph) -> StoredGraph:
+        """
+        Stores a graph under the given name, replacing any graph stored under it before.
+
+        Raises:
+            ValueError: If the name is not made of letters, digits, `_`, `.` and `-`.
+        """
+        if not GRAPH_NAME.match(name):
+            raise ValueError(f"Invalid graph name: {name}")
+        stored = StoredGraph(graph)
+        with self._lock:
+            self._graphs[name] = stored
+        return stored
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            if self._graphs.pop(name, None) is None:
+                raise GraphNotFoundError(name)
+
+    def apply_delta(self, name: str, add: Sequence[Sequence[int]] = (),
+                    remove: Sequence[Sequence[int]] = ()) -> Dict[str, int]:
+        """
+        Adds and removes edges of a stored graph. The whole delta is checked before any edge changes, so an invalid
+        delta leaves the graph untouched. Added edges that already exist are skipped.
+
+        Returns:
+            Dict[str, int]: How many edges were added and removed, and the new version of the graph.
+
+        Raises:
+            GraphNotFoundError: If there is no graph with the given name.
+            ValueError: If an edge is a self-loop, has an invalid vertex number or, when removed, does not exist or
+                is removed twice.
+        """
+        stored = self.get(name)
+        with stored.lock:
+            graph = stored.graph
+            for u, v in list(add) + list(remove):
+                _check_edge(graph, u, v)
+            # Removals are checked against the graph before the delta, so an edge may only be removed once
+            removed = set()
+            for u, v in remove:
+                if not graph.edge_exists(u, v):
+                    raise ValueError(f"Edge does not exist: ({u}, {v})")
+                edge = (min(u, v), max(u, v))
+                if edge in removed:
+                    raise ValueError(f"Edge removed twice: ({u}, {v})")
+                removed.add(edge)
+
+            for u, v in removed:
+                graph.remove_edge(u, v)
+            added = 0
+            for u, v in add:
+                if not graph.edge_exists(u, v):
+                    graph.add_edge(u, v)
+                    added += 1
+
+            stored.version += 1
+            stored._snapshot = None
+            return {"added": added, "removed": len(removed), "version": stored.version}
+
+
+def graph_from_request(body: Dict) -> Graph:
+    """
+    Builds a graph from the body of a PUT request, either `{"vertices": V, "edges": [[u, v], ...]}` or
+    `{"file": path}` naming a graph file on the server in any format `read_graph` accepts.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the body holds neither form, the vertex count is negative or the edges are invalid.
+    """
+    if "file" in body:
+        graph = read_graph(body["file"])
+        return graph if isinstance(graph, Graph) else _to_graph(graph)
+
+    if "vertices" not in body:
+        raise ValueError("Expected either 'vertices' and 'edges', or 'file'")
+    num_vertices = int(body["vertices"])
+    if num_vertices < 0:
+        raise ValueError(f"Invalid vertex count: {num_vertices}")
+    graph = Graph(num_vertices)
+    for u, v in body.get("edges", []):
+        _check_edge(graph, u, v)
+        if not graph.edge_exists(u, v):
+            graph.add_edge(u, v)
+    return graph
+
+
+def _check_edge(graph: Graph, u: int, v: int) -> None:
+    if u == v:
+        raise ValueError(f"Self-loops are not allowed: ({u}, {v})")
+    for vertex in (u, v):
+        if not isinstance(vertex, int) or not 0 <= vertex < graph.V:
+            raise ValueError(f"Invalid vertex number: {vertex}")
+
+
+def _to_graph(source) -> Graph:
+    graph = Graph(source.V)
+    for u, v in source.edges():
+        graph.add_edge(u, v)
+    return graph
+
+
+class ColoringService:
+    """
+    Runs ordering and coloring requests against the graphs of a GraphStore on the JobQueue, so concurrent requests
+    for the same graph version and ordering are colored once.
+
+    Every request works on the CSR snapshot of the graph at the version it saw, so edge deltas can be applied while
+    earlier requests are still being colored.
+    """
+
+    def __init__(self, workers: Optional[int] = None, executor: Optional[Executor] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self.store = GraphStore()
+        self.jobs = JobQueue(workers, max_pending=max_pending, executor=executor)
+
+    def color(self, name: str, ordering: str, include_coloring: bool = False, priority: str = "normal",
+              deadline: Optional[float] = None) -> Dict:
+        """
+        Colors a stored graph with the given ordering and greedy coloring.
+
+        Returns:
+            Dict: The colors used, the version of the graph that was colored, the coloring when asked for, and the
+            time spent on the snapshot, waiting for a worker, ordering, coloring and in total, in seconds.
+
+        Raises:
+            GraphNotFoundError: If there is no graph with the given name.
+            ValueError: If the ordering or the priority is unknown.
+            QueueFullError: If the job queue is full.
+            JobDeadlineExceeded: If the coloring did not finish within `deadline` seconds.
+        """
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Invalid ordering method: {ordering}")
+
+        start_time = time.perf_counter()
+        snapshot, version, fingerprint = self.store.get(name).snapshot()
+        submit_time = time.perf_counter()
+        job = self.jobs.submit(snapshot, ordering, priority=priority, deadline=deadline, fingerprint=fingerprint,
+                               block=False)
+        # The job stops waiting at this request's own deadline, whatever the requests sharing its work asked for
+        result = dict(job.result())
+        end_time = time.perf_counter()
+
+        ordering_time = result.pop("ordering_time")
+        coloring_time = result.pop("coloring_time")
+        coloring = result.pop("coloring")
+        if include_coloring:
+            result["coloring"] = coloring
+        result["graph"] = name
+        result["ordering"] = ordering
+        result["version"] = version
+        result["timings"] = {
+            "snapshot": submit_time - start_time,
+            # Waiting for a free worker and moving the snapshot and the result between processes
+            "queue": end_time - submit_time - ordering_time - coloring_time,
+            "ordering": ordering_time,
+            "coloring": coloring_time,
+            "total": end_time - start_time,
+        }
+        return result
+
+    def close(self) -> None:
+        self.jobs.close()
+
+
+class ColoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    The JSON over HTTP interface of the ColoringService:
+
+    - `GET /orderings` lists the ordering methods.
+    - `GET /graphs` lists the stored graphs, `GET /graphs/NAME` shows one.
+    - `PUT /graphs/NAME` stores a graph, see `graph_from_request`. `DELETE /graphs/NAME` drops it.
+    - `POST /graphs/NAME/edges` applies `{"add": [[u, v], ...], "remove": [[u, v], ...]}`.
+    - `POST /graphs/NAME/color` runs `{"ordering": ..., "include_coloring": false, "priority": "normal",
+      "deadline": seconds}`.
+    - `GET /metrics` shows the queue depth and latency metrics of the job queue.
+
+    Every response carries the time the server spent on the request under `request_time`.
+    """
+
+    service: ColoringService
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        start_time = time.perf_counter()
+        try:
+            status, body = self._route(method, [part for part in self.path.split("?")[0].split("/") if part])
+        except GraphNotFoundError as error:
+            status, body = 404, {"error": f"Graph not found: {error.args[0]}"}
+        except QueueFullError as error:
+            status, body = 503, {"error": str(error)}
+        except JobDeadlineExceeded as error:
+            status, body = 504, {"error": str(error)}
+        except (ValueError, FileNotFoundError, TypeError) as error:
+            status, body = 400, {"error": str(error)}
+        except Exception as error:
+            # Such as a MemoryError for a huge graph or a broken worker pool, answered instead of dropping the client
+            self.log_error("Error handling %s %s: %r", method, self.path, error)
+            status, body = 500, {"error": f"Internal error: {type(error).__name__}: {error}"}
+        body["request_time"] = time.perf_counter() - start_time
+
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, method: str, parts: List[str]) -> Tuple[int, Dict]:
+        store = self.service.store
+        if method == "GET" and parts == ["orderings"]:
+            return 200, {"orderings": list(ORDERINGS)}
+        if method == "GET" and parts == ["metrics"]:
+            return 200, self.service.jobs.metrics()
+        if method == "GET" and parts == ["graphs"]:
+            return 200, {"graphs": store.names()}
+        if len(parts) == 2 and parts[0] == "graphs":
+            name = parts[1]
+            if method == "GET":
+                return 200, {"graph": name, **store.get(name).stats()}
+            if method == "PUT":
+                stored = store.put(name, graph_from_request(self._read_body()))
+                return 201, {"graph": name, **stored.stats()}
+            if method == "DELETE":
+                store.delete(name)
+                return 200, {"graph": name}
+        if len(parts) == 3 and parts[0] == "graphs" and method == "POST":
+            name, action = parts[1], parts[2]
+            body = self._read_body()
+            if action == "edges":
+                return 200, {"graph": name, **store.apply_delta(name, body.get("add", []), body.get("remove", []))}
+            if action == "color":
+                return 200, self.service.color(name, body.get("ordering", "smallest_last"),
+                                               bool(body.get("include_coloring", False)),
+                                               body.get("priority", "normal"), body.get("deadline"))
+        return 404, {"error": f"No route for {method} {self.path}"}
+
+    def _read_body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON body: {error}")
+        if not isinstance(body, dict):
+            raise ValueError("The request body must be a JSON object")
+        return body
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ""
+
+
+def make_server(service: ColoringService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                unix_socket: Optional[str] = None, quiet: bool = False) -> socketserver.BaseServer:
+    """
+    Creates a threaded HTTP server for the coloring service, listening on a localhost port or on a Unix socket.
+    Every connection is handled on its own thread, and the CPU-bound work goes to the worker pool of the service.
+
+    Clients can have the server read graph files by path, so it only listens on loopback addresses.
+
+    Args:
+        service (ColoringService): The service answering the requests.
+        host (str): The loopback interface to listen on.
+        port (int): The port to listen on. 0 picks a free port.
+        unix_socket (Optional[str]): Listen on this Unix socket path instead of a port.
+        quiet (bool): Do not log every request to stderr.
+
+    Returns:
+        The server, ready for `serve_forever`.
+
+    Raises:
+        ValueError: If `host` is not a loopback address.
+        FileExistsError: If a file other than a socket exists at `unix_socket`.
+    """
+    if unix_socket is None and not _is_loopback(host):
+        raise ValueError(f"The coloring service only listens on loopback addresses, not: {host}")
+    handler = type("Handler", (ColoringRequestHandler,), {"service": service})
+    if unix_socket is not None:
+        # A socket left behind by an earlier server is replaced, any other file is not touched
+        if os.path.exists(unix_socket):
+            if not stat.S_ISSOCK(os.stat(unix_socket).st_mode):
+                raise FileExistsError(f"File exists and is not a socket: {unix_socket}")
+            os.remove(unix_socket)
+        server = _UnixHTTPServer(unix_socket, handler)
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+    server.quiet = quiet
+    return server
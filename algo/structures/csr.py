@@ -0,0 +1,120 @@
+from array import array
+from typing import Iterable, Sequence, Tuple
+
+from algo.structures.graph import Graph
+
+
+class CSRGraph:
+    """
+    An immutable graph stored in compressed sparse row form.
+
+    The neighbors of vertex v are adjacency[offsets[v]:offsets[v + 1]]. Both buffers may be in-memory arrays or
+    views over a memory-mapped file, and `neighbors` returns zero-copy slices of them, so a CSRGraph can stand in
+    for a Graph anywhere the orderings and colorings only call `vertices`, `degree` and `neighbors`.
+    """
+
+    def __init__(self, offsets: Sequence[int], adjacency: Sequence[int], buffer=None) -> None:
+        self.V = len(offsets) - 1
+        self.offsets = memoryview(offsets) if isinstance(offsets, array) else offsets
+        self.adjacency = memoryview(adjacency) if isinstance(adjacency, array) else adjacency
+        # Keeps the memory map backing the views alive for as long as the graph is
+        self._buffer = buffer
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges: Iterable[Tuple[int, int]]) -> "CSRGraph":
+        """
+        Builds a CSR graph from undirected edges with a counting sort, without creating a Graph first.
+        """
+        sources = array("q")
+        targets = array("q")
+        for u, v in edges:
+            sources.append(u)
+            targets.append(v)
+        return cls.from_edge_arrays(num_vertices, sources, targets)
+
+    @classmethod
+    def from_edge_arrays(cls, num_vertices: int, sources: Sequence[int], targets: Sequence[int]) -> "CSRGraph":
+        """
+        Builds a CSR graph from undirected edges given as parallel arrays of endpoints with a counting sort.
+        """
+        offsets = array("q", [0]) * (num_vertices + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for v in targets:
+            offsets[v + 1] += 1
+        for v in range(num_vertices):
+            offsets[v + 1] += offsets[v]
+
+        cursor = array("q", offsets[:-1])
+        adjacency = array(_typecode(num_vertices), [0]) * offsets[-1]
+        for u, v in zip(sources, targets):
+            adjacency[cursor[u]] = v
+            cursor[u] += 1
+            adjacency[cursor[v]] = u
+            cursor[v] += 1
+
+        return cls(offsets, adjacency)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """
+        Builds a CSR graph holding the same adjacency lists as the given graph.
+        """
+        offsets = array("q", [0])
+        adjacency = array(_typecode(graph.V))
+        for v in range(graph.V):
+            adjacency.extend(graph.neighbors(v))
+            offsets.append(len(adjacency))
+        return cls(offsets, adjacency)
+
+    def vertices(self) -> list[int]:
+        return list(range(self.V))
+
+    def edges(self) -> list[tuple[int, int]]:
+        """
+        Returns a list of all edges in the graph as tuples (u, v), where u and v are connected vertices.
+        """
+        edges = set()
+        for u in range(self.V):
+            for v in self.neighbors(u):
+                if u < v:
+                    edges.add((u, v))
+        return list(edges)
+
+    def edge_exists(self, u, v):
+        return v in self.neighbors(u)
+
+    def degree(self, vertex):
+        """
+        Returns the degree of the given vertex
+        """
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def neighbors(self, vertex):
+        """
+        Returns a zero-copy view of the neighbors of the given vertex
+        """
+        return self.adjacency[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def __reduce__(self):
+        # Memory views cannot be pickled, so the graph is sent to other processes as plain arrays
+        return CSRGraph, (array("q", self.offsets), array(_typecode(self.V), self.adjacency))
+
+    def close(self):
+        """
+        Releases the memory map backing the graph, if any. The graph cannot be used afterwards.
+        """
+        if self._buffer is not None:
+            if isinstance(self.offsets, memoryview):
+                self.offsets.release()
+            if isinstance(self.adjacency, memoryview):
+                self.adjacency.release()
+            self._buffer.close()
+            self._buffer = None
+
+
+def _typecode(num_vertices: int) -> str:
+    """
+    Picks the narrowest array typecode that can hold every vertex id.
+    """
+    return "i" if num_vertices < 2 ** 31 else "q"
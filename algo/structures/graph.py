@@ -1,4 +1,7 @@
-from typing import List
+from time import perf_counter
+from typing import List, Optional, Set, Tuple
+
+from algo.instrumentation import TRACER, timed
 
 
 class Node:
@@ -44,6 +47,46 @@ class Graph:
         node.next = self.adj_list[d]
         self.adj_list[d] = node
 
+    def add_edges(self, sources, targets):
+        """
+        Adds many undirected edges, given as parallel sequences of endpoints, linking the nodes exactly like
+        `add_edge`. The readers use it only to save the method call per edge.
+        """
+        adj_list = self.adj_list
+        for s, d in zip(sources, targets):
+            node = Node(d)
+            node.next = adj_list[s]
+            adj_list[s] = node
+
+            node = Node(s)
+            node.next = adj_list[d]
+            adj_list[d] = node
+
+    def remove_edge(self, s, d):
+        """
+        Removes one undirected edge between s and d, unlinking d from the list of s and s from the list of d.
+
+        Raises:
+            ValueError: If the edge does not exist.
+        """
+        if not self._unlink(s, d):
+            raise ValueError(f"Edge does not exist: ({s}, {d})")
+        self._unlink(d, s)
+
+    def _unlink(self, s, d):
+        prev = None
+        node = self.adj_list[s]
+        while node:
+            if node.vertex == d:
+                if prev is None:
+                    self.adj_list[s] = node.next
+                else:
+                    prev.next = node.next
+                return True
+            prev = node
+            node = node.next
+        return False
+
     def edge_exists(self, u, v):
         temp = self.adj_list[u]
         while temp:
@@ -123,7 +166,7 @@ def bron_kerbosch(graph: Graph, r=None, p=None, x=None):
 
     cliques = []
     for v in list(p):
-        neighbors = set(neighbor.vertex for neighbor in graph.adj_list[v])
+        neighbors = set(graph.neighbors(v))
         new_r = r | {v}
         new_p = p & neighbors
         new_x = x & neighbors
@@ -176,3 +219,143 @@ def terminal_clique_size2(graph: Graph):
     all_cliques = bron_kerbosch2(graph)
     terminal_clique = max(all_cliques, key=len)
     return len(terminal_clique)
+
+
+def degeneracy(graph: Graph) -> int:
+    """
+    Returns the degeneracy of the graph, the largest minimum degree met while repeatedly deleting a vertex of minimum
+    degree. Uses a bucket queue, so it runs in O(V + E). Parallel edges are counted once.
+    """
+    adjacency = [set(graph.neighbors(v)) for v in range(graph.V)]
+    degrees = [len(neighbors) for neighbors in adjacency]
+    buckets = [set() for _ in range(max(degrees, default=0) + 1)]
+    for v, d in enumerate(degrees):
+        buckets[d].add(v)
+
+    removed = [False] * graph.V
+    result = 0
+    smallest = 0
+    for _ in range(graph.V):
+        # Deleting a vertex lowers its neighbors by one, so the smallest non-empty bucket moves down at most one step
+        smallest = max(smallest - 1, 0)
+        while not buckets[smallest]:
+            smallest += 1
+        v = buckets[smallest].pop()
+        removed[v] = True
+        result = max(result, smallest)
+        for u in adjacency[v]:
+            if not removed[u]:
+                buckets[degrees[u]].discard(u)
+                degrees[u] -= 1
+                buckets[degrees[u]].add(u)
+    return result
+
+
+def greedy_clique(graph: Graph, seeds: int = 32, adjacency: Optional[List[Set[int]]] = None,
+                  deadline: Optional[float] = None) -> Set[int]:
+    """
+    Grows a clique greedily from each of the `seeds` vertices of largest degree, always adding the candidate of
+    largest degree, and returns the largest one found. Its size is a lower bound on the terminal clique size.
+
+    Args:
+        graph (Graph): The graph to search.
+        seeds (int): How many vertices to grow a clique from.
+        adjacency (Optional[List[Set[int]]]): The neighbor set of every vertex, if the caller already built them.
+        deadline (Optional[float]): A `perf_counter` value after which no further seeds are tried. The clique of the
+            first seed is always grown.
+    """
+    if adjacency is None:
+        adjacency = [set(graph.neighbors(v)) for v in range(graph.V)]
+    # Degrees are looked up once per candidate per step, so they are taken once from the neighbor sets
+    degrees = [len(neighbors) for neighbors in adjacency]
+    best = set()
+    starts = sorted(range(graph.V), key=degrees.__getitem__, reverse=True)[:seeds]
+    for start in starts:
+        if best and deadline is not None and perf_counter() > deadline:
+            break
+        clique = {start}
+        candidates = adjacency[start] - clique
+        while candidates:
+            v = max(candidates, key=degrees.__getitem__)
+            clique.add(v)
+            candidates &= adjacency[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+@timed("clique_bounds")
+def clique_bounds(graph: Graph) -> Tuple[int, int]:
+    """
+    Returns cheap lower and upper bounds on the terminal clique size: the size of a greedy clique, and the
+    degeneracy plus one, since every vertex of a clique of size k has degree k - 1 when the first of them is deleted.
+    """
+    if graph.V == 0:
+        return 0, 0
+    return len(greedy_clique(graph)), degeneracy(graph) + 1
+
+
+class _CliqueSearchTimeout(Exception):
+    pass
+
+
+@timed("maximum_clique")
+def maximum_clique(graph: Graph, timeout: Optional[float] = None) -> Tuple[Set[int], bool]:
+    """
+    Finds a maximum clique with a pivoting Bron–Kerbosch search that only follows branches which can still beat the
+    best clique found so far. The search starts from the greedy clique and stops after `timeout` seconds.
+
+    Args:
+        graph (Graph): The graph to search.
+        timeout (Optional[float]): How many seconds to search for, or None to search to the end.
+
+    Returns:
+        Tuple[Set[int], bool]: The largest clique found, and whether the search finished, i.e. whether the clique is
+        known to be maximum.
+    """
+    # The deadline covers building the neighbor sets and growing the greedy clique the search starts from
+    deadline = None if timeout is None else perf_counter() + timeout
+    adjacency = []
+    for v in range(graph.V):
+        if deadline is not None and perf_counter() > deadline:
+            break
+        adjacency.append(set(graph.neighbors(v)))
+    built = len(adjacency)
+    # A vertex whose neighbors were not read yet looks isolated, so a greedy clique ends at it and stays a clique
+    adjacency.extend(set() for _ in range(graph.V - built))
+    best = greedy_clique(graph, adjacency=adjacency, deadline=deadline)
+    if built < graph.V:
+        return best, False
+    tracing = TRACER.enabled
+    interval = TRACER.sample_interval
+    calls = 0
+
+    def expand(r: Set[int], p: Set[int], x: Set[int]) -> None:
+        nonlocal best, calls
+        if deadline is not None and perf_counter() > deadline:
+            raise _CliqueSearchTimeout()
+        if tracing:
+            calls += 1
+            if calls % interval == 0:
+                # The depth of the recursion is the size of the clique being grown
+                TRACER.counter("maximum_clique", depth=len(r), candidates=len(p), best=len(best))
+        if not p and not x:
+            if len(r) > len(best):
+                best = set(r)
+                if tracing:
+                    TRACER.instant("clique_improved", size=len(best))
+            return
+        if len(r) + len(p) <= len(best):
+            return
+
+        u = max(p | x, key=lambda v: len(p & adjacency[v]))
+        for v in list(p - adjacency[u]):
+            expand(r | {v}, p & adjacency[v], x & adjacency[v])
+            p.remove(v)
+            x.add(v)
+
+    try:
+        expand(set(), set(range(graph.V)), set())
+    except _CliqueSearchTimeout:
+        return best, False
+    return best, True
@@ -0,0 +1,131 @@
+from array import array
+from typing import Iterator, Sequence, Tuple, Union
+
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+class VarintGraph:
+    """
+    An immutable graph whose adjacency lists are sorted and stored as gap-encoded varints, in the spirit of WebGraph.
+
+    The record of vertex u starts at byte payload[offsets[u]] and holds the degree, the first neighbor as a
+    zigzag-encoded difference from u, and the gaps between consecutive neighbors minus one, each as an unsigned
+    LEB128 varint. `neighbors` decodes a single record lazily, so a vertex's neighborhood can be streamed without
+    decompressing the rest of the graph.
+    """
+
+    def __init__(self, offsets: Sequence[int], payload: Sequence[int], num_edges: int, buffer=None) -> None:
+        self.V = len(offsets) - 1
+        self.E = num_edges
+        self.offsets = memoryview(offsets) if isinstance(offsets, array) else offsets
+        self.payload = memoryview(payload) if isinstance(payload, (bytes, bytearray)) else payload
+        # Keeps the memory map backing the views alive for as long as the graph is
+        self._buffer = buffer
+
+    @classmethod
+    def from_graph(cls, graph: Union[Graph, CSRGraph]) -> "VarintGraph":
+        """
+        Encodes the adjacency lists of the given graph, dropping duplicate neighbors.
+        """
+        offsets = array("q")
+        payload = bytearray()
+        half_edges = 0
+        for u in range(graph.V):
+            offsets.append(len(payload))
+            neighbors = sorted(set(graph.neighbors(u)))
+            half_edges += len(neighbors)
+            encode_neighbors(u, neighbors, payload)
+        offsets.append(len(payload))
+        return cls(offsets, bytes(payload), half_edges // 2)
+
+    def vertices(self) -> list[int]:
+        return list(range(self.V))
+
+    def edges(self) -> list[tuple[int, int]]:
+        """
+        Returns a list of all edges in the graph as tuples (u, v), where u and v are connected vertices.
+        """
+        return [(u, v) for u in range(self.V) for v in self.neighbors(u) if u < v]
+
+    def edge_exists(self, u, v):
+        for neighbor in self.neighbors(u):
+            if neighbor >= v:
+                return neighbor == v
+        return False
+
+    def degree(self, vertex):
+        """
+        Returns the degree of the given vertex, decoding only the first varint of its record
+        """
+        return read_varint(self.payload, self.offsets[vertex])[0]
+
+    def neighbors(self, vertex) -> Iterator[int]:
+        """
+        Lazily yields the neighbors of the given vertex in ascending order
+        """
+        payload = self.payload
+        degree, position = read_varint(payload, self.offsets[vertex])
+        if degree == 0:
+            return
+        gap, position = read_varint(payload, position)
+        current = vertex + ((gap >> 1) ^ -(gap & 1))
+        yield current
+        for _ in range(degree - 1):
+            gap, position = read_varint(payload, position)
+            current += gap + 1
+            yield current
+
+    def close(self):
+        """
+        Releases the memory map backing the graph, if any. The graph cannot be used afterwards.
+        """
+        if self._buffer is not None:
+            if isinstance(self.offsets, memoryview):
+                self.offsets.release()
+            if isinstance(self.payload, memoryview):
+                self.payload.release()
+            self._buffer.close()
+            self._buffer = None
+
+
+def encode_neighbors(vertex: int, neighbors: Sequence[int], out: bytearray) -> None:
+    """
+    Appends the varint record of a vertex with the given sorted, distinct neighbors to `out`.
+    """
+    write_varint(len(neighbors), out)
+    if not neighbors:
+        return
+    first = neighbors[0] - vertex
+    # Zigzag encoding maps the signed difference to a non-negative integer
+    write_varint(first << 1 if first >= 0 else (-first << 1) - 1, out)
+    for previous, current in zip(neighbors, neighbors[1:]):
+        write_varint(current - previous - 1, out)
+
+
+def write_varint(value: int, out: bytearray) -> None:
+    """
+    Appends a non-negative integer to `out` as an unsigned LEB128 varint.
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: Sequence[int], position: int) -> Tuple[int, int]:
+    """
+    Decodes the unsigned LEB128 varint starting at data[position].
+
+    Returns:
+        Tuple[int, int]: The decoded value and the position just past it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
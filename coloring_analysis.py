@@ -1,6 +1,6 @@
 import random
 import time
-from typing import Dict
+from typing import Sequence
 from algo.generation.complete import generate_complete_graph
 from algo.generation.cyclic import generate_cyclic_graph
 from algo.generation.power_law import generate_power_law_random_graph
@@ -13,7 +13,6 @@ from algo.ordering.largest_original_degree_last import largest_original_degree_l
 from algo.ordering.incidence import incidence_ordering
 from algo.ordering.connected_sequential_ordering import connected_sequential_ordering
 from algo.coloring.greedy import greedy_coloring
-from algo.structures.graph import terminal_clique_size2
 import os
 import matplotlib.pyplot as plt
 
@@ -32,7 +31,7 @@ def test_orderings(graph: Graph):
     colors_used = {}
     tq_size = 0
 
-    deleted_degrees: Dict[int, int] = {}
+    deleted_degrees: Sequence[int] = []
     sl_order = []
 
     for method, func in orderings.items():
@@ -49,13 +48,10 @@ def test_orderings(graph: Graph):
         colors_used[method] = num_colors
 
         if method == "smallest_last":
-            deleted_degrees: Dict[int, int] = meta["deleted_degrees"]
-            max_deleted_degree = max(deleted_degrees.values())
-            smallest_last_max_dd = max_deleted_degree
+            deleted_degrees: Sequence[int] = meta["deleted_degrees"]
+            smallest_last_max_dd = meta["degeneracy"]
             sl_order = order
-
-            print("TQ")
-            tq_size = terminal_clique_size2(graph)
+            tq_size = meta["terminal_clique_size"]
 
 
 
@@ -0,0 +1,54 @@
+import csv
+import json
+
+import pytest
+
+from algo.batch import expand_graph_files, run_batch, write_batch_results
+from algo.generation.complete import generate_complete_graph
+from algo.generation.cyclic import generate_cyclic_graph
+from algo.serialization.csr import write_csr_graph
+from algo.serialization.dimacs import write_dimacs_graph
+from algo.serialization.graph import write_graph_to_file
+
+
+def test_run_batch(tmp_path):
+    write_graph_to_file(generate_complete_graph(6), str(tmp_path / "complete.txt"))
+    write_dimacs_graph(generate_cyclic_graph(7), str(tmp_path / "cyclic.col"))
+    write_csr_graph(generate_cyclic_graph(8), str(tmp_path / "even_cyclic.csr"))
+
+    graph_files = expand_graph_files([str(tmp_path / "*.txt"), str(tmp_path / "*.col"), str(tmp_path / "*.csr")])
+    results = run_batch(graph_files, ["smallest_last", "largest_last"], workers=2)
+
+    assert [(result["graph_file"], result["ordering"]) for result in results] == [
+        (graph_file, ordering) for graph_file in graph_files for ordering in ["smallest_last", "largest_last"]
+    ]
+    by_file = {result["graph_file"]: result for result in results if result["ordering"] == "smallest_last"}
+    assert by_file[str(tmp_path / "complete.txt")]["colors_used"] == 6
+    assert by_file[str(tmp_path / "complete.txt")]["degeneracy"] == 5
+    assert by_file[str(tmp_path / "cyclic.col")]["colors_used"] == 3
+    assert by_file[str(tmp_path / "cyclic.col")]["edges"] == 7
+    assert by_file[str(tmp_path / "even_cyclic.csr")]["colors_used"] == 2
+    assert by_file[str(tmp_path / "even_cyclic.csr")]["terminal_clique_size"] == 2
+
+
+def test_write_batch_results(tmp_path):
+    write_graph_to_file(generate_complete_graph(4), str(tmp_path / "complete.txt"))
+    results = run_batch([str(tmp_path / "complete.txt")], ["incidence"])
+
+    write_batch_results(results, str(tmp_path / "results.csv"))
+    with open(tmp_path / "results.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["ordering"] == "incidence"
+    assert rows[0]["colors_used"] == "4"
+    assert rows[0]["terminal_clique_size"] == ""
+
+    write_batch_results(results, str(tmp_path / "results.json"))
+    with open(tmp_path / "results.json") as file:
+        assert json.load(file) == results
+
+
+def test_batch_with_missing_file_or_invalid_ordering_raises_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        expand_graph_files([str(tmp_path / "*.txt")])
+    with pytest.raises(ValueError, match="Invalid ordering method: nope"):
+        run_batch([], ["nope"])
@@ -0,0 +1,95 @@
+import pytest
+
+from algo.benchmark import (benchmark_cases, compare_to_baseline, fit_scaling_exponent, measure, measure_relative,
+                            read_benchmark_results, run_benchmarks, write_benchmark_results)
+
+
+def test_fit_scaling_exponent():
+    sizes = [10, 20, 40, 80]
+    exponent, coefficient = fit_scaling_exponent(sizes, [3e-6 * size ** 2 for size in sizes])
+    assert exponent == pytest.approx(2)
+    assert coefficient == pytest.approx(3e-6)
+
+    with pytest.raises(ValueError):
+        fit_scaling_exponent([10, 10], [1.0, 2.0])
+
+
+def test_measure_runs_warmup_untimed():
+    calls = []
+    times = measure(lambda: calls.append(1), repeats=3, warmup=2, min_sample_time=0)
+    assert len(calls) == 5
+    assert len(times) == 3
+
+    # Fast calls are batched until a sample is long enough to time
+    calls = []
+    times = measure(lambda: calls.append(1), repeats=3, warmup=0, min_sample_time=0.001)
+    assert len(calls) > 100
+    assert len(times) == 3
+
+
+def test_measure_relative_pairs_every_sample_with_the_reference():
+    calls, references = [], []
+    times, reference_times = measure_relative(lambda: calls.append(1), lambda: references.append(1), repeats=4,
+                                              warmup=1, min_sample_time=0)
+    assert len(calls) == 5
+    assert len(references) == 4
+    assert len(times) == len(reference_times) == 4
+
+
+def test_benchmark_cases_cover_every_suite():
+    cases = benchmark_cases()
+    assert ("ordering", "smallest_last") in cases
+    assert ("generator", "random_geometric") in cases
+    assert ("coloring", "csr") in cases
+    assert ("loader", "dimacs") in cases
+
+    with pytest.raises(ValueError, match="Invalid benchmark suite"):
+        benchmark_cases(["nope"])
+
+
+def test_run_benchmarks_and_compare_to_baseline(tmp_path):
+    cases = [("ordering", "smallest_last"), ("generator", "cyclic"), ("coloring", "varint"), ("loader", "metis")]
+    results = run_benchmarks(cases, sizes=[20, 10], repeats=2, warmup=0, min_sample_time=0)
+    assert results["sizes"] == [10, 20]
+    assert set(results["cases"]) == {"ordering.smallest_last", "generator.cyclic", "coloring.varint", "loader.metis"}
+    record = results["cases"]["generator.cyclic"]
+    assert record["vertices"] == [10, 20]
+    assert record["edges"] == [10, 20]
+    assert len(record["median_times"]) == 2
+    assert all(relative > 0 for relative in record["relative_times"])
+
+    write_benchmark_results(results, str(tmp_path / "baseline.json"))
+    baseline = read_benchmark_results(str(tmp_path / "baseline.json"))
+    assert compare_to_baseline(results, baseline) == {}
+
+    # A case that got slower and scales worse fails both gates
+    baseline["cases"]["loader.metis"]["exponent"] = record["exponent"] - 1
+    slower = dict(results, cases={"loader.metis": dict(results["cases"]["loader.metis"],
+                                                       exponent=record["exponent"],
+                                                       relative_times=[100.0, 200.0],
+                                                       reference_times=[0.001, 0.001])})
+    baseline["cases"]["loader.metis"]["relative_times"] = [50.0, 200.0]
+    regressions = compare_to_baseline(slower, baseline)["loader.metis"]
+    assert len(regressions) == 2
+    assert regressions[0].startswith("scaling exponent")
+    assert "at 10 vertices" in regressions[1]
+
+    # Doubling a time too short to measure reliably is noise
+    slower["cases"]["loader.metis"]["relative_times"] = [0.4, 200.0]
+    baseline["cases"]["loader.metis"]["relative_times"] = [0.2, 200.0]
+    assert len(compare_to_baseline(slower, baseline)["loader.metis"]) == 1
+
+    # Times on other graphs are not compared
+    for setting, value in [("sizes", [10, 30]), ("density", 0.5), ("seed", 7)]:
+        with pytest.raises(ValueError, match=f"The baseline was run with {setting}"):
+            compare_to_baseline(results, dict(baseline, **{setting: value}))
+
+    with pytest.raises(FileNotFoundError):
+        read_benchmark_results(str(tmp_path / "missing.json"))
+
+
+def test_loaders_touch_memory_mapped_data():
+    results = run_benchmarks([("loader", "csr"), ("loader", "varint")], sizes=[50, 400], repeats=3)
+    for record in results["cases"].values():
+        # Walking the adjacency lists grows with the graph, unlike opening a memory map
+        assert record["relative_times"][1] > 10 * record["relative_times"][0]
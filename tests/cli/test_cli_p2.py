@@ -0,0 +1,82 @@
+import json
+import os
+import pstats
+import sys
+
+from algo.cli import cli_p2
+from algo.generation.complete import generate_complete_graph
+from algo.generation.cyclic import generate_cyclic_graph
+from algo.instrumentation import OPERATION_COUNTERS, PHASES, TRACER
+from algo.serialization.coloring import read_coloring_from_file
+from algo.serialization.graph import write_graph_to_file
+
+METRICS = ["input_file", "ordering", "vertices", "edges", "load_time", "ordering_time", "coloring_time", "colors_used",
+           "degeneracy", "peak_memory_bytes"]
+
+
+def run_cli_p2(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["cli_p2", "-i", "graph.txt", "-f", "coloring.txt", "--metrics-json",
+                                      "metrics.json", *args])
+    try:
+        cli_p2()
+    finally:
+        PHASES.reset()
+        TRACER.reset()
+    with open("metrics.json") as file:
+        return json.load(file)
+
+
+def test_cli_p2_metrics_with_smallest_last(tmp_path, monkeypatch):
+    # The CLI only accepts plain file names, so the files are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    write_graph_to_file(generate_complete_graph(6), "graph.txt")
+    metrics = run_cli_p2(monkeypatch, "-o", "smallest_last", "--count-operations")
+
+    assert list(metrics)[:len(METRICS)] == METRICS
+    assert metrics["input_file"] == "graph.txt"
+    assert metrics["ordering"] == "smallest_last"
+    assert metrics["vertices"] == 6
+    assert metrics["edges"] == 15
+    assert metrics["colors_used"] == 6
+    # Smallest last reports the degeneracy it found while peeling
+    assert metrics["degeneracy"] == 5
+    for key in ["load_time", "ordering_time", "coloring_time"]:
+        assert metrics[key] >= 0
+    assert metrics["peak_memory_bytes"] > 0
+    assert "phases" not in metrics
+
+    counts = metrics["operation_counts"]
+    assert set(counts) == {"ordering", "coloring"}
+    assert counts["ordering"]["degree_updates"] == 15
+    assert set(counts["coloring"]) == set(OPERATION_COUNTERS)
+    assert counts["coloring"]["color_probes"] > 0
+
+    coloring = read_coloring_from_file("coloring.txt")
+    assert len(set(coloring.values())) == 6
+
+
+def test_cli_p2_profile_and_trace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_graph_to_file(generate_cyclic_graph(8), "graph.txt")
+    metrics = run_cli_p2(monkeypatch, "-o", "largest_last", "--profile", "run", "--trace-memory", "--trace",
+                         "trace.json", "--trace-interval", "2")
+
+    assert metrics["vertices"] == 8
+    assert metrics["edges"] == 8
+    # The other orderings get the degeneracy from a separate pass
+    assert metrics["degeneracy"] == 2
+    assert "operation_counts" not in metrics
+    assert PHASES._stack == [] and not PHASES.enabled and not TRACER.enabled
+
+    phases = metrics["phases"]
+    for name in ["read_graph", "ordering.largest_last", "coloring"]:
+        assert phases[name]["calls"] == 1
+        assert phases[name]["time"] >= 0
+        assert phases[name]["peak_memory"] > 0
+        assert os.path.isfile(f"run.{name}.pstats")
+    assert pstats.Stats("run.coloring.pstats").total_calls > 0
+
+    with open("trace.json") as file:
+        events = json.load(file)["traceEvents"]
+    spans = {event["name"] for event in events if event["ph"] == "X"}
+    assert {"read_graph", "ordering.largest_last", "coloring"} <= spans
@@ -0,0 +1,29 @@
+import os
+import sys
+
+from algo.cli import pipeline
+from algo.serialization.coloring import read_coloring_from_file
+from algo.serialization.graph import read_graph_from_file
+from algo.serialization.index import index_path, read_graph_index
+
+
+def test_pipeline_writes_graph_index_and_coloring(tmp_path, monkeypatch):
+    # The CLI only accepts plain file names, so the files are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["pipeline", "-v", "30", "-e", "435", "-g", "complete", "-o", "smallest_last",
+                                      "-w", "graph.txt", "-f", "coloring.txt"])
+    pipeline()
+
+    graph = read_graph_from_file("graph.txt")
+    assert graph.V == 30
+    assert len(graph.edges()) == 30 * 29 // 2
+
+    assert os.path.isfile(index_path("graph.txt"))
+    with read_graph_index("graph.txt") as index:
+        assert index.V == 30
+        assert index.E == 30 * 29 // 2
+        assert index.max_degree() == 29
+
+    coloring = read_coloring_from_file("coloring.txt")
+    assert sorted(coloring) == list(range(30))
+    assert len(set(coloring.values())) == 30
@@ -0,0 +1,49 @@
+import random
+
+from algo.coloring.greedy import greedy_coloring
+from algo.generation.random_geometric import (generate_random_geometric_graph, geometric_edges,
+                                              radius_for_expected_edges)
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+
+
+def brute_force_edges(points, radius):
+    edges = set()
+    for u in range(len(points)):
+        for v in range(u + 1, len(points)):
+            if (points[u][0] - points[v][0]) ** 2 + (points[u][1] - points[v][1]) ** 2 <= radius ** 2:
+                edges.add((u, v))
+    return edges
+
+
+def test_geometric_edges_matches_brute_force():
+    rng = random.Random(1)
+    points = [(rng.random(), rng.random()) for _ in range(300)]
+    for radius in [0.01, 0.05, 0.2, 0.7, 2.0]:
+        edges = geometric_edges(points, radius)
+        assert len(edges) == len(set(edges))
+        assert set(edges) == brute_force_edges(points, radius)
+
+
+def test_geometric_edges_near_cell_boundaries():
+    points = [(0.0, 0.0), (0.1, 0.0), (0.2, 0.0), (0.999, 0.999), (1.0, 1.0)]
+    assert set(geometric_edges(points, 0.1)) == {(0, 1), (1, 2), (3, 4)}
+
+
+def test_generate_random_geometric_graph():
+    random.seed(42)
+    graph = generate_random_geometric_graph(200, 0.1)
+    assert len(graph.vertices()) == 200
+    for u, v in graph.edges():
+        assert u != v
+
+    ordering, _ = smallest_last_vertex_ordering(graph)
+    colors = greedy_coloring(graph, ordering)
+    for u, v in graph.edges():
+        assert colors[u] != colors[v]
+
+
+def test_radius_for_expected_edges():
+    random.seed(0)
+    radius = radius_for_expected_edges(1000, 5000)
+    graph = generate_random_geometric_graph(1000, radius)
+    assert 4000 < len(graph.edges()) < 5500
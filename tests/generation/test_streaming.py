@@ -0,0 +1,73 @@
+from algo.generation.streaming import (build_graph_from_chunks, derive_seed, stream_complete_graph, stream_cyclic_graph,
+                                       stream_power_law_random_graph, stream_skewed_random_graph,
+                                       stream_uniform_random_graph, streaming_partition_size, vertex_partitions)
+
+
+def collect_edges(chunks):
+    edges = []
+    for lo, hi, chunk_edges in chunks:
+        for u, v in chunk_edges:
+            assert lo <= u < hi
+            assert u < v
+        edges += chunk_edges
+    return edges
+
+
+def test_vertex_partitions():
+    assert vertex_partitions(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert vertex_partitions(3, 5) == [(0, 3)]
+
+
+def test_streaming_partition_size():
+    assert streaming_partition_size(1000, 500, 100) == 100
+    assert streaming_partition_size(1000, 0, 100) == 100
+    assert streaming_partition_size(10, 45, 1) == 1
+
+
+def test_stream_complete_graph():
+    edges = collect_edges(stream_complete_graph(6, 4))
+    assert sorted(edges) == [(u, v) for u in range(6) for v in range(u + 1, 6)]
+
+
+def test_stream_cyclic_graph():
+    edges = collect_edges(stream_cyclic_graph(5, 2))
+    assert set(edges) == {(0, 1), (1, 2), (2, 3), (3, 4), (0, 4)}
+
+
+def test_stream_random_graphs_have_distinct_edges():
+    for stream in [stream_uniform_random_graph, stream_skewed_random_graph, stream_power_law_random_graph]:
+        edges = collect_edges(stream(50, 300, 7))
+        assert len(edges) == 300
+        assert len(set(edges)) == 300
+
+
+def test_stream_random_graph_dense():
+    edges = collect_edges(stream_uniform_random_graph(10, 45, 3))
+    assert sorted(edges) == [(u, v) for u in range(10) for v in range(u + 1, 10)]
+
+
+def test_derive_seed_is_stable_and_distinct():
+    assert derive_seed(42, 0) == derive_seed(42, 0)
+    assert derive_seed(42, 0) != derive_seed(42, 1)
+    assert derive_seed(42, 0) != derive_seed(43, 0)
+
+
+def test_seeded_stream_is_reproducible():
+    first = collect_edges(stream_uniform_random_graph(60, 400, 8, seed=7))
+    second = collect_edges(stream_uniform_random_graph(60, 400, 8, seed=7))
+    other = collect_edges(stream_uniform_random_graph(60, 400, 8, seed=8))
+    assert first == second
+    assert first != other
+
+
+def test_seeded_stream_is_independent_of_worker_count():
+    for stream in [stream_uniform_random_graph, stream_skewed_random_graph, stream_power_law_random_graph]:
+        serial = collect_edges(stream(80, 500, 9, seed=3))
+        parallel = collect_edges(stream(80, 500, 9, seed=3, workers=3))
+        assert serial == parallel
+
+
+def test_build_graph_from_chunks():
+    graph = build_graph_from_chunks(5, stream_cyclic_graph(5, 2))
+    assert graph.V == 5
+    assert set(graph.edges()) == {(0, 1), (1, 2), (2, 3), (3, 4), (0, 4)}
@@ -0,0 +1,153 @@
+import json
+import os
+import pstats
+
+from algo.coloring.greedy import greedy_coloring
+from algo.generation.complete import generate_complete_graph
+from algo.instrumentation import (PHASES, TRACER, PhaseTimers, operation_counts, peak_memory_bytes,
+                                  write_metrics_json)
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.registry import ORDERINGS
+from algo.serialization.graph import read_graph_from_file, write_graph_to_file
+from algo.structures.graph import Graph, maximum_clique
+
+
+def test_write_metrics_json(tmp_path):
+    temp_file = str(tmp_path / "metrics.json")
+    metrics = {"vertices": 5, "edges": 4, "ordering_time": 0.25, "peak_memory_bytes": peak_memory_bytes()}
+    write_metrics_json(metrics, temp_file)
+
+    with open(temp_file) as file:
+        assert json.load(file) == metrics
+    # A few megabytes at the least, so kilobytes were scaled to bytes
+    assert metrics["peak_memory_bytes"] is None or metrics["peak_memory_bytes"] > 1 << 20
+
+
+def test_phase_timers_record_nested_phases(tmp_path):
+    timers = PhaseTimers()
+
+    @timers.timed("outer")
+    def outer():
+        with timers.phase("inner"):
+            block = [0] * 100_000
+        with timers.phase("inner"):
+            pass
+        return len(block)
+
+    assert outer() == 100_000
+    assert timers.report() == {}
+
+    timers.enable(profile=True, trace_memory=True)
+    assert outer() == 100_000
+    timers.disable()
+
+    report = timers.report()
+    assert list(report) == ["inner", "outer"]
+    assert report["inner"]["calls"] == 2
+    assert report["outer"]["calls"] == 1
+    assert report["outer"]["time"] >= report["inner"]["time"]
+    # The list allocated by the inner phase counts towards the outer phase's peak too
+    assert report["inner"]["peak_memory"] >= 800_000
+    assert report["outer"]["peak_memory"] >= report["inner"]["peak_memory"]
+
+    paths = timers.write_profiles(str(tmp_path / "run"))
+    assert sorted(os.path.basename(path) for path in paths) == ["run.inner.pstats", "run.outer.pstats"]
+    assert pstats.Stats(paths[0]).total_calls > 0
+
+
+def test_library_phases(tmp_path):
+    temp_file = str(tmp_path / "graph.txt")
+    write_graph_to_file(generate_complete_graph(10), temp_file)
+
+    PHASES.enable()
+    try:
+        graph = read_graph_from_file(temp_file)
+        greedy_coloring(graph, smallest_last_vertex_ordering(graph)[0])
+    finally:
+        PHASES.disable()
+    report = PHASES.report()
+    PHASES.reset()
+
+    assert set(report) == {"read_graph", "parse_graph", "build_graph", "ordering.smallest_last", "coloring"}
+    assert all(record["calls"] == 1 and record["peak_memory"] is None for record in report.values())
+
+
+def test_tracer_exports_chrome_trace(tmp_path):
+    graph = generate_complete_graph(40)
+    TRACER.enable(sample_interval=8)
+    try:
+        with TRACER.span("run", graph="complete"):
+            order, _ = smallest_last_vertex_ordering(graph)
+            greedy_coloring(graph, order)
+            maximum_clique(graph)
+    finally:
+        TRACER.disable()
+    # Tracing alone leaves no phase behind on the stack of the disabled registry
+    assert PHASES._stack == []
+    temp_file = str(tmp_path / "trace.json")
+    TRACER.write_chrome_trace(temp_file)
+    TRACER.reset()
+
+    with open(temp_file) as file:
+        events = json.load(file)["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert set(spans) == {"run", "ordering.smallest_last", "coloring", "maximum_clique"}
+    assert spans["run"]["args"] == {"graph": "complete"}
+    assert spans["run"]["dur"] >= spans["ordering.smallest_last"]["dur"] + spans["coloring"]["dur"]
+
+    samples = [event for event in events if event["ph"] == "C" and event["name"] == "smallest_last"]
+    assert [sample["args"]["remaining"] for sample in samples] == [32, 24, 16, 8, 0]
+    coloring = [event["args"] for event in events if event["ph"] == "C" and event["name"] == "coloring"]
+    assert coloring[-1] == {"colored": 40, "colors_used": 40}
+    # The whole graph is a clique, so smallest last finds it on the first vertex
+    assert [event["args"] for event in events if event["ph"] == "i"] == [{"size": 40}]
+
+
+def test_disabled_tracer_records_nothing():
+    graph = generate_complete_graph(10)
+    greedy_coloring(graph, smallest_last_vertex_ordering(graph)[0])
+    with TRACER.span("run"):
+        pass
+    assert TRACER.events == []
+
+
+def test_operation_counts_on_a_complete_graph():
+    ordering, meta = smallest_last_vertex_ordering(generate_complete_graph(5), count_operations=True)
+    # Every round scans the remaining vertices and lowers the degree of each of them
+    assert meta["operation_counts"] == {"vertex_scans": 15, "degree_lookups": 5, "neighbor_visits": 20,
+                                        "degree_updates": 10, "color_probes": 0}
+    assert "operation_counts" not in smallest_last_vertex_ordering(generate_complete_graph(5))[1]
+
+    counts = operation_counts()
+    greedy_coloring(generate_complete_graph(5), ordering, counts)
+    # The i-th colored vertex probes colors until it finds the first free one, i + 1 of them
+    assert counts["color_probes"] == 15
+    assert counts["neighbor_visits"] == 20
+
+
+
+def test_operation_counts_of_every_ordering():
+    # A triangle 0-1-2 with a path to vertex 3 and leaves 4 and 5 on it, with degrees 2, 2, 3, 3, 1 and 1
+    graph = Graph(6)
+    for u, v in [(0, 1), (0, 2), (1, 2), (2, 3), (3, 4), (3, 5)]:
+        graph.add_edge(u, v)
+
+    expected_counts = {
+        # One scan of the remaining vertices per round, and one degree update per edge
+        "smallest_last": {"vertex_scans": 21, "degree_lookups": 6, "neighbor_visits": 12, "degree_updates": 6},
+        # Two scans of the remaining vertices per round
+        "smallest_original_degree_last": {"vertex_scans": 42, "degree_lookups": 6},
+        # One scan of all vertices per round
+        "largest_last": {"vertex_scans": 36, "degree_lookups": 6},
+        # Two scans of all vertices per round
+        "largest_original_degree_last": {"vertex_scans": 72, "degree_lookups": 6},
+        # Every round visits the neighbors of the remaining vertices and looks up the degree of each
+        "incidence": {"vertex_scans": 21, "degree_lookups": 48, "neighbor_visits": 48},
+        "connected_sequential": {"vertex_scans": 36, "degree_lookups": 27, "neighbor_visits": 50},
+    }
+    assert set(expected_counts) == set(ORDERINGS)
+
+    for ordering, expected in expected_counts.items():
+        _, meta = ORDERINGS[ordering](graph, count_operations=True)
+        assert meta["operation_counts"] == {**operation_counts(), **expected}, ordering
+        assert "operation_counts" not in ORDERINGS[ordering](graph)[1]
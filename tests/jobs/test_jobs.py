@@ -0,0 +1,163 @@
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.generation.cyclic import generate_cyclic_graph
+from algo.jobs import JobDeadlineExceeded, JobQueue, QueueFullError, graph_fingerprint
+from algo.structures.csr import CSRGraph
+
+
+def blocking_queue(max_pending=8):
+    """
+    A single worker queue whose jobs record their graph size and wait for `release` to be set.
+    """
+    release = threading.Event()
+    started = []
+
+    def function(graph, ordering):
+        started.append(graph.V)
+        release.wait(5)
+        return {"vertices": graph.V, "ordering": ordering}
+
+    jobs = JobQueue(workers=1, max_pending=max_pending, executor=ThreadPoolExecutor(max_workers=1), function=function)
+    return jobs, release, started
+
+
+def wait_until_running(jobs):
+    while jobs.metrics()["running"] == 0:
+        time.sleep(0.001)
+
+
+def test_jobs_color_graphs_on_worker_processes():
+    with JobQueue(workers=2) as jobs:
+        submitted = [jobs.submit(CSRGraph.from_graph(generate_complete_graph(v)), "smallest_last") for v in (3, 6)]
+        assert [job.result(30)["colors_used"] for job in submitted] == [3, 6]
+        assert jobs.metrics()["completed"] == 2
+
+
+def test_fingerprint_ignores_representation():
+    graph = generate_cyclic_graph(6)
+    assert graph_fingerprint(graph) == graph_fingerprint(CSRGraph.from_graph(graph))
+    assert graph_fingerprint(graph) != graph_fingerprint(generate_cyclic_graph(7))
+
+
+def test_priority_and_coalescing():
+    jobs, release, started = blocking_queue()
+    jobs.submit(generate_complete_graph(1), "incidence")
+    wait_until_running(jobs)
+    low = jobs.submit(generate_complete_graph(2), "incidence", priority="low")
+    normal = jobs.submit(generate_complete_graph(3), "incidence")
+    high = jobs.submit(generate_complete_graph(4), "incidence", priority="high")
+
+    # The same graph and ordering joins the waiting job and lifts it to the higher priority
+    joined = jobs.submit(generate_complete_graph(2), "incidence", priority="high")
+    assert low.priority == joined.priority == "high"
+    jobs.submit(generate_complete_graph(2), "smallest_last")
+
+    release.set()
+    assert high.result(5) == {"vertices": 4, "ordering": "incidence"}
+    assert joined.result(5) == low.result(5) == {"vertices": 2, "ordering": "incidence"}
+    jobs.close()
+    assert low.done() and normal.done()
+    assert started == [1, 4, 2, 3, 2]
+
+    metrics = jobs.metrics()
+    assert metrics["submitted"] == 5
+    assert metrics["coalesced"] == 1
+    assert metrics["completed"] == 5
+    assert metrics["max_queue_depth"] == 4
+    assert metrics["total_time"]["count"] == 5
+
+
+def test_backpressure():
+    jobs, release, _ = blocking_queue(max_pending=1)
+    jobs.submit(generate_complete_graph(1), "incidence")
+    wait_until_running(jobs)
+    jobs.submit(generate_complete_graph(2), "incidence")
+
+    with pytest.raises(QueueFullError):
+        jobs.submit(generate_complete_graph(3), "incidence", block=False)
+    with pytest.raises(QueueFullError):
+        jobs.submit(generate_complete_graph(3), "incidence", timeout=0.05)
+    # Coalescing needs no room
+    jobs.submit(generate_complete_graph(2), "incidence", block=False)
+
+    release.set()
+    assert jobs.submit(generate_complete_graph(3), "incidence", timeout=5).result(5)["vertices"] == 3
+    jobs.close()
+
+
+def test_cancellation_and_deadlines():
+    jobs, release, started = blocking_queue()
+    running = jobs.submit(generate_complete_graph(1), "incidence", deadline=0.1)
+    wait_until_running(jobs)
+    cancelled = jobs.submit(generate_complete_graph(2), "incidence")
+    expired = jobs.submit(generate_complete_graph(3), "incidence", deadline=0.05)
+
+    assert cancelled.cancel()
+    with pytest.raises(JobDeadlineExceeded):
+        expired.result(5)
+    assert jobs.metrics()["queue_depth"] == 0
+
+    time.sleep(0.1)
+    release.set()
+    # A running job is not interrupted, but a result after its deadline is not delivered
+    with pytest.raises(JobDeadlineExceeded):
+        running.result(5)
+    with pytest.raises(CancelledError):
+        cancelled.result()
+    assert not running.cancel()
+    jobs.close()
+
+    assert started == [1]
+    metrics = jobs.metrics()
+    assert metrics["cancelled"] == 1
+    assert metrics["expired"] == 2
+
+    with pytest.raises(RuntimeError, match="closed"):
+        jobs.submit(generate_complete_graph(1), "incidence")
+
+    with JobQueue(workers=1, executor=ThreadPoolExecutor(max_workers=1)) as jobs:
+        with pytest.raises(ValueError, match="Invalid priority"):
+            jobs.submit(generate_complete_graph(1), "incidence", priority="urgent")
+
+
+def test_coalesced_deadlines_and_cancellation():
+    jobs, release, started = blocking_queue()
+    running = jobs.submit(generate_complete_graph(1), "incidence", deadline=0.05)
+    wait_until_running(jobs)
+
+    # The result stops waiting at the deadline instead of when the running job finishes
+    start_time = time.monotonic()
+    with pytest.raises(JobDeadlineExceeded):
+        running.result(5)
+    assert time.monotonic() - start_time < 1
+
+    # A later or missing deadline of another submitter does not stretch an earlier one
+    early = jobs.submit(generate_complete_graph(2), "incidence", deadline=0.05)
+    patient = jobs.submit(generate_complete_graph(2), "incidence")
+    with pytest.raises(JobDeadlineExceeded):
+        early.result(5)
+
+    # Cancelling withdraws only that submitter, and the job once no submitter is left
+    withdrawn = jobs.submit(generate_complete_graph(2), "incidence")
+    assert withdrawn.cancel() and withdrawn.done()
+    with pytest.raises(CancelledError):
+        withdrawn.result()
+    alone = jobs.submit(generate_complete_graph(3), "incidence")
+    assert alone.cancel()
+    assert jobs.metrics()["queue_depth"] == 1
+
+    release.set()
+    assert patient.result(5) == {"vertices": 2, "ordering": "incidence"}
+    jobs.close()
+
+    assert started == [1, 2]
+    metrics = jobs.metrics()
+    assert metrics["coalesced"] == 2
+    assert metrics["cancelled"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["expired"] == 1
@@ -1,5 +1,5 @@
 from algo.structures.graph import Graph
-from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.ordering.smallest_last import core_numbers, deleted_degree_summary, smallest_last_vertex_ordering
 
 def test_smallest_last_vertex_ordering_1():
     g = Graph(6)
@@ -58,7 +58,7 @@ def test_smallest_last_vertex_ordering_degrees_1():
     deleted_degrees = meta['deleted_degrees']
 
     assert ordering == [0, 1, 2, 3, 4]
-    assert deleted_degrees == {0: 1, 1: 1, 2: 1, 3: 1, 4:0}
+    assert list(deleted_degrees) == [1, 1, 1, 1, 0]
 
 def test_smallest_last_vertex_ordering_degrees_2():
     graph = Graph(6)
@@ -72,4 +72,48 @@ def test_smallest_last_vertex_ordering_degrees_2():
     deleted_degrees = meta['deleted_degrees']
 
     assert ordering == [0, 1, 2, 3, 4, 5]
-    assert deleted_degrees == {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 0}
+    assert list(deleted_degrees) == [1, 1, 1, 1, 1, 0]
+
+def test_smallest_last_vertex_ordering_terminal_clique():
+    graph = Graph(7)
+    # A 4-clique on 3, 4, 5, 6 with a path 0 - 1 - 2 hanging off vertex 3
+    for u in range(3, 7):
+        for v in range(u + 1, 7):
+            graph.add_edge(u, v)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+
+    ordering, meta = smallest_last_vertex_ordering(graph)
+
+    assert sorted(meta['terminal_clique']) == [3, 4, 5, 6]
+    assert meta['terminal_clique'] == ordering[-4:]
+    assert meta['terminal_clique_size'] == 4
+    assert meta['degeneracy'] == 3
+
+def test_smallest_last_vertex_ordering_terminal_clique_of_cycle():
+    graph = Graph(5)
+    for u in range(5):
+        graph.add_edge(u, (u + 1) % 5)
+
+    _, meta = smallest_last_vertex_ordering(graph)
+
+    assert meta['terminal_clique_size'] == 2
+    assert meta['degeneracy'] == 2
+
+def test_deleted_degree_summary():
+    graph = Graph(7)
+    for u in range(3, 7):
+        for v in range(u + 1, 7):
+            graph.add_edge(u, v)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+
+    ordering, meta = smallest_last_vertex_ordering(graph)
+    summary = deleted_degree_summary(ordering, meta['deleted_degrees'])
+
+    assert list(core_numbers(ordering, meta['deleted_degrees'])) == [1, 1, 1, 3, 3, 3, 3]
+    assert summary['max_deleted_degree'] == 3
+    assert summary['deleted_degree_histogram'] == [1, 4, 1, 1]
+    assert summary['core_number_histogram'] == [0, 3, 0, 4]
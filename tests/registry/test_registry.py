@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.registry import GENERATORS, ORDERINGS, STREAMING_GENERATORS, LazyRegistry
+
+
+def test_registry_resolves_names():
+    assert ORDERINGS["smallest_last"] is smallest_last_vertex_ordering
+    assert "smallest_last" in ORDERINGS
+    assert "nope" not in ORDERINGS
+    assert set(STREAMING_GENERATORS) < set(GENERATORS)
+    for registry in (ORDERINGS, GENERATORS, STREAMING_GENERATORS):
+        assert all(callable(registry[name]) for name in registry)
+
+    with pytest.raises(KeyError):
+        ORDERINGS["nope"]
+
+
+def test_registry_imports_lazily():
+    registry = LazyRegistry({"dump": "json:dumps", "missing": "algo.no_such_module:function"})
+    assert list(registry) == ["dump", "missing"]
+    assert registry.target("missing") == "algo.no_such_module:function"
+    assert registry["dump"]([1]) == "[1]"
+    with pytest.raises(ImportError):
+        registry["missing"]
+
+
+def test_cli_imports_no_methods_up_front():
+    code = ("import sys, algo.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith(('algo.ordering.', 'algo.generation.'))))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
@@ -0,0 +1,39 @@
+import pytest
+
+from algo.serialization.coloring import read_coloring_from_file, write_coloring_to_file
+
+
+def test_write_and_read_text_coloring(tmp_path):
+    coloring = {2: 0, 0: 1, 1: 2, 3: 0}
+
+    temp_file = tmp_path / "coloring.txt"
+    write_coloring_to_file(coloring, str(temp_file), buffer_size=4)
+
+    assert temp_file.read_text() == "2,0\n0,1\n1,2\n3,0\n"
+    assert read_coloring_from_file(str(temp_file)) == coloring
+
+
+def test_write_and_read_binary_coloring(tmp_path):
+    coloring = {vertex: vertex % 7 for vertex in range(10_000)}
+    del coloring[17]
+
+    temp_file = tmp_path / "coloring.bin"
+    write_coloring_to_file(coloring, str(temp_file))
+
+    assert temp_file.stat().st_size == 16 + 4 * 10_000
+    assert read_coloring_from_file(str(temp_file)) == coloring
+
+
+def test_binary_flag_overrides_extension(tmp_path):
+    temp_file = tmp_path / "coloring.txt"
+    write_coloring_to_file({0: 0, 1: 1}, str(temp_file), binary=True)
+    assert temp_file.read_bytes()[:4] == b"COLR"
+    assert read_coloring_from_file(str(temp_file)) == {0: 0, 1: 1}
+
+
+def test_read_truncated_binary_coloring_raises_error(tmp_path):
+    temp_file = tmp_path / "coloring.bin"
+    write_coloring_to_file({0: 0, 1: 1, 2: 0}, str(temp_file))
+    temp_file.write_bytes(temp_file.read_bytes()[:-2])
+    with pytest.raises(ValueError, match="truncated"):
+        read_coloring_from_file(str(temp_file))
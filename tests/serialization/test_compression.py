@@ -0,0 +1,78 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.serialization.compression import (ReadAheadReader, detect_compression, open_graph_file,
+                                            strip_compression_extension)
+from algo.serialization.files import graph_format, read_graph, write_graph
+from algo.serialization.graph import read_graph_from_file, write_graph_to_file
+
+
+def test_write_and_read_compressed_graph(tmp_path):
+    graph = generate_complete_graph(20)
+
+    for extension, module in [(".gz", gzip), (".bz2", bz2), (".xz", lzma)]:
+        temp_file = tmp_path / f"complete_graph.txt{extension}"
+        write_graph_to_file(graph, str(temp_file))
+
+        assert detect_compression(str(temp_file)) is module
+
+        graph_from_file = read_graph_from_file(str(temp_file), chunk_size=64)
+        assert graph_from_file.V == graph.V
+        assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_compression_is_detected_from_magic_bytes(tmp_path):
+    graph = generate_complete_graph(5)
+
+    plain_file = tmp_path / "plain.txt"
+    write_graph_to_file(graph, str(plain_file))
+    assert detect_compression(str(plain_file)) is None
+
+    # A gzip file without the .gz extension is still decompressed
+    disguised_file = tmp_path / "disguised.txt"
+    disguised_file.write_bytes(gzip.compress(plain_file.read_bytes()))
+
+    graph_from_file = read_graph_from_file(str(disguised_file), workers=4)
+    assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_compressed_formats_by_extension(tmp_path):
+    graph = generate_complete_graph(6)
+    for filename in ["graph.col.gz", "graph.edges.bz2", "graph.metis.xz"]:
+        write_graph(graph, str(tmp_path / filename))
+        graph_from_file = read_graph(str(tmp_path / filename))
+        assert set(graph_from_file.edges()) == set(graph.edges())
+
+    assert strip_compression_extension("graph.col.gz") == "graph.col"
+    assert graph_format("graph.col.gz") == ".col"
+    with pytest.raises(ValueError, match="cannot be compressed"):
+        graph_format("graph.csr.gz")
+
+
+def test_read_ahead_reader(tmp_path):
+    data = bytes(range(256)) * 1000
+    temp_file = tmp_path / "data.bin"
+    temp_file.write_bytes(data)
+
+    with ReadAheadReader(open(temp_file, "rb"), chunk_size=1000, depth=2) as reader:
+        parts = [reader.read(3000), reader.read(7), reader.read()]
+    assert b"".join(parts) == data
+    assert len(parts[0]) == 3000
+
+
+def test_read_ahead_reader_closes_early(tmp_path):
+    temp_file = tmp_path / "data.bin"
+    temp_file.write_bytes(b"x" * 100000)
+
+    with open_graph_file(str(temp_file), "rb") as plain:
+        assert plain.read(4) == b"xxxx"
+
+    gz_file = tmp_path / "data.bin.gz"
+    gz_file.write_bytes(gzip.compress(b"x" * 100000))
+    reader = open_graph_file(str(gz_file), "rb", chunk_size=10)
+    assert reader.read(5) == b"xxxxx"
+    reader.close()
@@ -0,0 +1,118 @@
+import pytest
+
+from algo.coloring.greedy import greedy_coloring
+from algo.generation.complete import generate_complete_graph
+from algo.generation.uniform_random import generate_uniform_random_graph
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.serialization.csr import edge_list_to_csr, read_csr_graph, write_csr_graph, write_csr_graph_from_edges
+from algo.serialization.files import read_graph, write_graph
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def test_write_and_read_csr_graph(tmp_path):
+    graph = Graph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 0)
+
+    temp_file = tmp_path / "test_graph.csr"
+    write_csr_graph(graph, str(temp_file))
+
+    graph_from_file = read_csr_graph(str(temp_file))
+
+    assert graph.V == graph_from_file.V
+    for vertex in graph.vertices():
+        assert set(graph.neighbors(vertex)) == set(graph_from_file.neighbors(vertex))
+    graph_from_file.close()
+
+
+def test_csr_graph_is_memory_mapped(tmp_path):
+    temp_file = tmp_path / "complete_graph.csr"
+    write_csr_graph(generate_complete_graph(50), str(temp_file))
+
+    graph_from_file = read_csr_graph(str(temp_file))
+    assert isinstance(graph_from_file.neighbors(0), memoryview)
+    assert graph_from_file.neighbors(0).obj is graph_from_file.adjacency.obj
+    assert len(graph_from_file.edges()) == 50 * 49 // 2
+    graph_from_file.close()
+
+
+def test_write_empty_csr_graph_raises_error(tmp_path):
+    with pytest.raises(ValueError, match="Cannot write an empty graph to a file"):
+        write_csr_graph(Graph(0), str(tmp_path / "empty.csr"))
+
+
+def test_read_invalid_csr_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "not_a_graph.csr"
+    temp_file.write_bytes(b"1 2\n0\n0\n" * 4)
+    with pytest.raises(ValueError, match="not a CSR graph file"):
+        read_csr_graph(str(temp_file))
+
+
+def test_read_truncated_csr_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "truncated.csr"
+    write_csr_graph(generate_complete_graph(4), str(temp_file))
+    temp_file.write_bytes(temp_file.read_bytes()[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        read_csr_graph(str(temp_file))
+
+
+def test_read_and_write_graph_by_extension(tmp_path):
+    graph = generate_complete_graph(5)
+
+    write_graph(graph, str(tmp_path / "graph.csr"))
+    write_graph(graph, str(tmp_path / "graph.txt"))
+
+    from_csr = read_graph(str(tmp_path / "graph.csr"))
+    from_text = read_graph(str(tmp_path / "graph.txt"))
+    assert isinstance(from_csr, CSRGraph)
+    assert isinstance(from_text, Graph)
+    assert set(from_csr.edges()) == set(from_text.edges()) == set(graph.edges())
+    from_csr.close()
+
+
+def test_write_csr_graph_from_edges_with_external_sort(tmp_path):
+    graph = generate_uniform_random_graph(60, 300)
+    # Every edge is listed in both directions and some twice, across many small runs
+    edges = [(u, v) for u in graph.vertices() for v in graph.neighbors(u)]
+
+    temp_file = str(tmp_path / "external.csr")
+    write_csr_graph_from_edges(edges, temp_file, num_vertices=62, run_size=64, temp_dir=str(tmp_path))
+
+    graph_from_file = read_csr_graph(temp_file)
+    assert graph_from_file.V == 62
+    assert set(graph_from_file.edges()) == set(graph.edges())
+    for vertex in graph.vertices():
+        assert list(graph_from_file.neighbors(vertex)) == sorted(set(graph.neighbors(vertex)))
+    assert graph_from_file.degree(61) == 0
+
+    ordering, _ = smallest_last_vertex_ordering(graph_from_file)
+    coloring = greedy_coloring(graph_from_file, ordering)
+    assert all(coloring[u] != coloring[v] for u, v in graph.edges())
+    graph_from_file.close()
+    assert [path.name for path in tmp_path.iterdir()] == ["external.csr"]
+
+
+def test_edge_list_to_csr(tmp_path):
+    edge_list_file = tmp_path / "graph.edges"
+    edge_list_file.write_text("# Nodes: 6 Edges: 3\n0 1\n2 1\n1 0\n4 2\n")
+
+    csr_file = str(tmp_path / "graph.csr")
+    edge_list_to_csr(str(edge_list_file), csr_file, run_size=2)
+
+    graph_from_file = read_csr_graph(csr_file)
+    assert graph_from_file.V == 6
+    assert sorted(graph_from_file.edges()) == [(0, 1), (1, 2), (2, 4)]
+    graph_from_file.close()
+
+
+def test_write_csr_graph_from_invalid_edges_raises_error(tmp_path):
+    temp_file = str(tmp_path / "invalid.csr")
+    with pytest.raises(ValueError, match=r"Self-loops are not allowed: \(2, 2\)"):
+        write_csr_graph_from_edges([(0, 1), (2, 2)], temp_file)
+    with pytest.raises(ValueError, match="Invalid vertex number: 5"):
+        write_csr_graph_from_edges([(0, 5)], temp_file, num_vertices=3)
+    with pytest.raises(ValueError, match="Cannot write an empty graph to a file"):
+        write_csr_graph_from_edges([], temp_file)
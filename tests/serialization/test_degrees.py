@@ -0,0 +1,17 @@
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.serialization.degrees import write_degree_profile_to_file
+from algo.structures.graph import Graph
+
+
+def test_write_degree_profile_to_file(tmp_path):
+    graph = Graph(4)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 0)
+    graph.add_edge(2, 3)
+
+    ordering, meta = smallest_last_vertex_ordering(graph)
+    temp_file = tmp_path / "degrees.txt"
+    write_degree_profile_to_file(ordering, meta['deleted_degrees'], str(temp_file))
+
+    assert temp_file.read_text().splitlines() == ["3,1,1", "0,2,2", "1,1,2", "2,0,2"]
@@ -0,0 +1,62 @@
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.serialization.dimacs import read_dimacs_graph, write_dimacs_graph
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def test_write_and_read_dimacs_graph(tmp_path):
+    graph = Graph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 0)
+
+    temp_file = tmp_path / "test_graph.col"
+    write_dimacs_graph(graph, str(temp_file))
+
+    assert temp_file.read_text().splitlines()[0] == "p edge 5 4"
+
+    graph_from_file = read_dimacs_graph(str(temp_file))
+    assert graph_from_file.V == 5
+    assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_read_dimacs_graph_with_comments_and_duplicates(tmp_path):
+    temp_file = tmp_path / "myciel.col"
+    temp_file.write_text("c a small instance\nc\np edge 4 4\ne 1 2\ne 2 1\ne 2 3\ne 4 3\n")
+
+    graph_from_file = read_dimacs_graph(str(temp_file), chunk_size=5)
+    assert graph_from_file.V == 4
+    assert set(graph_from_file.edges()) == {(0, 1), (1, 2), (2, 3)}
+    assert graph_from_file.degree(1) == 2
+
+
+def test_read_dimacs_graph_as_csr(tmp_path):
+    temp_file = tmp_path / "complete.col"
+    write_dimacs_graph(generate_complete_graph(6), str(temp_file))
+
+    graph_from_file = read_dimacs_graph(str(temp_file), as_csr=True)
+    assert isinstance(graph_from_file, CSRGraph)
+    assert len(graph_from_file.edges()) == 15
+
+
+def test_read_invalid_dimacs_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "invalid.col"
+
+    temp_file.write_text("e 1 2\n")
+    with pytest.raises(ValueError, match="Edge found before the problem line"):
+        read_dimacs_graph(str(temp_file))
+
+    temp_file.write_text("p edge 2 1\ne 1 3\n")
+    with pytest.raises(ValueError, match="Invalid vertex number: 3"):
+        read_dimacs_graph(str(temp_file))
+
+    temp_file.write_text("p edge 2 1\ne 2 2\n")
+    with pytest.raises(ValueError, match=r"Self-loops are not allowed: \(1, 1\)"):
+        read_dimacs_graph(str(temp_file))
+
+    temp_file.write_text("c nothing here\n")
+    with pytest.raises(ValueError, match="no problem line"):
+        read_dimacs_graph(str(temp_file))
@@ -0,0 +1,47 @@
+import pytest
+
+from algo.serialization.edge_list import read_edge_list_graph, write_edge_list_graph
+from algo.structures.graph import Graph
+
+
+def test_write_and_read_edge_list_graph(tmp_path):
+    graph = Graph(6)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 4)
+
+    temp_file = tmp_path / "test_graph.edges"
+    write_edge_list_graph(graph, str(temp_file))
+
+    graph_from_file = read_edge_list_graph(str(temp_file))
+    # The header keeps the isolated vertices 3 and 5
+    assert graph_from_file.V == 6
+    assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_read_edge_list_graph_without_header(tmp_path):
+    temp_file = tmp_path / "plain.edges"
+    temp_file.write_text("% weighted\n0 1 0.5\n1 0 0.5\n\n2 1 1.0\n")
+
+    graph_from_file = read_edge_list_graph(str(temp_file))
+    assert graph_from_file.V == 3
+    assert set(graph_from_file.edges()) == {(0, 1), (1, 2)}
+
+    graph_from_file = read_edge_list_graph(str(temp_file), num_vertices=5)
+    assert graph_from_file.V == 5
+
+
+def test_read_invalid_edge_list_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "invalid.edges"
+
+    temp_file.write_text("0 1\n3 3\n")
+    with pytest.raises(ValueError, match=r"Self-loops are not allowed: \(3, 3\)"):
+        read_edge_list_graph(str(temp_file))
+
+    temp_file.write_text("0 4\n")
+    with pytest.raises(ValueError, match="Invalid vertex number: 4"):
+        read_edge_list_graph(str(temp_file), num_vertices=3)
+
+    temp_file.write_text("# nothing\n")
+    with pytest.raises(ValueError, match="Input file is empty"):
+        read_edge_list_graph(str(temp_file))
@@ -1,7 +1,9 @@
 import pytest
 from algo.generation.complete import generate_complete_graph
+from algo.generation.streaming import stream_complete_graph, stream_uniform_random_graph
+from algo.structures.csr import CSRGraph
 from algo.structures.graph import Graph
-from algo.serialization.graph import write_graph_to_file, read_graph_from_file
+from algo.serialization.graph import write_graph_to_file, read_graph_from_file, write_edge_stream_to_file
 
 def test_write_and_read_graph(tmp_path):
     # Create a sample graph
@@ -119,3 +121,124 @@ def test_write_and_read_large_graph(tmp_path):
     assert graph.V == graph_from_file.V
     for vertex in graph.vertices():
         assert set(graph.neighbors(vertex)) == set(graph_from_file.neighbors(vertex))
+
+
+def test_write_edge_stream_to_file(tmp_path):
+    graph = generate_complete_graph(9)
+    chunks = stream_complete_graph(9, 2)
+
+    temp_file = tmp_path / "streamed_graph.txt"
+    write_edge_stream_to_file(chunks, 9, 2, str(temp_file), spill_buffer_size=4)
+
+    graph_from_file = read_graph_from_file(str(temp_file))
+
+    assert graph.V == graph_from_file.V
+    for vertex in graph.vertices():
+        assert set(graph.neighbors(vertex)) == set(graph_from_file.neighbors(vertex))
+
+
+def test_write_edge_stream_to_file_random_graph(tmp_path):
+    chunks = list(stream_uniform_random_graph(40, 200, 6))
+    expected_edges = {edge for _, _, edges in chunks for edge in edges}
+
+    temp_file = tmp_path / "streamed_random_graph.txt"
+    write_edge_stream_to_file(iter(chunks), 40, 6, str(temp_file))
+
+    graph_from_file = read_graph_from_file(str(temp_file))
+    assert graph_from_file.V == 40
+    assert set(graph_from_file.edges()) == expected_edges
+
+
+def test_write_edge_stream_to_file_out_of_order_raises_error(tmp_path):
+    temp_file = tmp_path / "bad_stream.txt"
+    with pytest.raises(ValueError, match="Expected a chunk starting at vertex 0, got 2"):
+        write_edge_stream_to_file(iter([(2, 4, [])]), 4, 2, str(temp_file))
+
+
+def test_read_graph_from_file_small_chunks(tmp_path):
+    graph = generate_complete_graph(30)
+
+    temp_file = tmp_path / "chunked_graph.txt"
+    write_graph_to_file(graph, str(temp_file))
+
+    for chunk_size in [1, 7, 64]:
+        graph_from_file = read_graph_from_file(str(temp_file), chunk_size=chunk_size)
+        assert graph_from_file.V == graph.V
+        assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_read_graph_from_file_without_trailing_newline(tmp_path):
+    temp_file = tmp_path / "no_newline.txt"
+    temp_file.write_text("1 2\n0\n0\n\n")
+    graph_from_file = read_graph_from_file(str(temp_file), chunk_size=3)
+    assert graph_from_file.V == 4
+    assert set(graph_from_file.edges()) == {(0, 1), (0, 2)}
+
+    temp_file.write_text("1\n0")
+    graph_from_file = read_graph_from_file(str(temp_file))
+    assert graph_from_file.V == 2
+    assert graph_from_file.edges() == [(0, 1)]
+
+
+def test_read_empty_file_raises_error(tmp_path):
+    temp_file = tmp_path / "empty.txt"
+    temp_file.write_text("")
+    with pytest.raises(ValueError, match="Input file is empty"):
+        read_graph_from_file(str(temp_file))
+
+
+def test_read_invalid_vertex_raises_error(tmp_path):
+    temp_file = tmp_path / "invalid_vertex.txt"
+    temp_file.write_text("1 5\n0\n")
+    with pytest.raises(ValueError, match="Invalid vertex number: 5"):
+        read_graph_from_file(str(temp_file))
+
+    temp_file.write_text("1 -1\n0\n")
+    with pytest.raises(ValueError, match="Invalid vertex number: -1"):
+        read_graph_from_file(str(temp_file))
+
+
+def test_read_graph_from_file_parallel(tmp_path):
+    graph = generate_complete_graph(40)
+    graph.V += 3
+    graph.adj_list += [None, None, None]
+
+    # With an index the byte ranges come from its line offsets, without one the lines are counted first
+    for index in [True, False]:
+        temp_file = tmp_path / f"parallel_graph_{index}.txt"
+        write_graph_to_file(graph, str(temp_file), index=index)
+
+        for workers in [2, 3, 8]:
+            graph_from_file = read_graph_from_file(str(temp_file), chunk_size=16, workers=workers)
+            assert graph_from_file.V == graph.V
+            assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_read_graph_from_file_parallel_maps_lines_to_vertices(tmp_path):
+    temp_file = tmp_path / "line_mapping.txt"
+    temp_file.write_text("\n\n3\n2 4\n3\n\n7\n6")
+
+    for workers in [1, 2, 4, 16]:
+        graph_from_file = read_graph_from_file(str(temp_file), workers=workers)
+        assert graph_from_file.V == 8
+        assert set(graph_from_file.edges()) == {(2, 3), (3, 4), (6, 7)}
+
+
+def test_read_graph_from_file_parallel_self_loop_raises_error(tmp_path):
+    temp_file = tmp_path / "parallel_self_loop.txt"
+    temp_file.write_text("1\n0\n" * 10 + "20\n")
+    with pytest.raises(ValueError, match=r"Self-loops are not allowed: \(20, 20\)"):
+        read_graph_from_file(str(temp_file), workers=4)
+
+
+def test_read_graph_from_file_as_csr(tmp_path):
+    graph = generate_complete_graph(12)
+
+    temp_file = tmp_path / "csr_graph.txt"
+    write_graph_to_file(graph, str(temp_file))
+
+    for workers in [1, 3]:
+        csr = read_graph_from_file(str(temp_file), workers=workers, as_csr=True)
+        assert isinstance(csr, CSRGraph)
+        assert set(csr.edges()) == set(graph.edges())
+        assert all(csr.degree(v) == 11 for v in csr.vertices())
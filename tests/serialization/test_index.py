@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.generation.streaming import stream_uniform_random_graph
+from algo.serialization.graph import read_graph_from_file, write_edge_stream_to_file, write_graph_to_file
+from algo.serialization.index import build_graph_index, index_path, load_graph_index, read_graph_index
+from algo.structures.graph import Graph
+
+
+def test_write_graph_writes_index(tmp_path):
+    graph = Graph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 0)
+
+    temp_file = str(tmp_path / "test_graph.txt")
+    write_graph_to_file(graph, temp_file)
+
+    with read_graph_index(temp_file) as index:
+        assert index.V == 5
+        assert index.E == 4
+        assert list(index.degrees) == [graph.degree(v) for v in graph.vertices()]
+        assert index.average_degree() == 8 / 5
+        for vertex in graph.vertices():
+            assert sorted(index.neighbors(vertex)) == sorted(graph.neighbors(vertex))
+
+
+def test_streamed_graph_writes_index(tmp_path):
+    temp_file = str(tmp_path / "streamed_graph.txt")
+    write_edge_stream_to_file(stream_uniform_random_graph(100, 400, 16, seed=3), 100, 16, temp_file)
+
+    graph = read_graph_from_file(temp_file)
+    with read_graph_index(temp_file) as index:
+        assert index.V == graph.V
+        assert index.E == len(graph.edges()) == 400
+        assert sorted(index.neighbors(57)) == sorted(graph.neighbors(57))
+
+
+def test_compressed_graph_has_no_index(tmp_path):
+    temp_file = str(tmp_path / "test_graph.txt.gz")
+    write_graph_to_file(generate_complete_graph(5), temp_file)
+    assert not os.path.exists(index_path(temp_file))
+    assert load_graph_index(temp_file) is None
+
+
+def test_stale_index_is_ignored(tmp_path):
+    temp_file = tmp_path / "test_graph.txt"
+    write_graph_to_file(generate_complete_graph(5), str(temp_file))
+    temp_file.write_text("1\n0\n")
+
+    with pytest.raises(ValueError, match="out of date"):
+        read_graph_index(str(temp_file))
+    assert load_graph_index(str(temp_file)) is None
+
+
+def test_build_graph_index(tmp_path):
+    temp_file = tmp_path / "test_graph.txt"
+    temp_file.write_text("1 2\n0\n0\n\n")
+
+    with build_graph_index(str(temp_file)) as index:
+        assert index.V == 4
+        assert index.E == 2
+        assert list(index.degrees) == [2, 1, 1, 0]
+        assert index.neighbors(0) == [1, 2]
+        assert index.neighbors(3) == []
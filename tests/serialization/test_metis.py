@@ -0,0 +1,55 @@
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.serialization.files import read_graph, write_graph
+from algo.serialization.metis import read_metis_graph, write_metis_graph
+from algo.structures.graph import Graph
+
+
+def test_write_and_read_metis_graph(tmp_path):
+    graph = Graph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 0)
+
+    temp_file = tmp_path / "test_graph.graph"
+    write_metis_graph(graph, str(temp_file))
+
+    assert temp_file.read_text().splitlines() == ["5 4", "2 3 4", "1 3", "1 2", "1", ""]
+
+    graph_from_file = read_metis_graph(str(temp_file))
+    assert graph_from_file.V == 5
+    assert set(graph_from_file.edges()) == set(graph.edges())
+
+
+def test_read_weighted_metis_graph(tmp_path):
+    temp_file = tmp_path / "weighted.graph"
+    # fmt 011: one vertex weight per line, then neighbor/edge weight pairs
+    temp_file.write_text("% comment\n3 2 011\n5 2 7\n6 1 7 3 9\n4 2 9\n")
+
+    graph_from_file = read_metis_graph(str(temp_file))
+    assert graph_from_file.V == 3
+    assert set(graph_from_file.edges()) == {(0, 1), (1, 2)}
+
+
+def test_read_invalid_metis_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "invalid.graph"
+
+    temp_file.write_text("3 1\n2\n1\n")
+    with pytest.raises(ValueError, match="Expected 3 vertex lines, found 2"):
+        read_metis_graph(str(temp_file))
+
+    temp_file.write_text("2 1\n2 3\n1\n")
+    with pytest.raises(ValueError, match="Invalid vertex number: 3"):
+        read_metis_graph(str(temp_file))
+
+
+def test_formats_by_extension(tmp_path):
+    graph = generate_complete_graph(7)
+    for extension in [".col", ".edges", ".el", ".graph", ".metis"]:
+        filename = str(tmp_path / f"complete{extension}")
+        write_graph(graph, filename)
+        graph_from_file = read_graph(filename)
+        assert graph_from_file.V == 7
+        assert set(graph_from_file.edges()) == set(graph.edges())
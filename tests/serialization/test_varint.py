@@ -0,0 +1,54 @@
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.serialization.files import read_graph, write_graph
+from algo.serialization.graph import write_graph_to_file
+from algo.serialization.varint import read_varint_graph, write_varint_graph
+from algo.structures.graph import Graph
+from algo.structures.varint import VarintGraph
+
+
+def test_write_and_read_varint_graph(tmp_path):
+    graph = Graph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 0)
+
+    temp_file = tmp_path / "test_graph.vgr"
+    write_varint_graph(graph, str(temp_file))
+
+    graph_from_file = read_varint_graph(str(temp_file))
+    assert graph_from_file.V == 5
+    assert graph_from_file.E == 4
+    for vertex in graph.vertices():
+        assert sorted(graph.neighbors(vertex)) == list(graph_from_file.neighbors(vertex))
+    graph_from_file.close()
+
+
+def test_varint_graph_is_smaller_than_text(tmp_path):
+    graph = generate_complete_graph(200)
+
+    text_file = tmp_path / "complete.txt"
+    varint_file = tmp_path / "complete.vgr"
+    write_graph_to_file(graph, str(text_file))
+    write_graph(graph, str(varint_file))
+
+    assert varint_file.stat().st_size * 3 < text_file.stat().st_size
+
+    graph_from_file = read_graph(str(varint_file))
+    assert isinstance(graph_from_file, VarintGraph)
+    assert len(graph_from_file.edges()) == 200 * 199 // 2
+    graph_from_file.close()
+
+
+def test_read_invalid_varint_graph_raises_error(tmp_path):
+    temp_file = tmp_path / "invalid.vgr"
+    temp_file.write_bytes(b"not a graph at all, just text\n")
+    with pytest.raises(ValueError, match="not a varint graph file"):
+        read_varint_graph(str(temp_file))
+
+    write_varint_graph(generate_complete_graph(4), str(temp_file))
+    temp_file.write_bytes(temp_file.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        read_varint_graph(str(temp_file))
@@ -0,0 +1,170 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from algo.generation.complete import generate_complete_graph
+from algo.serialization.graph import write_graph_to_file
+from algo.service import ColoringService, GraphNotFoundError, make_server
+
+
+@pytest.fixture
+def server():
+    service = ColoringService(workers=2)
+    server = make_server(service, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def request(url, method="GET", body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_store_delta_and_color(server):
+    status, body = request(f"{server}/graphs/square", "PUT", {"vertices": 4, "edges": [[0, 1], [1, 2], [2, 3], [3, 0]]})
+    assert status == 201
+    assert body["edges"] == 4
+
+    status, body = request(f"{server}/graphs/square/color", "POST", {"ordering": "smallest_last",
+                                                                      "include_coloring": True})
+    assert status == 200
+    assert body["colors_used"] == 2
+    assert body["version"] == 0
+    assert len(body["coloring"]) == 4
+    assert set(body["timings"]) == {"snapshot", "queue", "ordering", "coloring", "total"}
+    assert body["request_time"] >= body["timings"]["total"]
+
+    status, body = request(f"{server}/graphs/square/edges", "POST", {"add": [[0, 2]], "remove": [[3, 0]]})
+    assert status == 200
+    assert body == {"graph": "square", "added": 1, "removed": 1, "version": 1, "request_time": body["request_time"]}
+
+    status, body = request(f"{server}/graphs/square/color", "POST", {"ordering": "largest_last"})
+    assert body["colors_used"] == 3
+    assert body["version"] == 1
+    assert "coloring" not in body
+
+
+def test_load_graph_from_file_and_concurrent_requests(server, tmp_path):
+    write_graph_to_file(generate_complete_graph(12), str(tmp_path / "complete.txt"))
+    status, _ = request(f"{server}/graphs/complete", "PUT", {"file": str(tmp_path / "complete.txt")})
+    assert status == 201
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda ordering: request(f"{server}/graphs/complete/color", "POST",
+                                                             {"ordering": ordering}),
+                                    ["smallest_last", "incidence", "connected_sequential", "largest_last"]))
+    assert all(status == 200 and body["colors_used"] == 12 for status, body in results)
+
+    metrics = request(f"{server}/metrics")[1]
+    assert metrics["submitted"] + metrics["coalesced"] == 4
+    assert metrics["completed"] == metrics["submitted"]
+    assert metrics["queue_depth"] == 0
+
+    assert request(f"{server}/graphs")[1]["graphs"] == ["complete"]
+    assert request(f"{server}/graphs/complete", "DELETE")[0] == 200
+    assert request(f"{server}/graphs")[1]["graphs"] == []
+
+
+def test_invalid_requests(server):
+    request(f"{server}/graphs/path", "PUT", {"vertices": 3, "edges": [[0, 1], [1, 2]]})
+
+    status, body = request(f"{server}/graphs/missing/color", "POST", {"ordering": "smallest_last"})
+    assert status == 404
+    assert body["error"] == "Graph not found: missing"
+
+    status, body = request(f"{server}/graphs/path/color", "POST", {"ordering": "nope"})
+    assert status == 400
+    assert body["error"] == "Invalid ordering method: nope"
+
+    # A delta with one bad edge is rejected as a whole
+    status, body = request(f"{server}/graphs/path/edges", "POST", {"add": [[0, 2]], "remove": [[0, 2]]})
+    assert status == 400
+    assert body["error"] == "Edge does not exist: (0, 2)"
+    assert request(f"{server}/graphs/path")[1]["version"] == 0
+
+    status, body = request(f"{server}/graphs/path/edges", "POST", {"add": [[0, 5]]})
+    assert status == 400
+    assert body["error"] == "Invalid vertex number: 5"
+
+
+def test_graph_store_snapshot_is_shared_until_a_delta():
+    service = ColoringService(executor=ThreadPoolExecutor(max_workers=1))
+    stored = service.store.put("g", generate_complete_graph(4))
+
+    first, _, first_fingerprint = stored.snapshot()
+    assert stored.snapshot()[0] is first
+    service.store.apply_delta("g", remove=[[0, 1]])
+    second, version, second_fingerprint = stored.snapshot()
+    assert second is not first
+    assert version == 1
+    assert second_fingerprint != first_fingerprint
+    assert len(second.edges()) == 5
+
+    with pytest.raises(GraphNotFoundError):
+        service.store.get("h")
+    with pytest.raises(ValueError, match="Invalid graph name"):
+        service.store.put("../g", generate_complete_graph(2))
+    service.close()
+
+
+def test_invalid_delta_leaves_graph_and_snapshot_untouched():
+    service = ColoringService(executor=ThreadPoolExecutor(max_workers=1))
+    stored = service.store.put("g", generate_complete_graph(4))
+    snapshot = stored.snapshot()[0]
+
+    for remove in ([[0, 1], [1, 0]], [[2, 3], [2, 3]]):
+        with pytest.raises(ValueError, match="Edge removed twice"):
+            service.store.apply_delta("g", remove=remove)
+    assert stored.stats() == {"vertices": 4, "edges": 6, "version": 0}
+    assert stored.snapshot()[0] is snapshot
+    service.close()
+
+
+def test_server_errors(tmp_path):
+    service = ColoringService(executor=ThreadPoolExecutor(max_workers=1))
+
+    # Only a stale socket is replaced
+    regular_file = tmp_path / "service.sock"
+    regular_file.write_text("keep")
+    with pytest.raises(FileExistsError):
+        make_server(service, unix_socket=str(regular_file), quiet=True)
+    assert regular_file.read_text() == "keep"
+
+    # Clients can name files for the server to read, so it is never exposed beyond this machine
+    for host in ["0.0.0.0", "", "192.168.1.10", "example.com"]:
+        with pytest.raises(ValueError, match="loopback"):
+            make_server(service, host=host, port=0, quiet=True)
+
+    server = make_server(service, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    status, body = request(f"{url}/graphs/g", "PUT", {"vertices": -1})
+    assert status == 400
+    assert body["error"] == "Invalid vertex count: -1"
+
+    def fail(*args, **kwargs):
+        raise MemoryError("out of memory")
+
+    service.store.put = fail
+    status, body = request(f"{url}/graphs/g", "PUT", {"vertices": 3})
+    assert status == 500
+    assert body["error"] == "Internal error: MemoryError: out of memory"
+
+    server.shutdown()
+    server.server_close()
+    service.close()
@@ -0,0 +1,54 @@
+import pickle
+
+from algo.coloring.greedy import greedy_coloring
+from algo.generation.complete import generate_complete_graph
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.structures.csr import CSRGraph
+from algo.structures.graph import Graph
+
+
+def test_from_edges():
+    graph = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 3), (1, 4)])
+    assert graph.V == 5
+    assert graph.vertices() == [0, 1, 2, 3, 4]
+    assert list(graph.neighbors(0)) == [1, 2]
+    assert list(graph.neighbors(1)) == [0, 3, 4]
+    assert graph.degree(1) == 3
+    assert graph.degree(4) == 1
+    assert set(graph.edges()) == {(0, 1), (0, 2), (1, 3), (1, 4)}
+
+
+def test_from_graph():
+    graph = Graph(4)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+
+    csr = CSRGraph.from_graph(graph)
+    assert csr.V == 4
+    for vertex in graph.vertices():
+        assert list(csr.neighbors(vertex)) == graph.neighbors(vertex)
+        assert csr.degree(vertex) == graph.degree(vertex)
+    assert csr.edge_exists(1, 2)
+    assert not csr.edge_exists(0, 3)
+
+
+def test_isolated_vertices():
+    graph = CSRGraph.from_edges(3, [])
+    assert [graph.degree(v) for v in graph.vertices()] == [0, 0, 0]
+    assert list(graph.neighbors(2)) == []
+    assert graph.edges() == []
+
+
+def test_ordering_and_coloring_on_csr():
+    graph = CSRGraph.from_graph(generate_complete_graph(6))
+    ordering, _ = smallest_last_vertex_ordering(graph)
+    colors = greedy_coloring(graph, ordering)
+    assert sorted(colors.values()) == [0, 1, 2, 3, 4, 5]
+
+
+def test_csr_graph_pickles_as_arrays():
+    graph = CSRGraph.from_graph(generate_complete_graph(5))
+    copy = pickle.loads(pickle.dumps(graph))
+    assert copy.V == 5
+    assert [list(copy.neighbors(v)) for v in copy.vertices()] == [list(graph.neighbors(v)) for v in graph.vertices()]
@@ -1,3 +1,5 @@
+import pytest
+
 from algo.structures.graph import Graph
 
 def test_init_graph():
@@ -157,3 +159,29 @@ def test_connected_components_multiple_components():
     graph.add_edge(3, 4)
     expected_components = [[0, 1, 2], [3, 4], [5]]
     assert graph.connected_components() == expected_components
+
+def test_add_edges():
+    g = Graph(5)
+    g.add_edges([0, 0, 1, 1], [1, 2, 3, 4])
+
+    assert g.neighbors(0) == [2, 1]
+    assert g.neighbors(1) == [4, 3, 0]
+    assert set(g.edges()) == {(0, 1), (0, 2), (1, 3), (1, 4)}
+
+def test_remove_edge():
+    graph = Graph(4)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+
+    graph.remove_edge(2, 0)
+    assert not graph.edge_exists(0, 2)
+    assert not graph.edge_exists(2, 0)
+    assert sorted(graph.edges()) == [(0, 1), (1, 2)]
+
+    graph.remove_edge(0, 1)
+    assert graph.neighbors(0) == []
+    assert graph.neighbors(1) == [2]
+
+    with pytest.raises(ValueError, match=r"Edge does not exist: \(0, 3\)"):
+        graph.remove_edge(0, 3)
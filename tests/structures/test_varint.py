@@ -0,0 +1,46 @@
+import types
+
+from algo.coloring.greedy import greedy_coloring
+from algo.generation.complete import generate_complete_graph
+from algo.ordering.smallest_last import smallest_last_vertex_ordering
+from algo.structures.graph import Graph
+from algo.structures.varint import VarintGraph, read_varint, write_varint
+
+
+def test_varint_round_trip():
+    for value in [0, 1, 127, 128, 300, 2 ** 31, 2 ** 40 + 5]:
+        out = bytearray()
+        write_varint(value, out)
+        assert read_varint(out, 0) == (value, len(out))
+    out = bytearray()
+    write_varint(127, out)
+    assert len(out) == 1
+
+
+def test_from_graph():
+    graph = Graph(6)
+    graph.add_edge(3, 0)
+    graph.add_edge(3, 1)
+    graph.add_edge(3, 5)
+    graph.add_edge(4, 5)
+    graph.add_edge(4, 5)
+
+    encoded = VarintGraph.from_graph(graph)
+    assert encoded.V == 6
+    assert encoded.E == 4
+    assert isinstance(encoded.neighbors(3), types.GeneratorType)
+    assert list(encoded.neighbors(3)) == [0, 1, 5]
+    assert list(encoded.neighbors(5)) == [3, 4]
+    assert list(encoded.neighbors(2)) == []
+    assert encoded.degree(3) == 3
+    assert encoded.degree(2) == 0
+    assert encoded.edge_exists(4, 5)
+    assert not encoded.edge_exists(0, 1)
+    assert set(encoded.edges()) == {(0, 3), (1, 3), (3, 5), (4, 5)}
+
+
+def test_ordering_and_coloring_on_varint_graph():
+    encoded = VarintGraph.from_graph(generate_complete_graph(7))
+    ordering, _ = smallest_last_vertex_ordering(encoded)
+    colors = greedy_coloring(encoded, ordering)
+    assert sorted(colors.values()) == list(range(7))
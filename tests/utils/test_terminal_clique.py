@@ -1,4 +1,9 @@
-from algo.structures.graph import Graph, terminal_clique_size
+import random
+
+from algo.generation.complete import generate_complete_graph
+from algo.generation.uniform_random import generate_uniform_random_graph
+from algo.structures.graph import (Graph, clique_bounds, degeneracy, greedy_clique, maximum_clique,
+                                   terminal_clique_size)
 
 def test_terminal_clique_size():
     g = Graph(6)
@@ -37,3 +42,50 @@ def test_terminal_clique_size():
 
     size = terminal_clique_size(g)
     assert size == 3
+
+
+def test_maximum_clique_matches_terminal_clique_size():
+    for seed in range(5):
+        random.seed(seed)
+        g = generate_uniform_random_graph(25, 120)
+
+        clique, complete = maximum_clique(g)
+        assert complete
+        assert len(clique) == terminal_clique_size(g)
+        assert all(g.edge_exists(u, v) for u in clique for v in clique if u != v)
+
+        lower, upper = clique_bounds(g)
+        assert lower <= len(clique) <= upper
+
+
+def test_degeneracy_and_greedy_clique():
+    g = generate_complete_graph(6)
+    assert degeneracy(g) == 5
+    assert greedy_clique(g) == set(range(6))
+    assert clique_bounds(g) == (6, 6)
+
+    g = Graph(7)
+    for u in range(7):
+        g.add_edge(u, (u + 1) % 7)
+    assert degeneracy(g) == 2
+    assert clique_bounds(g) == (2, 3)
+
+
+def test_maximum_clique_timeout_returns_best_found():
+    random.seed(0)
+    g = generate_uniform_random_graph(150, 6000)
+
+    clique, complete = maximum_clique(g, timeout=0)
+    assert not complete
+    # Even a search cut off before it read the graph returns a clique
+    assert clique
+    assert all(v in g.neighbors(u) for u in clique for v in clique if u != v)
+
+    clique, complete = maximum_clique(g, timeout=10)
+    assert complete
+    assert len(clique) >= len(greedy_clique(g))
+
+
+def test_greedy_clique_on_a_large_complete_graph():
+    # Degrees are taken once, so this stays quadratic rather than cubic
+    assert greedy_clique(generate_complete_graph(300), seeds=4) == set(range(300))